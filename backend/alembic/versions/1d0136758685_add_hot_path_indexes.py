@@ -0,0 +1,48 @@
+"""Add indexes for hot filters and orderings
+
+Revision ID: 1d0136758685
+Revises: ba6ed6642a27
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d0136758685'
+down_revision: Union[str, Sequence[str], None] = 'ba6ed6642a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create composite and partial indexes used by repository queries."""
+    op.create_index('ix_projects_status_createdAt', 'projects', ['status', 'createdAt'], unique=False)
+    op.create_index('ix_projects_createdAt', 'projects', ['createdAt'], unique=False)
+    op.create_index(
+        'ix_projects_open_estimatedEndDate', 'projects', ['estimatedEndDate'], unique=False,
+        postgresql_where=sa.text("status IN ('ACTIVE', 'HOLD')"),
+    )
+    op.create_index(op.f('ix_tasks_project_id'), 'tasks', ['project_id'], unique=False)
+    op.create_index(op.f('ix_tasks_assigned_to_id'), 'tasks', ['assigned_to_id'], unique=False)
+    op.create_index(op.f('ix_documents_project_id'), 'documents', ['project_id'], unique=False)
+    op.create_index(
+        'ix_notifications_unread_user_id_created_at', 'notifications', ['user_id', 'created_at'], unique=False,
+        postgresql_where=sa.text("is_read = false"),
+    )
+    op.create_index(op.f('ix_audit_logs_timestamp'), 'audit_logs', ['timestamp'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop hot path indexes."""
+    op.drop_index(op.f('ix_audit_logs_timestamp'), table_name='audit_logs')
+    op.drop_index('ix_notifications_unread_user_id_created_at', table_name='notifications')
+    op.drop_index(op.f('ix_documents_project_id'), table_name='documents')
+    op.drop_index(op.f('ix_tasks_assigned_to_id'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_project_id'), table_name='tasks')
+    op.drop_index('ix_projects_open_estimatedEndDate', table_name='projects')
+    op.drop_index('ix_projects_createdAt', table_name='projects')
+    op.drop_index('ix_projects_status_createdAt', table_name='projects')
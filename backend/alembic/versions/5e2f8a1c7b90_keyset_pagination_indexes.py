@@ -0,0 +1,38 @@
+"""Widen listing indexes with id for keyset pagination
+
+Revision ID: 5e2f8a1c7b90
+Revises: 1d0136758685
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2f8a1c7b90'
+down_revision: Union[str, Sequence[str], None] = '1d0136758685'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace ordering indexes with (column, id) composites used by cursor seeks."""
+    op.create_index('ix_projects_createdAt_id', 'projects', ['createdAt', 'id'], unique=False)
+    op.create_index('ix_projects_status_createdAt_id', 'projects', ['status', 'createdAt', 'id'], unique=False)
+    op.create_index('ix_audit_logs_timestamp_id', 'audit_logs', ['timestamp', 'id'], unique=False)
+    op.drop_index('ix_projects_createdAt', table_name='projects')
+    op.drop_index('ix_projects_status_createdAt', table_name='projects')
+    op.drop_index(op.f('ix_audit_logs_timestamp'), table_name='audit_logs')
+
+
+def downgrade() -> None:
+    """Restore single-column ordering indexes."""
+    op.create_index(op.f('ix_audit_logs_timestamp'), 'audit_logs', ['timestamp'], unique=False)
+    op.create_index('ix_projects_status_createdAt', 'projects', ['status', 'createdAt'], unique=False)
+    op.create_index('ix_projects_createdAt', 'projects', ['createdAt'], unique=False)
+    op.drop_index('ix_audit_logs_timestamp_id', table_name='audit_logs')
+    op.drop_index('ix_projects_status_createdAt_id', table_name='projects')
+    op.drop_index('ix_projects_createdAt_id', table_name='projects')
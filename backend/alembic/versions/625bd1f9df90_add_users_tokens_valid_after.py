@@ -0,0 +1,30 @@
+"""Add users.tokens_valid_after for JWT revocation
+
+Revision ID: 625bd1f9df90
+Revises: d92223d91a68, 001_audit_logs
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '625bd1f9df90'
+down_revision: Union[str, Sequence[str], None] = ('d92223d91a68', '001_audit_logs')
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add tokens_valid_after column to users (also merges the two existing heads)."""
+    op.add_column('users', sa.Column('tokens_valid_after', sa.DateTime(), nullable=True))
+    op.create_index(op.f('ix_users_tokens_valid_after'), 'users', ['tokens_valid_after'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop tokens_valid_after column from users."""
+    op.drop_index(op.f('ix_users_tokens_valid_after'), table_name='users')
+    op.drop_column('users', 'tokens_valid_after')
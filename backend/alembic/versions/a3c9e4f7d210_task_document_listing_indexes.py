@@ -0,0 +1,42 @@
+"""Composite indexes for filtered task and document listings
+
+Revision ID: a3c9e4f7d210
+Revises: 5e2f8a1c7b90
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c9e4f7d210'
+down_revision: Union[str, Sequence[str], None] = '5e2f8a1c7b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace single-column project_id indexes with (project_id, ...) composites."""
+    op.create_index('ix_tasks_project_id_createdAt_id', 'tasks', ['project_id', 'createdAt', 'id'], unique=False)
+    op.create_index('ix_tasks_project_id_status', 'tasks', ['project_id', 'status'], unique=False)
+    op.create_index('ix_tasks_project_id_dueDate', 'tasks', ['project_id', 'dueDate'], unique=False)
+    op.create_index('ix_tasks_project_id_assigned_to_id', 'tasks', ['project_id', 'assigned_to_id'], unique=False)
+    op.create_index('ix_documents_project_id_uploadedAt_id', 'documents', ['project_id', 'uploadedAt', 'id'], unique=False)
+    op.create_index('ix_documents_project_id_status', 'documents', ['project_id', 'status'], unique=False)
+    op.drop_index(op.f('ix_tasks_project_id'), table_name='tasks')
+    op.drop_index(op.f('ix_documents_project_id'), table_name='documents')
+
+
+def downgrade() -> None:
+    """Restore single-column project_id indexes."""
+    op.create_index(op.f('ix_documents_project_id'), 'documents', ['project_id'], unique=False)
+    op.create_index(op.f('ix_tasks_project_id'), 'tasks', ['project_id'], unique=False)
+    op.drop_index('ix_documents_project_id_status', table_name='documents')
+    op.drop_index('ix_documents_project_id_uploadedAt_id', table_name='documents')
+    op.drop_index('ix_tasks_project_id_assigned_to_id', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_dueDate', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_status', table_name='tasks')
+    op.drop_index('ix_tasks_project_id_createdAt_id', table_name='tasks')
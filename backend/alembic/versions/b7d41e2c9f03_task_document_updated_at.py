@@ -0,0 +1,38 @@
+"""Track updatedAt on tasks and documents
+
+Revision ID: b7d41e2c9f03
+Revises: a3c9e4f7d210
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41e2c9f03'
+down_revision: Union[str, Sequence[str], None] = 'a3c9e4f7d210'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add updatedAt (backfilled from createdAt/uploadedAt) for conditional GETs."""
+    op.add_column('tasks', sa.Column('updatedAt', sa.DateTime(), nullable=True))
+    op.add_column('documents', sa.Column('updatedAt', sa.DateTime(), nullable=True))
+    op.execute('UPDATE tasks SET "updatedAt" = COALESCE("createdAt", CURRENT_TIMESTAMP)')
+    op.execute('UPDATE documents SET "updatedAt" = "uploadedAt"')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.alter_column('updatedAt', existing_type=sa.DateTime(), nullable=False)
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.alter_column('updatedAt', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Drop updatedAt from tasks and documents."""
+    with op.batch_alter_table('documents') as batch_op:
+        batch_op.drop_column('updatedAt')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('updatedAt')
@@ -0,0 +1,53 @@
+"""Time-ordered (UUIDv7) primary keys; native UUID ids on PostgreSQL
+
+Revision ID: ba6ed6642a27
+Revises: 625bd1f9df90
+Create Date: 2026-10-17 11:00:00.000000
+
+Os novos IDs são gerados pela aplicação (domain/ids.py), então nenhuma linha
+existente precisa ser reescrita: UUIDv4 antigos e UUIDv7 novos convivem na
+mesma coluna. No PostgreSQL, as chaves de `audit_logs` e `notifications`
+(nenhuma FK aponta para elas) passam a ser do tipo `uuid` nativo, reduzindo
+o índice da chave primária de ~37 para 16 bytes por entrada.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ba6ed6642a27'
+down_revision: Union[str, Sequence[str], None] = '625bd1f9df90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+NATIVE_UUID_TABLES = ('audit_logs', 'notifications')
+
+
+def _column_type(table: str) -> str:
+    bind = op.get_bind()
+    return bind.execute(
+        sa.text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_name = :table AND column_name = 'id'"
+        ),
+        {"table": table},
+    ).scalar()
+
+
+def upgrade() -> None:
+    """Convert high-insert tables' ids to native uuid on PostgreSQL."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in NATIVE_UUID_TABLES:
+        if _column_type(table) != 'uuid':
+            op.execute(f'ALTER TABLE {table} ALTER COLUMN id TYPE uuid USING id::uuid')
+
+
+def downgrade() -> None:
+    """Revert audit_logs.id to text on PostgreSQL (notifications.id was created as uuid)."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    if _column_type('audit_logs') == 'uuid':
+        op.execute('ALTER TABLE audit_logs ALTER COLUMN id TYPE varchar USING id::text')
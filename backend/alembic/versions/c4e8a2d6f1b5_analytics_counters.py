@@ -0,0 +1,48 @@
+"""Add analytics_counters maintained with project writes
+
+Revision ID: c4e8a2d6f1b5
+Revises: b7d41e2c9f03
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2d6f1b5'
+down_revision: Union[str, Sequence[str], None] = 'b7d41e2c9f03'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Dimensão do contador -> coluna de projects (GP/LT não atribuído vira "")
+DIMENSIONS = {
+    'status': 'CAST(status AS VARCHAR)',
+    'phase': 'CAST(phase AS VARCHAR)',
+    'pm': "COALESCE(project_manager_id, '')",
+    'tl': "COALESCE(technical_lead_id, '')",
+    'client': 'client',
+}
+
+
+def upgrade() -> None:
+    """Create analytics_counters and backfill it from projects."""
+    op.create_table(
+        'analytics_counters',
+        sa.Column('dimension', sa.String(), nullable=False),
+        sa.Column('value', sa.String(), nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('dimension', 'value'),
+    )
+    for dimension, column in DIMENSIONS.items():
+        op.execute(
+            f"INSERT INTO analytics_counters (dimension, value, count) "
+            f"SELECT '{dimension}', {column}, COUNT(*) FROM projects GROUP BY {column}"
+        )
+
+
+def downgrade() -> None:
+    """Drop analytics_counters."""
+    op.drop_table('analytics_counters')
@@ -0,0 +1,106 @@
+"""Add project_phase_intervals rollup backfilled from audit logs
+
+Revision ID: e5b1c7d3a9f2
+Revises: c4e8a2d6f1b5
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b1c7d3a9f2'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2d6f1b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PHASES = ['INCEPTION', 'DEFINITION', 'BUILT', 'DEPLOY', 'CLOSE']
+
+
+def _datetime(value):
+    # SQLite devolve DATETIME como texto em consultas textuais
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _intervals(advances, created_at):
+    """
+    Mesmo cálculo de `intervals_from_advances` (phase_interval_repository):
+    a fase de saída é a anterior à nova (os logs antigos gravavam old_phase
+    igual a new_phase) e a primeira fase começa na criação do projeto.
+    """
+    chains = {}
+    for project_id, new_phase, at in advances:
+        chain = chains.setdefault(project_id, [])
+        index = PHASES.index(new_phase)
+        old_phase = PHASES[index - 1] if index > 0 else None
+        current = chain[-1] if chain and chain[-1]['exited_at'] is None else None
+        if current is not None and current['phase'] == new_phase:
+            continue
+        if current is not None and current['phase'] != old_phase:
+            chain.pop()
+            current = None
+        if old_phase is not None:
+            if current is None:
+                entered_at = created_at.get(project_id) if not chain and old_phase == PHASES[0] else None
+                current = {'project_id': project_id, 'phase': old_phase, 'entered_at': entered_at}
+                chain.append(current)
+            current['exited_at'] = at
+            current['exited_week'] = at.date() - timedelta(days=at.weekday())
+            current['duration_seconds'] = (at - current['entered_at']).total_seconds() if current['entered_at'] is not None else None
+        chain.append({'project_id': project_id, 'phase': new_phase, 'entered_at': at, 'exited_at': None,
+                      'exited_week': None, 'duration_seconds': None})
+    return [
+        dict(interval, id=str(uuid.uuid4()))
+        for project_id, chain in chains.items() for interval in chain
+        if interval['exited_at'] is not None or project_id in created_at
+    ]
+
+
+def upgrade() -> None:
+    """Create project_phase_intervals and backfill it from PROJECT_PHASE_ADVANCED audit logs."""
+    table = op.create_table(
+        'project_phase_intervals',
+        sa.Column('id', sa.String().with_variant(postgresql.UUID(as_uuid=False), 'postgresql'), nullable=False),
+        sa.Column('project_id', sa.String(), nullable=False),
+        sa.Column('phase', postgresql.ENUM(*PHASES, name='projectphase', create_type=False), nullable=False),
+        sa.Column('entered_at', sa.DateTime(), nullable=True),
+        sa.Column('exited_at', sa.DateTime(), nullable=True),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.Column('exited_week', sa.Date(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_project_phase_intervals_project_exited', 'project_phase_intervals', ['project_id', 'exited_at'])
+    op.create_index('ix_project_phase_intervals_phase_exited', 'project_phase_intervals', ['phase', 'exited_at', 'duration_seconds'])
+    op.create_index('ix_project_phase_intervals_week_phase', 'project_phase_intervals', ['exited_week', 'phase'])
+
+    bind = op.get_bind()
+    created_at = {
+        project_id: _datetime(created) for project_id, created in bind.execute(sa.text('SELECT id, "createdAt" FROM projects'))
+    }
+    logs = bind.execute(sa.text(
+        "SELECT details, timestamp FROM audit_logs WHERE action = 'PROJECT_PHASE_ADVANCED' ORDER BY timestamp, id"
+    )).all()
+    advances = []
+    for details, timestamp in logs:
+        if isinstance(details, str):
+            details = json.loads(details)
+        if details and details.get('project_id') and details.get('new_phase'):
+            advances.append((details['project_id'], details['new_phase'].upper(), _datetime(timestamp)))
+    rows = _intervals(advances, created_at)
+    if rows:
+        op.bulk_insert(table, rows)
+
+
+def downgrade() -> None:
+    """Drop project_phase_intervals."""
+    op.drop_index('ix_project_phase_intervals_week_phase', table_name='project_phase_intervals')
+    op.drop_index('ix_project_phase_intervals_phase_exited', table_name='project_phase_intervals')
+    op.drop_index('ix_project_phase_intervals_project_exited', table_name='project_phase_intervals')
+    op.drop_table('project_phase_intervals')
@@ -0,0 +1,47 @@
+"""Add is_overdue flags to projects and tasks for the overdue job
+
+Revision ID: f6a2d8c4e0b3
+Revises: e5b1c7d3a9f2
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6a2d8c4e0b3'
+down_revision: Union[str, Sequence[str], None] = 'e5b1c7d3a9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add is_overdue columns and indexes; mark what is already overdue."""
+    op.add_column('projects', sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('tasks', sa.Column('is_overdue', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_index('ix_projects_is_overdue_createdAt_id', 'projects', ['is_overdue', 'createdAt', 'id'], unique=False)
+    op.create_index('ix_tasks_is_overdue_assigned_to_id', 'tasks', ['is_overdue', 'assigned_to_id'], unique=False)
+    op.create_index('ix_tasks_open_dueDate', 'tasks', ['dueDate'], unique=False,
+                    postgresql_where=sa.text("status != 'DONE'"))
+    # Itens já em atraso são marcados aqui, sem notificação: a primeira rodada
+    # do job após o deploy só notifica os que atrasarem a partir de agora
+    op.execute(
+        "UPDATE projects SET is_overdue = true "
+        "WHERE \"estimatedEndDate\" < CURRENT_DATE AND status IN ('ACTIVE', 'HOLD')"
+    )
+    op.execute(
+        "UPDATE tasks SET is_overdue = true "
+        "WHERE \"dueDate\" < CURRENT_DATE AND status != 'DONE'"
+    )
+
+
+def downgrade() -> None:
+    """Drop is_overdue columns and indexes."""
+    op.drop_index('ix_tasks_open_dueDate', table_name='tasks')
+    op.drop_index('ix_tasks_is_overdue_assigned_to_id', table_name='tasks')
+    op.drop_index('ix_projects_is_overdue_createdAt_id', table_name='projects')
+    op.drop_column('tasks', 'is_overdue')
+    op.drop_column('projects', 'is_overdue')
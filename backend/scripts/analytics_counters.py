@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Verifica ou reconstrói os contadores do dashboard (tabela analytics_counters).
+
+Os contadores são mantidos a cada escrita em `projects` pelo repositório;
+escritas feitas por fora dele (SQL manual, seeds, restaurações) causam drift.
+`verify` compara os contadores com uma varredura de `projects` e termina com
+código 1 se houver diferença; `rebuild` recalcula tudo em uma transação.
+
+Uso:
+    python scripts/analytics_counters.py verify
+    python scripts/analytics_counters.py rebuild
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from project_management_api.infrastructure.db.database import AsyncSessionLocal, engine
+from project_management_api.infrastructure.repositories.analytics_counter_repository import AnalyticsCounterRepository
+from project_management_api.infrastructure.analytics_cache import analytics_cache
+
+
+def print_drift(drift) -> None:
+    for item in drift:
+        print(f"  {item['dimension']:<8} {item['value'] or '<vazio>':<40} armazenado={item['stored']:<8} esperado={item['expected']}")
+
+
+async def run(args) -> int:
+    async with AsyncSessionLocal() as db:
+        repo = AnalyticsCounterRepository(db)
+        if args.command == "verify":
+            drift = await repo.verify()
+            if not drift:
+                print("✅ Contadores consistentes com a tabela projects")
+                return 0
+            print(f"❌ {len(drift)} contadores divergentes:")
+            print_drift(drift)
+            return 1
+
+        async with db.begin():
+            drift = await repo.rebuild()
+        # Com o backend Redis, os workers deixam de servir os resultados antigos
+        await analytics_cache.invalidate()
+        print(f"✅ Contadores reconstruídos ({len(drift)} corrigidos)")
+        print_drift(drift)
+    return 0
+
+
+async def main(args) -> int:
+    try:
+        return await run(args)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["verify", "rebuild"])
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark do overhead por requisição do middleware de log de acesso.
+
+Compara, sobre um app FastAPI mínimo chamado diretamente via ASGI (sem rede):
+- sem middleware;
+- o middleware anterior (BaseHTTPMiddleware + json.dumps + handler síncrono);
+- o middleware ASGI puro com emissão em fila, registrando 100% das requisições;
+- o middleware ASGI puro com amostragem de 10%.
+
+Os logs vão para /dev/null; o que se mede é o custo no caminho da requisição.
+
+Uso:
+    python scripts/bench_logging_middleware.py --requests 20000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from project_management_api.infrastructure.api import middleware
+from project_management_api.infrastructure.db.instrumentation import begin_request_stats
+
+devnull = open(os.devnull, "w")
+sync_logger = logging.getLogger("bench.sync_access")
+sync_logger.handlers = [logging.StreamHandler(devnull)]
+sync_logger.propagate = False
+sync_logger.setLevel(logging.INFO)
+
+
+class PreviousLoggingMiddleware(BaseHTTPMiddleware):
+    """Implementação anterior, reproduzida para comparação."""
+
+    async def dispatch(self, request, call_next):
+        start_time = time.time()
+        query_stats = begin_request_stats()
+        response = await call_next(request)
+        process_time = (time.time() - start_time) * 1000
+        response.headers["Server-Timing"] = f"{query_stats.server_timing()}, app;dur={process_time:.3f}"
+        sync_logger.info(json.dumps({
+            "url": str(request.url), "method": request.method, "status_code": response.status_code,
+            "process_time_ms": round(process_time), "db_queries": query_stats.count,
+            "db_time_ms": query_stats.total_ms, "db_slowest": [],
+        }))
+        return response
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id, "name": f"Item {item_id}"}
+
+    return app
+
+
+async def run(asgi_app, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/items/1", "raw_path": b"/api/items/1", "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+
+    never = asyncio.Event()
+
+    async def call():
+        received = False
+
+        async def receive():
+            nonlocal received
+            if received:
+                # Cliente conectado até o fim da resposta
+                await never.wait()
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        await asgi_app(dict(scope), receive, send)
+
+    for _ in range(200):  # aquecimento
+        await call()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(args):
+    access_logger, listener = middleware.build_access_logger(stream=devnull)
+    middleware.access_logger = access_logger
+    listener.start()
+
+    variants = {
+        "sem middleware": build_app(),
+        "BaseHTTPMiddleware (anterior)": PreviousLoggingMiddleware(build_app()),
+        "ASGI puro, 100%": middleware.LoggingMiddleware(build_app(), sample_rate=1.0, sample_rates=""),
+        "ASGI puro, 10%": middleware.LoggingMiddleware(build_app(), sample_rate=0.1, sample_rates=""),
+    }
+    results = {}
+    for name, app in variants.items():
+        results[name] = await run(app, args.requests)
+        # Espera o listener esvaziar a fila para não disputar CPU com a próxima variante
+        while not listener.queue.empty():
+            await asyncio.sleep(0.01)
+    listener.stop()
+
+    baseline = results["sem middleware"]
+    for name, per_request in results.items():
+        print(f"{name:<32} {per_request:8.1f} µs/req  (overhead {per_request - baseline:+7.1f} µs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000)
+    asyncio.run(main(parser.parse_args()))
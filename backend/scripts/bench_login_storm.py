@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latência de endpoints não relacionados durante uma rajada de logins.
+
+Dispara N logins concorrentes enquanto consulta /api/health continuamente e
+reporta p50/p99 do health check. Com --inline o bcrypt roda direto no event
+loop (comportamento antigo), para comparação.
+
+Uso:
+    python scripts/bench_login_storm.py --logins 50
+    python scripts/bench_login_storm.py --logins 50 --inline
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+_db_dir = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/bench.db"
+
+from httpx import AsyncClient, ASGITransport
+
+from project_management_api.infrastructure.api.main import app
+from project_management_api.infrastructure.api import security
+from project_management_api.infrastructure.db.database import engine, AsyncSessionLocal
+from project_management_api.domain.models import Base, User, UserRole
+
+EMAIL = "bench@example.com"
+PASSWORD = "bench-password"
+
+
+async def setup_db():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSessionLocal() as db:
+        db.add(User(email=EMAIL, hashed_password=security.get_password_hash(PASSWORD), role=UserRole.MEMBER))
+        await db.commit()
+
+
+async def login(client: AsyncClient):
+    response = await client.post("/api/auth/token", data={"username": EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+
+
+async def poll_health(client: AsyncClient, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/api/health")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main(args):
+    if args.inline:
+        async def inline_verify(plain, hashed):
+            return security.verify_password(plain, hashed)
+        security.verify_password_async = inline_verify
+
+    await setup_db()
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://bench") as client:
+        stop = asyncio.Event()
+        latencies = []
+        poller = asyncio.create_task(poll_health(client, stop, latencies))
+        start = time.perf_counter()
+        await asyncio.gather(*(login(client) for _ in range(args.logins)))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await poller
+
+    mode = "inline" if args.inline else f"executor (concorrência={security.PASSWORD_HASH_CONCURRENCY})"
+    print(f"Modo: {mode}")
+    print(f"{args.logins} logins em {elapsed:.2f}s")
+    print(f"/api/health: n={len(latencies)} p50={statistics.median(latencies):.1f}ms p99={percentile(latencies, 99):.1f}ms")
+    if not args.inline:
+        print(f"Executor: {security.password_hash_stats()}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--inline", action="store_true", help="Executa o bcrypt no event loop (comportamento antigo)")
+    asyncio.run(main(parser.parse_args()))
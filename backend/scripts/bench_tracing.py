@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Benchmark do overhead por requisição do tracing do Sentry, por taxa de amostragem.
+
+Compara, sobre um app FastAPI mínimo chamado diretamente via ASGI (sem rede):
+- Sentry desativado;
+- a configuração anterior (traces e profiles a 100%);
+- o amostrador por rota com taxas de 100%, 10%, 5%, 1% e 0%.
+
+Os eventos são descartados por um transport nulo; o que se mede é o custo no
+caminho da requisição (criação de transações, spans e perfis).
+
+Uso:
+    python scripts/bench_tracing.py --requests 5000
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import sentry_sdk
+from sentry_sdk.transport import Transport
+from fastapi import FastAPI
+
+from project_management_api.infrastructure.tracing import TraceSampler
+
+DSN = "https://public@sentry.invalid/1"
+
+
+class NullTransport(Transport):
+    def capture_envelope(self, envelope):
+        pass
+
+    def capture_event(self, event):
+        pass
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/items/{item_id}")
+    async def read_item(item_id: int):
+        return {"id": item_id, "name": f"Item {item_id}"}
+
+    return app
+
+
+async def run(asgi_app, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/items/1", "raw_path": b"/api/items/1", "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1234), "server": ("bench", 80),
+    }
+
+    never = asyncio.Event()
+
+    async def call():
+        received = False
+
+        async def receive():
+            nonlocal received
+            if received:
+                # Cliente conectado até o fim da resposta
+                await never.wait()
+            received = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            pass
+
+        await asgi_app(dict(scope), receive, send)
+
+    for _ in range(200):  # aquecimento
+        await call()
+    start = time.perf_counter()
+    for _ in range(requests):
+        await call()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(args):
+    variants = {
+        "sem Sentry": None,
+        "anterior (traces/profiles 100%)": {"traces_sample_rate": 1.0, "profiles_sample_rate": 1.0},
+    }
+    for rate in (1.0, 0.1, 0.05, 0.01, 0.0):
+        sampler = TraceSampler(base_rate=rate, route_rates="", config_file=None)
+        variants[f"amostrador, {rate:.0%}"] = {"traces_sampler": sampler, "profiles_sample_rate": 0.1}
+
+    results = {}
+    for name, options in variants.items():
+        if options is None:
+            sentry_sdk.init(dsn=None)
+        else:
+            sentry_sdk.init(dsn=DSN, transport=NullTransport, **options)
+        # O Sentry instrumenta o app na criação; cada variante usa um app novo
+        results[name] = await run(build_app(), args.requests)
+        sentry_sdk.flush()
+
+    baseline = results["sem Sentry"]
+    for name, per_request in results.items():
+        print(f"{name:<34} {per_request:8.1f} µs/req  (overhead {per_request - baseline:+7.1f} µs)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5_000)
+    asyncio.run(main(parser.parse_args()))
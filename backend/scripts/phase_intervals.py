@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Reconstrói o rollup de tempo por fase (tabela project_phase_intervals).
+
+O avanço de fase mantém o rollup; a migração que cria a tabela já faz o
+backfill. Este script recalcula tudo a partir dos logs de auditoria
+PROJECT_PHASE_ADVANCED (ex.: após restaurar um backup ou importar logs).
+
+Uso:
+    python scripts/phase_intervals.py rebuild
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from project_management_api.infrastructure.db.database import AsyncSessionLocal, engine
+from project_management_api.infrastructure.repositories.phase_interval_repository import PhaseIntervalRepository
+from project_management_api.infrastructure.analytics_cache import analytics_cache
+
+
+async def run(args) -> int:
+    async with AsyncSessionLocal() as db:
+        async with db.begin():
+            total = await PhaseIntervalRepository(db).rebuild()
+    # Com o backend Redis, os workers deixam de servir os resultados antigos
+    await analytics_cache.invalidate()
+    print(f"✅ Rollup reconstruído ({total} intervalos de fase)")
+    return 0
+
+
+async def main(args) -> int:
+    try:
+        return await run(args)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["rebuild"])
+    sys.exit(asyncio.run(main(parser.parse_args())))
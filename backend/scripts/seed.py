@@ -24,6 +24,7 @@ from project_management_api.domain.models import (
     UserRole, ProjectPhase, ProjectStatus, TaskStatus, TaskPriority, DocumentStatus
 )
 from project_management_api.infrastructure.api.security import get_password_hash
+from project_management_api.infrastructure.repositories.analytics_counter_repository import AnalyticsCounterRepository
 
 # Configurar Faker para português brasileiro
 fake = Faker('pt_BR')
@@ -466,6 +467,9 @@ async def seed_data():
             # Criar dados em ordem de dependência
             await seeder.create_users(db)
             await seeder.create_projects(db)
+            # Projetos inseridos direto na sessão: recalcula os contadores do dashboard
+            await AnalyticsCounterRepository(db).rebuild()
+            await db.commit()
             await seeder.create_tasks(db)
             await seeder.create_documents(db)
             await seeder.create_notifications(db)
@@ -1,17 +1,19 @@
 import uuid
 from datetime import date, datetime
-from pydantic import BaseModel, computed_field, Field
-from typing import Optional, Any, Generic, TypeVar, List
+from pydantic import BaseModel, ConfigDict, computed_field, create_model, Field
+from typing import Optional, Any, Dict, Generic, TypeVar, List, Type
 from project_management_api.domain.models import ProjectPhase, ProjectStatus, UserRole, TaskStatus, TaskPriority, DocumentStatus
 
 T = TypeVar('T')
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    total: int = Field(..., description="Número total de itens disponíveis na consulta", example=150)
+    total: Optional[int] = Field(..., description="Número total de itens disponíveis na consulta (nulo com include_total=false; aproximado com include_total=estimate)", example=150)
     page: int = Field(..., gt=0, description="Número da página atual (baseado em 1)", example=2)
     size: int = Field(..., gt=0, description="Número de itens por página", example=20)
-    pages: int = Field(..., description="Número total de páginas disponíveis", example=8)
+    pages: Optional[int] = Field(..., description="Número total de páginas disponíveis (nulo quando o total não é calculado)", example=8)
     items: List[T] = Field(..., description="Lista de itens para a página atual")
+    next_cursor: Optional[str] = Field(None, description="Cursor opaco para a próxima página (paginação por cursor)")
+    prev_cursor: Optional[str] = Field(None, description="Cursor opaco para a página anterior (paginação por cursor)")
 
 
 # Schema for representing a user within a project context
@@ -48,6 +50,7 @@ class ProjectBase(BaseModel):
 
 class ProjectRead(ProjectBase):
     id: str = Field(..., description="Identificador único do projeto", example="550e8400-e29b-41d4-a716-446655440003")
+    is_overdue: bool = Field(False, description="Projeto em atraso (término estimado ultrapassado), mantido por job periódico", example=False)
     project_manager: Optional[UserInProject] = Field(None, description="Dados do gerente de projeto")
     technical_lead: Optional[UserInProject] = Field(None, description="Dados do líder técnico")
     
@@ -114,6 +117,7 @@ class TaskRead(TaskBase):
     id: str = Field(..., description="Identificador único da tarefa", example="550e8400-e29b-41d4-a716-446655440008")
     project_id: str = Field(..., description="ID do projeto ao qual a tarefa pertence", example="550e8400-e29b-41d4-a716-446655440003")
     createdAt: datetime = Field(..., description="Data e hora de criação da tarefa", example="2025-01-15T10:30:00Z")
+    is_overdue: bool = Field(False, description="Tarefa em atraso (prazo ultrapassado), mantida por job periódico", example=False)
     assigned_to: Optional[UserInTask] = Field(None, description="Dados do usuário responsável pela tarefa")
     
     class Config:
@@ -162,6 +166,19 @@ class AnalyticsStat(BaseModel):
     count: int = Field(..., description="Quantidade/contagem para a categoria", example=5)
 
 
+class PhaseCycleTime(BaseModel):
+    phase: ProjectPhase = Field(..., description="Fase do workflow", example="definition")
+    count: int = Field(..., description="Quantidade de períodos concluídos na fase", example=12)
+    average_days: float = Field(..., description="Tempo médio na fase, em dias", example=18.5)
+    percentiles_days: Dict[str, float] = Field(..., description="Percentis do tempo na fase, em dias", example={"p50": 14.0, "p75": 21.5, "p90": 30.0, "p95": 41.2})
+
+
+class PhaseThroughput(BaseModel):
+    week: date = Field(..., description="Início da semana (segunda-feira)", example="2025-03-03")
+    phase: ProjectPhase = Field(..., description="Fase concluída no avanço", example="inception")
+    count: int = Field(..., description="Quantidade de avanços de fase na semana", example=4)
+
+
 # Notification schemas
 class NotificationRead(BaseModel):
     id: uuid.UUID = Field(..., description="Identificador único da notificação", example="550e8400-e29b-41d4-a716-446655440011")
@@ -182,4 +199,59 @@ class AuditLogRead(BaseModel):
     timestamp: datetime = Field(..., description="Data e hora da execução da ação", example="2025-01-15T10:30:00Z")
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+
+# Tracing schemas (amostragem de traces do Sentry)
+class TraceSamplingRead(BaseModel):
+    base_rate: float = Field(..., description="Taxa de traces das rotas sem regra específica", example=0.05)
+    route_rates: str = Field(..., description="Taxas por prefixo de caminho", example="/api/health=0,/api/analytics=0.01")
+    profiles_sample_rate: float = Field(..., description="Fração das transações amostradas que são perfiladas", example=0.1)
+    slow_ms: float = Field(..., description="Limite de lentidão que ativa o rastreamento integral da rota", example=1000)
+    boosted_routes: List[str] = Field(..., description="Rotas rastreadas a 100% neste worker após requisições lentas")
+
+
+class TraceSamplingUpdate(BaseModel):
+    base_rate: Optional[float] = Field(None, ge=0, le=1, description="Nova taxa base", example=0.1)
+    route_rates: Optional[str] = Field(None, description="Novas taxas por prefixo", example="/api/health=0,/api/notifications/me=0.01")
+
+
+# Profiling schemas (profiler por requisição sob demanda)
+class ProfileTokenRead(BaseModel):
+    token: str = Field(..., description="Token assinado que ativa o profiling da requisição")
+    header: str = Field(..., description="Cabeçalho em que o token deve ser enviado", example="X-Profile-Token")
+    expires_in: int = Field(..., description="Validade do token em segundos", example=300)
+
+
+class ProfileSummary(BaseModel):
+    id: str = Field(..., description="Identificador do perfil (request id)", example="4f1c2b9e0a7d4c3e8b6a5f4d3c2b1a09")
+    created_at: datetime = Field(..., description="Data e hora do profiling")
+    requested_by: str = Field(..., description="Id do administrador que emitiu o token")
+    method: str = Field(..., example="GET")
+    path: str = Field(..., example="/api/projects/")
+    route: Optional[str] = Field(None, description="Template da rota", example="/api/projects/")
+    status_code: int = Field(..., example=200)
+    wall_ms: float = Field(..., description="Duração total da requisição")
+    sampled_cpu_ms: float = Field(..., description="Tempo de CPU da requisição estimado pelas amostras")
+    off_cpu_ms: float = Field(..., description="Tempo aguardando banco, I/O ou outras tarefas do event loop")
+    db_wait_ms: Optional[float] = Field(None, description="Tempo total dos statements SQL")
+    db_queries: Optional[int] = Field(None, description="Quantidade de statements SQL")
+    cpu_by_phase_ms: Dict[str, float] = Field(..., description="CPU por fase: auth, validation, db, serialization, endpoint, framework")
+    samples: int = Field(..., description="Amostras coletadas")
+    interval_ms: float = Field(..., description="Intervalo de amostragem")
+
+# Schemas parciais para respostas com `fields=`/`include=`: mesmos campos, todos opcionais;
+# apenas os campos pedidos aparecem na resposta
+def _partial_schema(schema: Type[BaseModel], name: str) -> Type[BaseModel]:
+    fields = {
+        field_name: (Optional[field.annotation], Field(None, description=field.description))
+        for field_name, field in schema.model_fields.items()
+    }
+    return create_model(name, __config__=ConfigDict(from_attributes=True), **fields)
+
+
+ProjectFields = _partial_schema(ProjectRead, "ProjectFields")
+TaskFields = _partial_schema(TaskRead, "TaskFields")
+DocumentFields = _partial_schema(DocumentRead, "DocumentFields")
+AuditLogFields = _partial_schema(AuditLogRead, "AuditLogFields")
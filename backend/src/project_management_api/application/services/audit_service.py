@@ -21,6 +21,6 @@ async def create_audit_log(
     """
     user_id = user.id if user else None
     log_entry = AuditLog(user_id=user_id, action=action, details=details)
+    # O commit fica a cargo da UnitOfWork da requisição
     db.add(log_entry)
-    await db.commit()
     return log_entry
\ No newline at end of file
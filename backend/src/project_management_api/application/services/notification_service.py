@@ -7,6 +7,5 @@ from ...domain.models import Notification
 
 async def create_notification(db: AsyncSession, user_id: uuid.UUID, message: str, link: Optional[str] = None):
     notification = Notification(user_id=user_id, message=message, link=link)
-    db.add(notification)
-    await db.commit()
+    db.add(notification)  # Persistida no commit da UnitOfWork da requisição
     return notification  # Retorna o objeto para possíveis testes
\ No newline at end of file
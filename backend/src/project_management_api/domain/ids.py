@@ -0,0 +1,46 @@
+import os
+import time
+import uuid
+import threading
+
+_lock = threading.Lock()
+_last_timestamp_ms = 0
+_last_counter = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Gera um UUID versão 7 (RFC 9562): 48 bits de timestamp em milissegundos
+    seguidos de bits aleatórios. IDs gerados em sequência ficam ordenados no
+    tempo, o que mantém as inserções no final do índice B-tree da chave primária.
+
+    Dentro do mesmo milissegundo, os 12 bits de `rand_a` funcionam como contador
+    para preservar a ordem no processo.
+    """
+    global _last_timestamp_ms, _last_counter
+    with _lock:
+        timestamp_ms = time.time_ns() // 1_000_000
+        if timestamp_ms <= _last_timestamp_ms:
+            timestamp_ms = _last_timestamp_ms
+            _last_counter += 1
+            if _last_counter > 0xFFF:
+                # Contador esgotado: avança artificialmente para o próximo milissegundo
+                timestamp_ms += 1
+                _last_counter = 0
+        else:
+            _last_counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        _last_timestamp_ms = timestamp_ms
+        counter = _last_counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & 0x3FFFFFFFFFFFFFFF
+    value = (timestamp_ms & 0xFFFFFFFFFFFF) << 80
+    value |= 0x7 << 76
+    value |= counter << 64
+    value |= 0b10 << 62
+    value |= rand_b
+    return uuid.UUID(int=value)
+
+
+def new_id() -> str:
+    """Identificador padrão das entidades: UUIDv7 em formato texto."""
+    return str(uuid7())
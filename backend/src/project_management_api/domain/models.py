@@ -1,12 +1,18 @@
 import uuid
 import enum
 from datetime import datetime, date
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Date as SQLDate, ForeignKey, Text, Integer, Boolean, JSON
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Date as SQLDate, ForeignKey, Text, Integer, Float, Boolean, JSON, Index, false, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import declarative_base, relationship
 
+from project_management_api.domain.ids import new_id
+
 Base = declarative_base()
 
+# Chave das tabelas de maior volume de inserção (sem chaves estrangeiras apontando
+# para elas): UUID nativo de 16 bytes no PostgreSQL, texto nos demais bancos.
+TimeOrderedId = String().with_variant(UUID(as_uuid=False), "postgresql")
+
 
 class ProjectPhase(str, enum.Enum):
     INCEPTION = "inception"
@@ -26,7 +32,7 @@ class ProjectStatus(str, enum.Enum):
 class Project(Base):
     __tablename__ = "projects"
     
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=new_id)
     name = Column(String, nullable=False)
     client = Column(String, nullable=False)
     orderValue = Column(String)
@@ -42,11 +48,23 @@ class Project(Base):
     # Foreign keys for project manager and technical lead
     project_manager_id = Column(String, ForeignKey("users.id"), nullable=True)
     technical_lead_id = Column(String, ForeignKey("users.id"), nullable=True)
+    # Mantido pelo job de atrasos (overdue_job) quando estimatedEndDate passa com o projeto aberto
+    is_overdue = Column(Boolean, nullable=False, default=False, server_default=false())
     
     # Relationships
     project_manager = relationship("User", foreign_keys=[project_manager_id])
     technical_lead = relationship("User", foreign_keys=[technical_lead_id])
 
+    __table_args__ = (
+        # Listagem paginada (offset ou cursor sobre createdAt, id), com e sem filtro de status
+        Index("ix_projects_status_createdAt_id", "status", "createdAt", "id"),
+        Index("ix_projects_createdAt_id", "createdAt", "id"),
+        # Projetos em atraso: no PostgreSQL, apenas os ativos/em espera são indexados
+        Index("ix_projects_open_estimatedEndDate", "estimatedEndDate", postgresql_where=text("status IN ('ACTIVE', 'HOLD')")),
+        # Listagem paginada dos projetos em atraso
+        Index("ix_projects_is_overdue_createdAt_id", "is_overdue", "createdAt", "id"),
+    )
+
 
 class UserRole(str, enum.Enum):
     ADMIN = "admin"
@@ -60,6 +78,8 @@ class User(Base):
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
     role = Column(SQLEnum(UserRole), nullable=False, default=UserRole.MEMBER)
+    # Tokens emitidos antes deste instante são considerados revogados
+    tokens_valid_after = Column(DateTime, nullable=True, index=True)
 
 
 class TaskStatus(str, enum.Enum):
@@ -84,23 +104,37 @@ class DocumentStatus(str, enum.Enum):
 
 class Task(Base):
     __tablename__ = "tasks"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=new_id)
     title = Column(String, nullable=False)
     description = Column(Text)
     status = Column(SQLEnum(TaskStatus), nullable=False, default=TaskStatus.TODO)
     priority = Column(SQLEnum(TaskPriority), nullable=False, default=TaskPriority.MEDIUM)
     dueDate = Column(SQLDate)
     createdAt = Column(DateTime, default=datetime.utcnow)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     project_id = Column(String, ForeignKey("projects.id"), nullable=False)
-    assigned_to_id = Column(String, ForeignKey("users.id"), nullable=True)
+    assigned_to_id = Column(String, ForeignKey("users.id"), nullable=True, index=True)
+    # Mantido pelo job de atrasos (overdue_job) quando dueDate passa sem a tarefa estar concluída
+    is_overdue = Column(Boolean, nullable=False, default=False, server_default=false())
     
     project = relationship("Project")
     assigned_to = relationship("User")
 
+    __table_args__ = (
+        # Listagem do quadro: paginação por (createdAt, id) e filtros mais comuns dentro do projeto
+        Index("ix_tasks_project_id_createdAt_id", "project_id", "createdAt", "id"),
+        Index("ix_tasks_project_id_status", "project_id", "status"),
+        Index("ix_tasks_project_id_dueDate", "project_id", "dueDate"),
+        Index("ix_tasks_project_id_assigned_to_id", "project_id", "assigned_to_id"),
+        # Detecção de atrasos: no PostgreSQL, apenas as tarefas não concluídas são indexadas
+        Index("ix_tasks_open_dueDate", "dueDate", postgresql_where=text("status != 'DONE'")),
+        Index("ix_tasks_is_overdue_assigned_to_id", "is_overdue", "assigned_to_id"),
+    )
+
 
 class Notification(Base):
     __tablename__ = "notifications"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(TimeOrderedId, primary_key=True, default=new_id)
     user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
     message = Column(Text, nullable=False)
     is_read = Column(Boolean, default=False, nullable=False)
@@ -109,10 +143,15 @@ class Notification(Base):
 
     user = relationship("User")
 
+    __table_args__ = (
+        # Notificações não lidas do usuário, mais recentes primeiro (parcial no PostgreSQL)
+        Index("ix_notifications_unread_user_id_created_at", "user_id", "created_at", postgresql_where=text("is_read = false")),
+    )
+
 
 class Document(Base):
     __tablename__ = "documents"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(String, primary_key=True, default=new_id)
     name = Column(String, nullable=False)
     type = Column(String(100), nullable=True)  # Ex: "BRD", "LLD", "Proposta Técnica"
     file_path = Column(String, nullable=False, unique=True)
@@ -121,15 +160,68 @@ class Document(Base):
     status = Column(SQLEnum(DocumentStatus), nullable=False, default=DocumentStatus.UPLOADED)
     project_id = Column(String, ForeignKey("projects.id"), nullable=False)
     uploadedAt = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updatedAt = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     project = relationship("Project")
 
+    __table_args__ = (
+        # Listagem paginada por (uploadedAt, id) e filtro por status dentro do projeto
+        Index("ix_documents_project_id_uploadedAt_id", "project_id", "uploadedAt", "id"),
+        Index("ix_documents_project_id_status", "project_id", "status"),
+    )
+
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(TimeOrderedId, primary_key=True, default=new_id)
     user_id = Column(String, ForeignKey("users.id"), nullable=True, index=True)
     action = Column(String, nullable=False, index=True)  # Ex: "USER_LOGIN", "PROJECT_CREATED"
     details = Column(JSON)  # Armazena um JSON com detalhes contextuais (compatível com SQLite e PostgreSQL)
     timestamp = Column(DateTime, default=datetime.utcnow, nullable=False)
 
-    user = relationship("User")
\ No newline at end of file
+    user = relationship("User")
+
+    __table_args__ = (
+        # Listagem paginada por cursor sobre (timestamp, id)
+        Index("ix_audit_logs_timestamp_id", "timestamp", "id"),
+    )
+
+class AnalyticsCounter(Base):
+    """
+    Contagem de projetos por dimensão do dashboard (status, fase, GP, LT, cliente).
+
+    Mantida na mesma transação das escritas em `projects`; `value` guarda o nome
+    do enum, o id do usuário ou o cliente, e "" para GP/LT não atribuído.
+    """
+    __tablename__ = "analytics_counters"
+    dimension = Column(String, primary_key=True)
+    value = Column(String, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
+class ProjectPhaseInterval(Base):
+    """
+    Período de um projeto em uma fase do workflow (rollup dos avanços de fase).
+
+    Gravado pelo avanço de fase e reconstruível a partir dos logs de auditoria
+    PROJECT_PHASE_ADVANCED. O intervalo da fase atual fica aberto (`exited_at`
+    nulo); `duration_seconds` e `exited_week` (segunda-feira da saída) são
+    calculados no fechamento para que percentis e vazão leiam só esta tabela.
+    `entered_at` é nulo quando a entrada na fase não é conhecida.
+    """
+    __tablename__ = "project_phase_intervals"
+    id = Column(TimeOrderedId, primary_key=True, default=new_id)
+    # Sem chave estrangeira: o histórico sobrevive à exclusão do projeto, como os logs de auditoria
+    project_id = Column(String, nullable=False)
+    phase = Column(SQLEnum(ProjectPhase), nullable=False)
+    entered_at = Column(DateTime, nullable=True)
+    exited_at = Column(DateTime, nullable=True)
+    duration_seconds = Column(Float, nullable=True)
+    exited_week = Column(SQLDate, nullable=True)
+
+    __table_args__ = (
+        # Intervalo aberto do projeto (avanço de fase)
+        Index("ix_project_phase_intervals_project_exited", "project_id", "exited_at"),
+        # Percentis por fase e vazão semanal
+        Index("ix_project_phase_intervals_phase_exited", "phase", "exited_at", "duration_seconds"),
+        Index("ix_project_phase_intervals_week_phase", "exited_week", "phase"),
+    )
@@ -0,0 +1,223 @@
+# src/project_management_api/infrastructure/analytics_cache.py
+"""
+Cache dos resultados das rotas de analytics.
+
+As entradas são indexadas por endpoint, parâmetros e uma geração global. As
+escritas em `projects` (ProjectRepository) incrementam a geração, o que torna
+todas as entradas anteriores inalcançáveis sem precisar apagá-las; o TTL
+limita o que sobra delas e o tempo de vida de qualquer resultado.
+
+Misses concorrentes para a mesma chave são agrupados (single-flight): só a
+primeira requisição consulta o banco e as demais aguardam o seu resultado.
+O agrupamento vale por processo; entre workers, o backend Redis compartilha
+os resultados e a geração.
+
+Backends:
+- memory (padrão): TTLCache do próprio processo;
+- redis: qualquer cliente com a interface do `redis.asyncio` (get, set com
+  `ex`, incr), compartilhado por todos os workers.
+"""
+import os
+import json
+import math
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from project_management_api.infrastructure.cache import TTLCache
+from project_management_api.infrastructure.db.unit_of_work import after_commit
+
+logger = logging.getLogger(__name__)
+
+# 0 desativa o cache
+ANALYTICS_CACHE_TTL_SECONDS = float(os.getenv("ANALYTICS_CACHE_TTL_SECONDS", "30"))
+ANALYTICS_CACHE_MAX_ENTRIES = int(os.getenv("ANALYTICS_CACHE_MAX_ENTRIES", "256"))
+# memory ou redis
+ANALYTICS_CACHE_BACKEND = os.getenv("ANALYTICS_CACHE_BACKEND", "memory")
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+ANALYTICS_CACHE_PREFIX = os.getenv("ANALYTICS_CACHE_PREFIX", "analytics")
+
+
+class MemoryCacheBackend:
+    """Resultados e geração no próprio processo."""
+
+    def __init__(self, max_entries: int = ANALYTICS_CACHE_MAX_ENTRIES, ttl_seconds: float = ANALYTICS_CACHE_TTL_SECONDS):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self._cache.set(key, value, ttl_seconds=ttl_seconds)
+
+    async def generation(self) -> int:
+        return self._generation
+
+    async def bump(self) -> None:
+        with self._lock:
+            self._generation += 1
+
+    async def clear(self) -> None:
+        with self._lock:
+            self._generation = 0
+        self._cache.clear()
+
+
+class RedisCacheBackend:
+    """
+    Resultados (JSON) e geração em um servidor compatível com Redis.
+
+    `client` é um cliente do `redis.asyncio` ou qualquer objeto com os mesmos
+    métodos `get`, `set(key, value, ex=...)` e `incr`.
+    """
+
+    def __init__(self, client: Any, prefix: str = ANALYTICS_CACHE_PREFIX):
+        self.client = client
+        self.prefix = prefix
+        self._generation_key = f"{prefix}:generation"
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self.client.get(f"{self.prefix}:{key}")
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        await self.client.set(f"{self.prefix}:{key}", json.dumps(value), ex=max(1, math.ceil(ttl_seconds)))
+
+    async def generation(self) -> int:
+        return int(await self.client.get(self._generation_key) or 0)
+
+    async def bump(self) -> None:
+        await self.client.incr(self._generation_key)
+
+    async def clear(self) -> None:
+        # Uma geração nova basta: as entradas antigas expiram pelo TTL
+        await self.bump()
+
+
+def create_backend(name: str = ANALYTICS_CACHE_BACKEND):
+    if name == "memory":
+        return MemoryCacheBackend()
+    if name == "redis":
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as exc:  # pragma: no cover - dependência opcional
+            raise RuntimeError("ANALYTICS_CACHE_BACKEND=redis requer o pacote 'redis'") from exc
+        return RedisCacheBackend(redis_asyncio.from_url(REDIS_URL))
+    raise ValueError(f"ANALYTICS_CACHE_BACKEND inválido: {name!r}")
+
+
+class AnalyticsCache:
+    """Cache com TTL, invalidação por geração e agrupamento de misses concorrentes."""
+
+    def __init__(self, backend: Any = None, ttl_seconds: float = ANALYTICS_CACHE_TTL_SECONDS):
+        self._backend = backend
+        self.ttl_seconds = ttl_seconds
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.errors = 0
+
+    @property
+    def backend(self):
+        # Criado no primeiro uso: importar o módulo não abre conexões
+        if self._backend is None:
+            self._backend = create_backend()
+        return self._backend
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    @staticmethod
+    def _key(endpoint: str, params: Hashable, generation: int) -> str:
+        return f"{generation}:{endpoint}:{params!r}"
+
+    async def get_or_load(self, endpoint: str, params: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Resultado de `loader()` para (endpoint, params), do cache se possível.
+
+        O valor deve ser serializável em JSON (o backend Redis o grava assim).
+        Falhas do backend não derrubam a requisição: a consulta é feita direto.
+        """
+        if not self.enabled:
+            return await loader()
+        try:
+            key = self._key(endpoint, params, await self.backend.generation())
+            cached = await self.backend.get(key)
+        except Exception:
+            self.errors += 1
+            logger.warning("analytics cache indisponível", exc_info=True)
+            return await loader()
+        if cached is not None:
+            self.hits += 1
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # A requisição que fazia a consulta foi cancelada: tenta de novo
+                return await self.get_or_load(endpoint, params, loader)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # evita o aviso de exceção não lida quando ninguém espera
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(value)
+        finally:
+            self._inflight.pop(key, None)
+
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception:
+            self.errors += 1
+            logger.warning("analytics cache indisponível", exc_info=True)
+        return value
+
+    async def invalidate(self, session: Any = None) -> None:
+        """
+        Descarta todos os resultados em cache.
+
+        Com `session`, a invalidação é repetida após o commit da UnitOfWork:
+        uma leitura concorrente entre a escrita e o commit ainda vê os dados
+        antigos e poderia guardá-los na geração nova.
+        """
+        try:
+            await self.backend.bump()
+        except Exception:
+            self.errors += 1
+            logger.warning("analytics cache indisponível", exc_info=True)
+        if session is not None:
+            after_commit(session, "analytics_cache", self.invalidate)
+
+    async def clear(self) -> None:
+        self._inflight.clear()
+        await self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+        }
+
+
+analytics_cache = AnalyticsCache()
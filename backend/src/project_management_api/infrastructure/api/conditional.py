@@ -0,0 +1,84 @@
+# src/project_management_api/infrastructure/api/conditional.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+# Respostas podem ser guardadas pelo navegador, mas sempre revalidadas (ETag) antes do uso
+CACHE_CONTROL = "private, no-cache"
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()[:32]
+
+
+def _as_utc(value: datetime) -> datetime:
+    # As colunas de data/hora guardam UTC sem fuso
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _etag_values(header: str):
+    for value in header.split(","):
+        value = value.strip()
+        # Comparação fraca (RFC 7232): W/"x" e "x" equivalem em GET
+        yield value[2:] if value.startswith("W/") else value
+
+
+class Validators:
+    """
+    Validadores de uma representação (ETag e, opcionalmente, Last-Modified) e
+    avaliação das pré-condições `If-None-Match` / `If-Modified-Since`.
+
+    Recursos individuais têm ETag forte derivado do id e do `updatedAt`.
+    Coleções têm ETag fraco derivado do maior `updatedAt`, da quantidade de
+    linhas e da query string (página, filtros, campos); não têm Last-Modified,
+    já que exclusões não mudam o maior `updatedAt`.
+    """
+
+    def __init__(self, etag: str, last_modified: Optional[datetime] = None):
+        self.etag = etag
+        self.last_modified = _as_utc(last_modified).replace(microsecond=0) if last_modified else None
+
+    @classmethod
+    def for_resource(cls, kind: str, resource_id: Any, updated_at: Optional[datetime]) -> "Validators":
+        return cls(f'"{_digest(kind, resource_id, updated_at.isoformat() if updated_at else "")}"', updated_at)
+
+    @classmethod
+    def for_collection(cls, kind: str, request: Request, latest: Optional[datetime], count: int) -> "Validators":
+        version = latest.isoformat() if latest else ""
+        return cls(f'W/"{_digest(kind, request.url.path, request.url.query, version, count)}"')
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            # If-None-Match tem precedência; If-Modified-Since é ignorado quando presente
+            if if_none_match.strip() == "*":
+                return True
+            current = self.etag[2:] if self.etag.startswith("W/") else self.etag
+            return current in set(_etag_values(if_none_match))
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self.last_modified <= since
+
+    def not_modified(self) -> Response:
+        """Resposta 304 sem corpo: nada é carregado nem serializado."""
+        return Response(status_code=304, headers=self.headers)
+
+    def apply(self, response: Response) -> None:
+        response.headers.update(self.headers)
@@ -1,9 +1,44 @@
 # src/project_management_api/infrastructure/api/dependencies.py
-from fastapi import Query
-from typing import Dict
+from fastapi import Query, Response
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator
 
 def get_pagination_params(
     page: int = Query(1, gt=0, description="Número da página"),
     size: int = Query(20, gt=0, le=100, description="Tamanho da página")
 ) -> Dict[str, int]:
-    return {"page": page, "size": size}
\ No newline at end of file
+    return {"page": page, "size": size}
+
+
+def page_count(total: Optional[int], size: int) -> Optional[int]:
+    """Número de páginas para o total informado (None quando o total não foi calculado)."""
+    if total is None:
+        return None
+    return math.ceil(total / size) if total > 0 else 1
+
+
+def offset_page_cursors(paginator: KeysetPaginator, items: Sequence[Any], *, skip: int, size: int,
+                        total: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Cursores (próximo, anterior) de uma página buscada por OFFSET: permitem
+    que clientes da paginação por página migrem para cursores a partir de
+    qualquer página. Sem total, uma página cheia indica que pode haver mais itens.
+    """
+    has_more = skip + len(items) < total if total is not None else len(items) == size
+    next_cursor = paginator.cursor_for(items[-1]) if items and has_more else None
+    prev_cursor = paginator.cursor_for(items[0], "prev") if items and skip > 0 else None
+    return next_cursor, prev_cursor
+
+
+# Listagens que retornam uma lista simples informam os cursores por cabeçalho
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
+
+
+def set_cursor_headers(response: Response, next_cursor: Optional[str], prev_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if prev_cursor:
+        response.headers[PREV_CURSOR_HEADER] = prev_cursor
@@ -0,0 +1,107 @@
+# src/project_management_api/infrastructure/api/exports.py
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterable, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import StreamingResponse
+
+from project_management_api.infrastructure.api import serialization
+from project_management_api.infrastructure.api.serialization import ModelSerializer
+
+
+class ExportFormat(str, enum.Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def csv_columns(serializer: ModelSerializer) -> List[str]:
+    """Colunas do CSV: campos do schema, com os modelos aninhados achatados (`project_manager.email`)."""
+    columns = []
+    for name in serializer.schema.model_fields:
+        nested = serializer.nested_models.get(name)
+        if nested is not None:
+            columns.extend(f"{name}.{field}" for field in nested.model_fields)
+        else:
+            columns.append(name)
+    return columns
+
+
+def _flatten(serializer: ModelSerializer, row: Dict[str, Any]) -> Dict[str, Any]:
+    flat = {}
+    for name, value in row.items():
+        if name in serializer.nested_models:
+            flat.update({f"{name}.{key}": nested for key, nested in (value or {}).items()})
+        else:
+            flat[name] = value
+    return flat
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+def _ndjson_chunk(serializer: ModelSerializer, items: Iterable[Any]) -> bytes:
+    dumps = serialization.dumps
+    return b"".join(dumps(row) + b"\n" for row in serializer.to_list(items))
+
+
+def _csv_chunk(serializer: ModelSerializer, columns: List[str], items: Iterable[Any], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(columns)
+    for row in serializer.to_list(items):
+        flat = _flatten(serializer, row)
+        writer.writerow([_csv_value(flat.get(column)) for column in columns])
+    return buffer.getvalue().encode("utf-8")
+
+
+async def _chunks(db: AsyncSession, batches: AsyncIterator[List[Any]], serializer: ModelSerializer,
+                  export_format: ExportFormat) -> AsyncIterator[bytes]:
+    columns = csv_columns(serializer) if export_format == ExportFormat.CSV else []
+    try:
+        if export_format == ExportFormat.CSV:
+            # Cabeçalho enviado mesmo quando a exportação não tem linhas
+            yield _csv_chunk(serializer, columns, (), header=True)
+        async for batch in batches:
+            if export_format == ExportFormat.CSV:
+                yield _csv_chunk(serializer, columns, batch, header=False)
+            else:
+                yield _ndjson_chunk(serializer, batch)
+    finally:
+        # O corpo é gerado depois que o endpoint retorna; a sessão é fechada aqui
+        # para não depender de quando a dependência `get_db` é finalizada
+        await db.close()
+
+
+def export_response(db: AsyncSession, batches: AsyncIterator[List[Any]], serializer: ModelSerializer,
+                    export_format: ExportFormat, filename: str) -> StreamingResponse:
+    """
+    Resposta em streaming com uma linha por entidade (NDJSON ou CSV).
+
+    Cada lote lido do cursor do servidor vira um chunk da resposta, então a
+    memória usada não cresce com o tamanho da exportação.
+    """
+    return StreamingResponse(
+        _chunks(db, batches, serializer, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
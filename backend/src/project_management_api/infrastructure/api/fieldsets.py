@@ -0,0 +1,95 @@
+# src/project_management_api/infrastructure/api/fieldsets.py
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
+
+class FieldSelection(NamedTuple):
+    fields: Tuple[str, ...]
+    include: Tuple[str, ...]
+
+
+def _split(value: Optional[str]) -> List[str]:
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+class Fieldset:
+    """
+    Seleção esparsa de campos (`fields=`) e de relacionamentos (`include=`) de
+    um recurso de listagem.
+
+    A seleção vira opções do SQLAlchemy: `load_only` para as colunas pedidas e
+    `selectinload` apenas para os relacionamentos incluídos (os demais ficam com
+    `raiseload`). Sem nenhum dos parâmetros, o recurso é carregado e serializado
+    por completo, como antes.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        partial_schema: Type[BaseModel],
+        relationships: Dict[str, Any],
+        nested_schemas: Dict[str, Type[BaseModel]],
+        always_load: Sequence[str] = (),
+    ):
+        self.model = model
+        self.partial_schema = partial_schema
+        self.relationships = relationships
+        self.nested_schemas = nested_schemas
+        # Colunas necessárias fora da resposta (ex.: chaves da paginação por cursor)
+        self.always_load = tuple(always_load)
+        self.columns = tuple(name for name in partial_schema.model_fields if name not in relationships)
+        self.query = self._build_query_dependency()
+
+    def _build_query_dependency(self):
+        fields_description = "Campos a retornar, separados por vírgula: " + ", ".join(self.columns)
+        include_description = "Relacionamentos a incluir, separados por vírgula: " + ", ".join(self.relationships)
+
+        def dependency(
+            fields: Optional[str] = Query(None, description=fields_description),
+            include: Optional[str] = Query(None, description=include_description),
+        ) -> Optional[FieldSelection]:
+            return self.parse(fields, include)
+
+        return dependency
+
+    def parse(self, fields: Optional[str], include: Optional[str]) -> Optional[FieldSelection]:
+        if fields is None and include is None:
+            return None
+        requested = _split(fields)
+        included = _split(include) + [name for name in requested if name in self.relationships]
+        requested = [name for name in requested if name not in self.relationships]
+
+        unknown = [name for name in requested if name not in self.columns]
+        unknown += [name for name in included if name not in self.relationships]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Campos desconhecidos: {', '.join(unknown)}")
+        # Só `include=`: todas as colunas mais os relacionamentos pedidos
+        if fields is None:
+            requested = list(self.columns)
+        if "id" not in requested:
+            requested.insert(0, "id")
+        return FieldSelection(tuple(dict.fromkeys(requested)), tuple(dict.fromkeys(included)))
+
+    def load_options(self, selection: FieldSelection, extra_columns: Sequence[str] = ()) -> List[Any]:
+        """`extra_columns`: colunas carregadas além das pedidas (ex.: chaves da ordenação escolhida)."""
+        mapper = inspect(self.model)
+        columns = set(selection.fields) | set(self.always_load) | set(extra_columns)
+        for name in selection.include:
+            # A chave estrangeira é necessária para carregar o relacionamento
+            for column in self.relationships[name].property.local_columns:
+                columns.add(mapper.get_property_by_column(column).key)
+        options = [load_only(*[getattr(self.model, name) for name in sorted(columns)])]
+        for name, relationship in self.relationships.items():
+            options.append(selectinload(relationship) if name in selection.include else raiseload(relationship))
+        return options
+
+    def serialize(self, item: Any, selection: FieldSelection) -> BaseModel:
+        values = {name: getattr(item, name) for name in selection.fields}
+        for name in selection.include:
+            related = getattr(item, name)
+            values[name] = self.nested_schemas[name].model_validate(related) if related is not None else None
+        return self.partial_schema(**values)
@@ -1,19 +1,37 @@
 # backend/src/project_management_api/infrastructure/api/main.py
-from fastapi import FastAPI
+import hmac
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-import sentry_sdk
 import os
-from .routes import projects, users, auth, tasks, documents, analytics, notifications, audit_logs
-from .middleware import LoggingMiddleware
+from . import security
+from .routes import projects, users, auth, tasks, documents, analytics, notifications, audit_logs, tracing, profiling
+from .middleware import LoggingMiddleware, MetricsMiddleware, refresh_pool_metrics
+from ..metrics import METRICS_ENABLED, registry as metrics_registry
+from ..tracing import init_tracing
+from ..db.database import get_pool_stats, CONSISTENCY_TOKEN_HEADER
+from .dependencies import NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER
+from .request_context import REQUEST_ID_HEADER
+from .profiling import PROFILING_ENABLED, PROFILE_ID_HEADER, ProfilingMiddleware
+from ..overdue_job import OVERDUE_JOB_ENABLED, overdue_job
 
-# Inicializar Sentry se o DSN estiver disponível
+# Inicializar Sentry se o DSN estiver disponível (traces amostrados por rota, erros sempre)
 sentry_dsn = os.getenv("SENTRY_DSN")
 if sentry_dsn:
-    sentry_sdk.init(
-        dsn=sentry_dsn,
-        traces_sample_rate=1.0,
-        profiles_sample_rate=1.0,
-    )
+    init_tracing(sentry_dsn)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Consolida as métricas de workers encerrados (reciclagens e deploys anteriores)
+    if METRICS_ENABLED:
+        metrics_registry.compact()
+    # Job periódico de atrasos de projetos e tarefas (um por worker; ver overdue_job)
+    if OVERDUE_JOB_ENABLED:
+        overdue_job.start()
+    yield
+    await overdue_job.stop()
+
 
 app = FastAPI(
     title="Sistema de Gestão de Projetos API",
@@ -21,7 +39,8 @@ app = FastAPI(
     description="API para gerenciar o ciclo de vida de projetos.",
     openapi_url="/api/openapi.json",  # Garante que a documentação fique sob /api
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan,
 )
 
 # Configurar CORS
@@ -31,6 +50,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, PREV_CURSOR_HEADER, CONSISTENCY_TOKEN_HEADER, REQUEST_ID_HEADER, PROFILE_ID_HEADER, "ETag"],
 )
 
 # Include routers
@@ -42,11 +62,34 @@ app.include_router(documents.router)
 app.include_router(analytics.router)
 app.include_router(notifications.router)
 app.include_router(audit_logs.router)
+app.include_router(tracing.router)
+app.include_router(profiling.router)
+
+# Profiling sob demanda: fica dentro do log de acesso para reaproveitar request id e contagem de SQL
+if PROFILING_ENABLED:
+    app.add_middleware(ProfilingMiddleware)
 
 # Adicionar middleware de logging
 app.add_middleware(LoggingMiddleware)
+app.add_middleware(MetricsMiddleware)
+
+# Token opcional exigido pelo scrape de /api/metrics (Authorization: Bearer <token>)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
 
 @app.get("/api/health", tags=["Health"])
 def health_check():
     """Verifica se a API está operacional."""
-    return {"status": "ok"}
\ No newline at end of file
+    return {"status": "ok"}
+
+@app.get("/api/health/db-pool", tags=["Health"])
+def db_pool_stats(current_user=Depends(security.allow_only_admins)):
+    """Estatísticas ao vivo do pool de conexões deste worker (apenas administradores)."""
+    return get_pool_stats()
+
+@app.get("/api/metrics", tags=["Health"], include_in_schema=False)
+def metrics_endpoint(authorization: str = Header(default="")):
+    """Métricas de todos os workers no formato de texto do Prometheus."""
+    if METRICS_TOKEN and not hmac.compare_digest(authorization, f"Bearer {METRICS_TOKEN}"):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    refresh_pool_metrics()
+    return Response(metrics_registry.exposition(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,25 +1,252 @@
 # src/project_management_api/infrastructure/api/middleware.py
+import os
+import sys
 import time
 import json
+import queue
+import atexit
+import random
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+import logging.handlers
+from typing import Dict, List, Optional, Tuple
+
+from project_management_api.infrastructure import metrics
+from project_management_api.infrastructure.tracing import parse_sample_rates, trace_sampler
+from project_management_api.infrastructure.db.database import engine, replica_engines, get_pool_stats
+from project_management_api.infrastructure.db.instrumentation import begin_request_stats, log_repeated_statements
+from project_management_api.infrastructure.api.request_context import REQUEST_ID_HEADER, begin_request_context
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = (time.time() - start_time) * 1000
-
-        log_dict = {
-            "url": str(request.url),
-            "method": request.method,
-            "status_code": response.status_code,
-            "process_time_ms": round(process_time)
-        }
-
-        logger.info(json.dumps(log_dict))
-        return response
\ No newline at end of file
+# Fração das requisições registradas no log de acesso (0 a 1)
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "1.0"))
+# Taxas por rota: "prefixo=taxa" separados por vírgula, comparados com o template da rota
+# (ex.: "/api/health=0,/api/projects/{project_id}/tasks=0.1"); vence o prefixo mais longo
+LOG_SAMPLE_RATES = os.getenv("LOG_SAMPLE_RATES", "")
+# Erros do servidor e requisições mais lentas que este limite são sempre registrados
+LOG_ALWAYS_SLOW_MS = float(os.getenv("LOG_ALWAYS_SLOW_MS", "1000"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+
+class JSONLogFormatter(logging.Formatter):
+    """Serializa registros cuja mensagem é um dict; a formatação roda na thread do listener."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record.msg, dict):
+            return json.dumps(record.msg, default=str)
+        return super().format(record)
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que não formata o registro na thread da requisição.
+
+    O `prepare` padrão chama `format()` antes de enfileirar; aqui o registro
+    (com o dict como mensagem) vai para a fila como está e é formatado pelo
+    handler do listener. Com a fila cheia, o registro é descartado em vez de
+    bloquear o event loop.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def build_access_logger(stream=None) -> Tuple[logging.Logger, logging.handlers.QueueListener]:
+    """Logger de acesso com emissão em background: a requisição só enfileira o registro."""
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(JSONLogFormatter())
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+
+    access_logger = logging.getLogger(f"{__name__}.access")
+    access_logger.setLevel(logging.INFO)
+    access_logger.handlers = [DeferredQueueHandler(log_queue)]
+    access_logger.propagate = False
+    return access_logger, listener
+
+
+access_logger, _listener = build_access_logger()
+_listener.start()
+atexit.register(_listener.stop)
+
+
+class LoggingMiddleware:
+    """
+    Middleware ASGI puro de log de acesso.
+
+    Não cria tasks nem bufferiza a resposta (respostas em streaming passam
+    chunk a chunk); apenas observa as mensagens `http.response.*` para medir
+    status, bytes enviados e duração. Cada registro traz request id, usuário
+    autenticado, rota e tempo de SQL, e é amostrado por rota segundo
+    LOG_SAMPLE_RATES; erros 5xx e requisições lentas são sempre registrados.
+    """
+
+    def __init__(self, app, sample_rate: Optional[float] = None, sample_rates: Optional[str] = None):
+        self.app = app
+        self.sample_rate = LOG_SAMPLE_RATE if sample_rate is None else sample_rate
+        self.sample_rates = parse_sample_rates(LOG_SAMPLE_RATES if sample_rates is None else sample_rates)
+        self._route_rates: Dict[str, float] = {}
+
+    def _rate_for(self, route: str, cacheable: bool) -> float:
+        rate = self._route_rates.get(route)
+        if rate is None:
+            rate = next((r for prefix, r in self.sample_rates if route.startswith(prefix)), self.sample_rate)
+            # Só templates de rota entram no cache; caminhos sem rota (404) são ilimitados
+            if cacheable:
+                self._route_rates[route] = rate
+        return rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        incoming_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                incoming_id = value.decode("latin-1")
+                break
+        context = begin_request_context(incoming_id)
+        # Coleta de SQL da requisição; o objeto é compartilhado com o endpoint pelo contexto
+        query_stats = begin_request_stats()
+        status_code = 500
+        bytes_out = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, bytes_out
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = (time.perf_counter() - start_time) * 1000
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"{query_stats.server_timing()}, app;dur={process_time:.3f}".encode("latin-1")))
+                headers.append((REQUEST_ID_HEADER.lower().encode("latin-1"), context.request_id.encode("latin-1")))
+                message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            process_time = (time.perf_counter() - start_time) * 1000
+            if trace_sampler.enabled:
+                trace_sampler.record(scope, status_code, process_time)
+            self._log(scope, context, query_stats, status_code, bytes_out, process_time)
+
+    def _log(self, scope, context, query_stats, status_code: int, bytes_out: int, process_time: float) -> None:
+        log_repeated_statements(query_stats, scope["method"], scope["path"])
+        template = getattr(scope.get("route"), "path", None)
+        route = template or scope["path"]
+        if status_code < 500 and process_time < LOG_ALWAYS_SLOW_MS:
+            rate = self._rate_for(route, cacheable=template is not None)
+            if rate <= 0 or (rate < 1 and random.random() >= rate):
+                return
+        access_logger.info({
+            "request_id": context.request_id,
+            "method": scope["method"],
+            "path": scope["path"],
+            "route": route,
+            "status_code": status_code,
+            "user_id": context.user_id,
+            "process_time_ms": round(process_time, 3),
+            "bytes_out": bytes_out,
+            "db_queries": query_stats.count,
+            "db_time_ms": query_stats.total_ms,
+            "db_slowest": [
+                {"ms": round(duration * 1000, 3), "statement": statement[:200]}
+                for duration, statement in query_stats.slowest
+            ],
+        })
+
+
+# Intervalo mínimo entre atualizações dos gauges do pool feitas pelo middleware
+METRICS_POOL_REFRESH_SECONDS = float(os.getenv("METRICS_POOL_REFRESH_SECONDS", "1.0"))
+# Rótulo usado para caminhos sem rota (404), para não criar uma série por URL
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+# Totais do pool já somados aos contadores, por (pid, engine, estatística)
+_reported_pool_totals: Dict[Tuple[str, str, str], int] = {}
+
+
+def refresh_pool_metrics() -> None:
+    """
+    Copia as estatísticas do pool deste worker para os gauges/contadores
+    compartilhados. Os contadores recebem só o incremento desde a última
+    atualização.
+    """
+    pid = str(os.getpid())
+    engines = [("primary", engine)] + [(f"replica{index}", replica) for index, replica in enumerate(replica_engines)]
+    for name, target in engines:
+        stats = get_pool_stats(target)
+        for state in ("size", "checked_out", "checked_in", "overflow"):
+            if state in stats:
+                metrics.DB_POOL_CONNECTIONS.set(stats[state], engine=name, state=state, pid=pid)
+        for stat, counter in (("checkouts", metrics.DB_POOL_CHECKOUTS), ("timeouts", metrics.DB_POOL_TIMEOUTS)):
+            if stat in stats:
+                key = (pid, name, stat)
+                reported = _reported_pool_totals.get(key, 0)
+                # Pool recriado (ex.: engine.dispose()) recomeça do zero
+                delta = stats[stat] - reported if stats[stat] >= reported else stats[stat]
+                if delta:
+                    counter.inc(delta, engine=name)
+                    _reported_pool_totals[key] = stats[stat]
+
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI puro que alimenta as métricas HTTP.
+
+    Mede duração, status e bytes de cada requisição pelo template da rota
+    (não pelo caminho, para manter a cardinalidade limitada), mantém o gauge
+    de requisições em andamento e, no máximo a cada
+    METRICS_POOL_REFRESH_SECONDS, atualiza os gauges do pool de conexões.
+    """
+
+    def __init__(self, app, pool_refresh_seconds: Optional[float] = None):
+        self.app = app
+        self.pool_refresh_seconds = METRICS_POOL_REFRESH_SECONDS if pool_refresh_seconds is None else pool_refresh_seconds
+        self._pool_refreshed_at = 0.0
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not metrics.METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+        bytes_out = 0
+
+        async def send_wrapper(message):
+            nonlocal status_code, bytes_out
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                bytes_out += len(message.get("body", b""))
+            await send(message)
+
+        metrics.HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            metrics.HTTP_REQUESTS_IN_FLIGHT.dec()
+            duration = time.perf_counter() - start_time
+            route = getattr(scope.get("route"), "path", None) or UNMATCHED_ROUTE
+            method = scope["method"]
+            metrics.HTTP_REQUEST_DURATION.observe(duration, method=method, route=route, status=str(status_code))
+            metrics.HTTP_RESPONSE_SIZE.observe(bytes_out, method=method, route=route)
+            if time.monotonic() - self._pool_refreshed_at >= self.pool_refresh_seconds:
+                self._pool_refreshed_at = time.monotonic()
+                refresh_pool_metrics()
@@ -0,0 +1,65 @@
+# src/project_management_api/infrastructure/api/principal_cache.py
+import os
+import threading
+from typing import Dict, Optional, Set
+
+from sqlalchemy import event, inspect
+
+from project_management_api.domain.models import User
+from project_management_api.infrastructure.cache import TTLCache
+
+PRINCIPAL_CACHE_TTL_SECONDS = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "60"))
+PRINCIPAL_CACHE_MAX_ENTRIES = int(os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "1024"))
+
+
+class PrincipalCache:
+    """
+    Cache de usuários autenticados indexado pelo token JWT.
+
+    Evita a consulta à tabela `users` a cada requisição protegida. Um índice
+    secundário por `sub` (email) permite invalidar todos os tokens de um
+    usuário quando seu papel ou senha mudam.
+    """
+
+    def __init__(self, max_entries: int = PRINCIPAL_CACHE_MAX_ENTRIES, ttl_seconds: float = PRINCIPAL_CACHE_TTL_SECONDS):
+        self._cache = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._tokens_by_subject: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[User]:
+        return self._cache.get(token)
+
+    def set(self, token: str, user: User, ttl_seconds: Optional[float] = None) -> None:
+        if not self._cache.enabled:
+            return
+        self._cache.set(token, user, ttl_seconds=ttl_seconds)
+        with self._lock:
+            tokens = self._tokens_by_subject.setdefault(user.email, set())
+            # Remove do índice os tokens que já saíram do cache (expirados ou despejados)
+            tokens.intersection_update([t for t in tokens if self._cache.contains(t)])
+            tokens.add(token)
+
+    def invalidate_subject(self, email: str) -> None:
+        with self._lock:
+            tokens = self._tokens_by_subject.pop(email, set())
+        for token in tokens:
+            self._cache.delete(token)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens_by_subject.clear()
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+principal_cache = PrincipalCache()
+
+
+@event.listens_for(User.role, "set")
+@event.listens_for(User.hashed_password, "set")
+def _invalidate_on_credentials_change(target: User, value, oldvalue, initiator):
+    """Descarta os principais em cache quando o papel ou a senha do usuário mudam."""
+    if inspect(target).persistent and value != oldvalue:
+        principal_cache.invalidate_subject(target.email)
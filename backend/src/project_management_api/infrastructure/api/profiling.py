@@ -0,0 +1,309 @@
+# src/project_management_api/infrastructure/api/profiling.py
+"""
+Profiler por requisição, disparado sob demanda por administradores.
+
+Um administrador obtém um token de profiling assinado (POST
+/api/admin/profiling/token) e o envia no cabeçalho `X-Profile-Token` (ou no
+parâmetro `__profile`) de qualquer requisição. Só essa requisição é
+amostrada: uma thread lê a pilha do event loop a cada PROFILE_INTERVAL_MS e
+guarda apenas as amostras em que a corrotina da requisição está executando.
+
+O resultado fica em PROFILE_DIR: pilhas no formato "collapsed"
+(flamegraph.pl, speedscope) e um resumo com o tempo de CPU por fase
+(autenticação, validação, banco, serialização, endpoint, framework) e o
+tempo de espera do banco medido pela instrumentação de SQL. Requisições sem
+o cabeçalho não pagam nada além da busca do cabeçalho.
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
+from jose import JWTError, jwt
+
+from project_management_api.domain.models import User
+from project_management_api.infrastructure.api.security import SECRET_KEY, ALGORITHM
+from project_management_api.infrastructure.api.request_context import current_request_context
+from project_management_api.infrastructure.db.instrumentation import current_request_stats
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+_PROFILE_QUERY_PARAM = "__profile"
+_TOKEN_SCOPE = "request-profile"
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "true").lower() == "true"
+PROFILE_DIR = os.getenv("PROFILE_DIR") or os.path.join(tempfile.gettempdir(), "project-management-profiles")
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "1"))
+PROFILE_TOKEN_TTL_SECONDS = int(os.getenv("PROFILE_TOKEN_TTL_SECONDS", "300"))
+# Quantidade de perfis mantidos em disco; os mais antigos são apagados
+PROFILE_KEEP = int(os.getenv("PROFILE_KEEP", "200"))
+
+PHASES = ("auth", "validation", "db", "serialization", "endpoint", "framework")
+_PACKAGE_MARKER = f"{os.sep}project_management_api{os.sep}"
+
+
+def create_profile_token(admin: User) -> Tuple[str, int]:
+    """Token de curta duração que autoriza o profiling de requisições."""
+    expire = datetime.utcnow() + timedelta(seconds=PROFILE_TOKEN_TTL_SECONDS)
+    token = jwt.encode({"sub": str(admin.id), "scope": _TOKEN_SCOPE, "exp": expire}, SECRET_KEY, algorithm=ALGORITHM)
+    return token, PROFILE_TOKEN_TTL_SECONDS
+
+
+def verify_profile_token(token: str) -> Optional[str]:
+    """Retorna o id do administrador que emitiu o token, ou None se inválido/expirado."""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    if payload.get("scope") != _TOKEN_SCOPE:
+        return None
+    return payload.get("sub")
+
+
+def _frame_phase(filename: str, function: str) -> Optional[str]:
+    if filename.endswith(f"api{os.sep}security.py"):
+        return "auth"
+    if function == "serialize_response" or filename.endswith((f"api{os.sep}serialization.py", f"api{os.sep}exports.py",
+                                                              f"fastapi{os.sep}encoders.py")):
+        return "serialization"
+    if function in ("request_params_to_args", "request_body_to_args", "_validate_value_with_model_field") \
+            or f"{os.sep}pydantic{os.sep}" in filename:
+        return "validation"
+    return None
+
+
+def classify(stack: Tuple[Any, ...]) -> str:
+    """Fase de uma pilha (da raiz para a folha): vence a fase mais externa; banco só fora delas."""
+    for code in stack:
+        phase = _frame_phase(code.co_filename, code.co_name)
+        if phase is not None:
+            return phase
+    if any(f"{os.sep}{package}{os.sep}" in code.co_filename for code in stack for package in ("sqlalchemy", "aiosqlite", "asyncpg")):
+        return "db"
+    if any(_PACKAGE_MARKER in code.co_filename and not code.co_filename.endswith(f"api{os.sep}middleware.py")
+           for code in stack):
+        return "endpoint"
+    return "framework"
+
+
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    index = filename.find("site-packages")
+    short = filename[index + 14:] if index >= 0 else os.path.basename(filename)
+    return f"{code.co_qualname} ({short}:{code.co_firstlineno})"
+
+
+class RequestProfiler:
+    """
+    Profiler por amostragem restrito a uma corrotina.
+
+    A thread de amostragem lê a pilha da thread do event loop; uma amostra só
+    conta quando o frame marcador (a corrotina da requisição) está na pilha,
+    então outras requisições atendidas ao mesmo tempo não entram no perfil.
+    Cada amostra pesa o tempo decorrido desde a anterior. Endpoints e
+    dependências síncronos rodam no threadpool e aparecem como tempo fora da
+    CPU do loop (`off_cpu_ms`).
+    """
+
+    def __init__(self, interval_ms: float = PROFILE_INTERVAL_MS):
+        self.interval = interval_ms / 1000
+        self.stacks: Counter = Counter()
+        self.weights: Dict[Tuple[Any, ...], float] = {}
+        self._thread_id = threading.get_ident()
+        self._marker = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._switch_interval = sys.getswitchinterval()
+
+    def start(self, marker_frame) -> None:
+        self._marker = marker_frame
+        # Sem isso a thread só obtém o GIL a cada 5 ms enquanto o loop usa CPU
+        sys.setswitchinterval(min(self._switch_interval, self.interval / 2))
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+        sys.setswitchinterval(self._switch_interval)
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stopped.wait(self.interval):
+            now = time.perf_counter()
+            elapsed, last = now - last, now
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._marker:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if frame is None:
+                continue  # a requisição não estava executando nesta amostra
+            key = tuple(reversed(stack))
+            self.stacks[key] += 1
+            self.weights[key] = self.weights.get(key, 0.0) + elapsed
+
+    def collapsed(self) -> str:
+        """Pilhas no formato "collapsed" (`frame;frame;folha contagem`)."""
+        return "".join(
+            f"{';'.join(_frame_label(code) for code in stack) or '<request>'} {count}\n"
+            for stack, count in self.stacks.most_common()
+        )
+
+    def breakdown_ms(self) -> Dict[str, float]:
+        phases = dict.fromkeys(PHASES, 0.0)
+        for stack, weight in self.weights.items():
+            phases[classify(stack)] += weight * 1000
+        return {phase: round(ms, 3) for phase, ms in phases.items()}
+
+
+class ProfileStore:
+    """Perfis gravados em disco: `<id>.json` (resumo) e `<id>.folded` (pilhas)."""
+
+    def __init__(self, directory: str = PROFILE_DIR, keep: int = PROFILE_KEEP):
+        self.directory = directory
+        self.keep = keep
+
+    def _path(self, profile_id: str, extension: str) -> Optional[str]:
+        if not profile_id.isalnum():
+            return None
+        return os.path.join(self.directory, f"{profile_id}.{extension}")
+
+    def save(self, profile_id: str, summary: Dict[str, Any], collapsed: str) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(self._path(profile_id, "folded"), "w") as f:
+            f.write(collapsed)
+        with open(self._path(profile_id, "json"), "w") as f:
+            json.dump(summary, f)
+        self._prune()
+
+    def _prune(self) -> None:
+        summaries = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime,
+        )
+        for entry in summaries[:max(len(summaries) - self.keep, 0)]:
+            for extension in ("json", "folded"):
+                try:
+                    os.remove(self._path(entry.name[:-5], extension))
+                except (FileNotFoundError, TypeError):
+                    pass
+
+    def summary(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        path = self._path(profile_id, "json")
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def collapsed(self, profile_id: str) -> Optional[str]:
+        path = self._path(profile_id, "folded")
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return f.read()
+
+    def list(self, limit: int = 50) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.directory):
+            return []
+        entries = sorted(
+            (entry for entry in os.scandir(self.directory) if entry.name.endswith(".json")),
+            key=lambda entry: entry.stat().st_mtime, reverse=True,
+        )
+        return [self.summary(entry.name[:-5]) for entry in entries[:limit]]
+
+
+profile_store = ProfileStore()
+
+
+def _profile_token(scope) -> Optional[str]:
+    for name, value in scope["headers"]:
+        if name == b"x-profile-token":
+            return value.decode("latin-1")
+    query_string = scope.get("query_string", b"")
+    if b"__profile=" in query_string:
+        values = parse_qs(query_string.decode("latin-1")).get(_PROFILE_QUERY_PARAM)
+        return values[0] if values else None
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    Middleware ASGI puro que perfila as requisições marcadas com um token de profiling.
+
+    Deve ficar dentro do LoggingMiddleware para reaproveitar o request id e a
+    contagem de SQL da requisição. Um perfil por vez por worker; enquanto um
+    perfil está em andamento, outros pedidos seguem sem profiling.
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None, interval_ms: Optional[float] = None):
+        self.app = app
+        # Sem store explícito, usa o `profile_store` do módulo no momento do registro
+        self.store = store
+        self.interval_ms = PROFILE_INTERVAL_MS if interval_ms is None else interval_ms
+        self._active = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active:
+            await self.app(scope, receive, send)
+            return
+        token = _profile_token(scope)
+        admin_id = verify_profile_token(token) if token else None
+        if admin_id is None:
+            await self.app(scope, receive, send)
+            return
+        self._active = True
+        try:
+            await self._profile(scope, receive, send, admin_id)
+        finally:
+            self._active = False
+
+    async def _profile(self, scope, receive, send, admin_id: str):
+        context = current_request_context()
+        profile_id = context.request_id if context and context.request_id.isalnum() else os.urandom(16).hex()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message = {**message, "headers": [*message.get("headers", []),
+                                                   (PROFILE_ID_HEADER.lower().encode("latin-1"), profile_id.encode("latin-1"))]}
+            await send(message)
+
+        profiler = RequestProfiler(self.interval_ms)
+        start_time = time.perf_counter()
+        profiler.start(sys._getframe())
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            wall_ms = (time.perf_counter() - start_time) * 1000
+            query_stats = current_request_stats()
+            breakdown = profiler.breakdown_ms()
+            cpu_ms = sum(breakdown.values())
+            (self.store or profile_store).save(profile_id, {
+                "id": profile_id,
+                "created_at": datetime.utcnow().isoformat(),
+                "requested_by": admin_id,
+                "method": scope["method"],
+                "path": scope["path"],
+                "route": getattr(scope.get("route"), "path", None),
+                "status_code": status_code,
+                "wall_ms": round(wall_ms, 3),
+                "sampled_cpu_ms": round(cpu_ms, 3),
+                # Tempo fora da CPU da requisição: aguardando o banco, I/O ou outras tarefas do loop
+                "off_cpu_ms": round(max(wall_ms - cpu_ms, 0.0), 3),
+                "db_wait_ms": query_stats.total_ms if query_stats else None,
+                "db_queries": query_stats.count if query_stats else None,
+                "cpu_by_phase_ms": breakdown,
+                "samples": sum(profiler.stacks.values()),
+                "interval_ms": self.interval_ms,
+            }, profiler.collapsed())
@@ -0,0 +1,40 @@
+# src/project_management_api/infrastructure/api/request_context.py
+import uuid
+from contextvars import ContextVar
+from typing import Optional
+
+REQUEST_ID_HEADER = "X-Request-ID"
+_MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestContext:
+    """Dados da requisição corrente preenchidos ao longo do processamento e lidos pelo log de acesso."""
+
+    __slots__ = ("request_id", "user_id")
+
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self.user_id: Optional[str] = None
+
+
+_current_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
+
+
+def begin_request_context(incoming_id: Optional[str] = None) -> RequestContext:
+    """Inicia o contexto da requisição; reaproveita o X-Request-ID do cliente/proxy quando válido."""
+    if not incoming_id or len(incoming_id) > _MAX_REQUEST_ID_LENGTH or not incoming_id.isprintable():
+        incoming_id = uuid.uuid4().hex
+    context = RequestContext(incoming_id)
+    _current_context.set(context)
+    return context
+
+
+def current_request_context() -> Optional[RequestContext]:
+    return _current_context.get()
+
+
+def set_request_user(user_id: Optional[str]) -> None:
+    """Registra o usuário autenticado da requisição corrente (chamado pela autenticação)."""
+    context = _current_context.get()
+    if context is not None:
+        context.user_id = str(user_id) if user_id is not None else None
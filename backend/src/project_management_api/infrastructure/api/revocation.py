@@ -0,0 +1,115 @@
+# src/project_management_api/infrastructure/api/revocation.py
+import os
+import time
+import hashlib
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from project_management_api.domain.models import User
+
+REVOCATION_REFRESH_SECONDS = float(os.getenv("REVOCATION_REFRESH_SECONDS", "5"))
+REVOCATION_BLOOM_BITS = int(os.getenv("REVOCATION_BLOOM_BITS", str(1 << 16)))
+REVOCATION_BLOOM_HASHES = 4
+
+
+class BloomFilter:
+    """Filtro de Bloom simples sobre um bytearray; não admite remoção."""
+
+    def __init__(self, num_bits: int = REVOCATION_BLOOM_BITS, num_hashes: int = REVOCATION_BLOOM_HASHES):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray((num_bits + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=8 * self.num_hashes).digest()
+        for i in range(self.num_hashes):
+            yield int.from_bytes(digest[i * 8:(i + 1) * 8], "little") % self.num_bits
+
+    def add(self, key: str) -> None:
+        for pos in self._positions(key):
+            self._bits[pos // 8] |= 1 << (pos % 8)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[pos // 8] & (1 << (pos % 8)) for pos in self._positions(key))
+
+
+def _to_timestamp(value: datetime) -> float:
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+
+class RevocationFilter:
+    """
+    Conjunto em memória de usuários cujos tokens emitidos antes de
+    `tokens_valid_after` não são mais válidos (papel ou senha alterados).
+
+    O filtro de Bloom responde rapidamente "certamente não revogado" para a
+    grande maioria dos usuários; o conjunto exato guarda o instante da revogação.
+    A sincronização com o banco é incremental, por marca d'água.
+    """
+
+    def __init__(self, refresh_seconds: float = REVOCATION_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._bloom = BloomFilter()
+        self._valid_after: Dict[str, float] = {}
+        self._watermark: Optional[datetime] = None
+        self._last_refresh = 0.0
+        self.filter_hits = 0
+        self.filter_misses = 0
+
+    def revoke(self, user_id: str, valid_after: datetime) -> None:
+        self._bloom.add(user_id)
+        ts = _to_timestamp(valid_after)
+        self._valid_after[user_id] = max(ts, self._valid_after.get(user_id, 0.0))
+
+    def might_be_revoked(self, user_id: str, issued_at: float) -> bool:
+        """True quando o token precisa ser confirmado no banco de dados."""
+        if user_id not in self._bloom:
+            self.filter_misses += 1
+            return False
+        valid_after = self._valid_after.get(user_id)
+        if valid_after is None or issued_at >= valid_after:
+            # Falso positivo do Bloom, ou token emitido depois da revogação
+            self.filter_misses += 1
+            return False
+        self.filter_hits += 1
+        return True
+
+    async def refresh_if_stale(self, db: AsyncSession) -> None:
+        now = time.monotonic()
+        if now - self._last_refresh < self.refresh_seconds:
+            return
+        # Marca antes do await para que requisições concorrentes não repitam a consulta
+        self._last_refresh = now
+        query = select(User.id, User.tokens_valid_after).filter(User.tokens_valid_after.isnot(None))
+        if self._watermark is not None:
+            query = query.filter(User.tokens_valid_after >= self._watermark)
+        result = await db.execute(query)
+        for user_id, valid_after in result.all():
+            self.revoke(user_id, valid_after)
+            if self._watermark is None or valid_after > self._watermark:
+                self._watermark = valid_after
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "revoked_users": len(self._valid_after),
+            "filter_hits": self.filter_hits,
+            "filter_misses": self.filter_misses,
+        }
+
+
+revocation_filter = RevocationFilter()
+
+
+@event.listens_for(User.role, "set")
+@event.listens_for(User.hashed_password, "set")
+def _revoke_on_credentials_change(target: User, value, oldvalue, initiator):
+    """Invalida os tokens já emitidos quando o papel ou a senha de um usuário existente mudam."""
+    if not inspect(target).persistent or value == oldvalue:
+        return
+    now = datetime.utcnow()
+    target.tokens_valid_after = now
+    revocation_filter.revoke(target.id, now)
@@ -1,16 +1,67 @@
 # src/project_management_api/infrastructure/api/routes/analytics.py
-from typing import List
-from fastapi import APIRouter, Depends
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from project_management_api.infrastructure.db.database import get_db
 from project_management_api.application import schemas
 from project_management_api.domain.models import User
 from project_management_api.infrastructure.api import security
-from project_management_api.infrastructure.repositories.project_repository import ProjectRepository
+from project_management_api.infrastructure.repositories.project_repository import ProjectRepository, PROJECT_KEYSET
+from project_management_api.infrastructure.repositories.pagination import InvalidCursorError
+from project_management_api.infrastructure.repositories.totals import TotalMode
+from project_management_api.infrastructure.api.dependencies import get_pagination_params, offset_page_cursors, page_count
+from project_management_api.infrastructure.repositories.analytics_counter_repository import AnalyticsCounterRepository, AnalyticsDimension
+from project_management_api.infrastructure.repositories.phase_interval_repository import PhaseIntervalRepository, week_start
+from project_management_api.infrastructure.analytics_cache import analytics_cache
 
 router = APIRouter(prefix="/api/analytics", tags=["Analytics"])
 
+
+async def _cached_counts(db: AsyncSession, dimensions: Sequence[AnalyticsDimension]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Contagens por dimensão no formato da resposta, servidas pelo cache de
+    analytics. `/summary` e os endpoints `/projects-by-*` compartilham as
+    entradas: a chave é o conjunto de dimensões pedido.
+    """
+    dimensions = sorted(set(dimensions), key=list(AnalyticsDimension).index)
+
+    async def load() -> Dict[str, List[Dict[str, Any]]]:
+        # Contadores mantidos a cada escrita em `projects`: leitura sem varrer a tabela
+        counts = await AnalyticsCounterRepository(db).counts(dimensions)
+        return {
+            dimension.value: [{"category": _category(dimension, value), "count": count} for value, count in stats_tuples]
+            for dimension, stats_tuples in counts.items()
+        }
+
+    return await analytics_cache.get_or_load("counts", tuple(dimension.value for dimension in dimensions), load)
+
+
+async def _counter_stats(db: AsyncSession, dimension: AnalyticsDimension) -> List[Dict[str, Any]]:
+    return (await _cached_counts(db, [dimension]))[dimension.value]
+
+
+def _category(dimension: AnalyticsDimension, value: Any) -> Any:
+    """Mesmo formato de categoria dos endpoints individuais (`/projects-by-*`)."""
+    if dimension in (AnalyticsDimension.STATUS, AnalyticsDimension.PHASE):
+        return value.value if value is not None else None
+    if dimension in (AnalyticsDimension.PROJECT_MANAGER, AnalyticsDimension.TECHNICAL_LEAD):
+        return value or "Unassigned"
+    return value
+
+
+@router.get("/summary", response_model=Dict[AnalyticsDimension, List[schemas.AnalyticsStat]],
+    summary="Resumo do Dashboard",
+    description="Retorna, em uma única consulta, as contagens de projetos por status, fase, GP (pm), LT (tl) e cliente, no mesmo formato dos endpoints `/projects-by-*`. O parâmetro `dimension` (repetível) limita as dimensões calculadas. Requer autenticação de qualquer usuário válido."
+)
+async def get_analytics_summary(
+    dimensions: Optional[List[AnalyticsDimension]] = Query(None, alias="dimension", description="Dimensões a calcular (padrão: todas)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(security.get_current_user)
+):
+    return await _cached_counts(db, dimensions or list(AnalyticsDimension))
+
 @router.get("/projects-by-status", response_model=List[schemas.AnalyticsStat],
     summary="Projetos por Status",
     description="Retorna estatísticas de contagem de projetos agrupados por status (ativo, concluído, cancelado, etc.). Requer autenticação de qualquer usuário válido."
@@ -19,9 +70,7 @@ async def get_projects_by_status(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    repo = ProjectRepository(db)
-    stats_tuples = await repo.count_by_status()
-    return [schemas.AnalyticsStat(category=status.value, count=count) for status, count in stats_tuples]
+    return await _counter_stats(db, AnalyticsDimension.STATUS)
 
 @router.get("/projects-by-phase", response_model=List[schemas.AnalyticsStat],
     summary="Projetos por Fase",
@@ -31,9 +80,7 @@ async def get_projects_by_phase(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    repo = ProjectRepository(db)
-    stats_tuples = await repo.count_by_phase()
-    return [schemas.AnalyticsStat(category=phase.value, count=count) for phase, count in stats_tuples]
+    return await _counter_stats(db, AnalyticsDimension.PHASE)
 
 @router.get("/debug/sentry-test",
     summary="Teste de Erro (Debug)",
@@ -51,9 +98,7 @@ async def get_projects_by_project_manager(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    repo = ProjectRepository(db)
-    stats_tuples = await repo.count_by_project_manager()
-    return [schemas.AnalyticsStat(category=email or "Unassigned", count=count) for email, count in stats_tuples]
+    return await _counter_stats(db, AnalyticsDimension.PROJECT_MANAGER)
 
 @router.get("/projects-by-tl", response_model=List[schemas.AnalyticsStat],
     summary="Projetos por Technical Lead",
@@ -63,9 +108,7 @@ async def get_projects_by_technical_lead(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    repo = ProjectRepository(db)
-    stats_tuples = await repo.count_by_technical_lead()
-    return [schemas.AnalyticsStat(category=email or "Unassigned", count=count) for email, count in stats_tuples]
+    return await _counter_stats(db, AnalyticsDimension.TECHNICAL_LEAD)
 
 @router.get("/projects-by-client", response_model=List[schemas.AnalyticsStat],
     summary="Projetos por Cliente",
@@ -75,22 +118,86 @@ async def get_projects_by_client(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    repo = ProjectRepository(db)
-    stats_tuples = await repo.count_by_client()
-    return [schemas.AnalyticsStat(category=client, count=count) for client, count in stats_tuples]
+    return await _counter_stats(db, AnalyticsDimension.CLIENT)
+
+@router.get("/phase-cycle-time", response_model=List[schemas.PhaseCycleTime],
+    summary="Tempo de Ciclo por Fase",
+    description="Retorna, por fase do workflow, a quantidade de períodos concluídos, o tempo médio e os percentis (p50, p75, p90, p95) do tempo na fase, em dias. `since`/`until` filtram pela data de saída da fase. Calculado sobre o rollup de intervalos de fase, sem consultar os logs de auditoria. Requer autenticação de qualquer usuário válido."
+)
+async def get_phase_cycle_time(
+    since: Optional[date] = Query(None, description="Considera períodos encerrados a partir desta data"),
+    until: Optional[date] = Query(None, description="Considera períodos encerrados até esta data (inclusive)"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(security.get_current_user)
+):
+    if since and until and since > until:
+        raise HTTPException(status_code=400, detail="since must be before until")
+
+    async def load() -> List[Dict[str, Any]]:
+        stats = await PhaseIntervalRepository(db).cycle_times(since, until)
+        return [
+            {
+                "phase": item["phase"].value,
+                "count": item["count"],
+                "average_days": round(item["average"] / 86400, 3),
+                "percentiles_days": {f"p{round(fraction * 100)}": round(seconds / 86400, 3) for fraction, seconds in item["percentiles"].items()},
+            }
+            for item in stats
+        ]
+
+    params = (since.isoformat() if since else None, until.isoformat() if until else None)
+    return await analytics_cache.get_or_load("phase-cycle-time", params, load)
 
-@router.get("/overdue-projects", response_model=List[schemas.ProjectRead],
+@router.get("/phase-throughput", response_model=List[schemas.PhaseThroughput],
+    summary="Vazão Semanal de Avanços de Fase",
+    description="Retorna a quantidade de avanços de fase por semana (iniciada na segunda-feira) e fase concluída, nas últimas `weeks` semanas incluindo a atual. Semanas sem avanços não aparecem. Calculado sobre o rollup de intervalos de fase, sem consultar os logs de auditoria. Requer autenticação de qualquer usuário válido."
+)
+async def get_phase_throughput(
+    weeks: int = Query(12, ge=1, le=104, description="Quantidade de semanas, incluindo a atual"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(security.get_current_user)
+):
+    since = week_start(datetime.utcnow()) - timedelta(weeks=weeks - 1)
+
+    async def load() -> List[Dict[str, Any]]:
+        rows = await PhaseIntervalRepository(db).weekly_throughput(since)
+        return [{"week": week.isoformat(), "phase": phase.value, "count": count} for week, phase, count in rows]
+
+    return await analytics_cache.get_or_load("phase-throughput", since.isoformat(), load)
+
+@router.get("/overdue-projects", response_model=schemas.PaginatedResponse[schemas.ProjectRead],
     summary="Projetos em Atraso",
-    description="Retorna uma lista de projetos em atraso. Um projeto é considerado em atraso se a data de término estimada passou e seu status ainda é 'ativo' ou 'em espera'. Requer autenticação de qualquer usuário válido."
+    description="Retorna uma lista paginada dos projetos em atraso, mais recentes primeiro. Um projeto está em atraso se a data de término estimada passou e seu status ainda é 'ativo' ou 'em espera'; o estado é mantido por um job periódico (com notificação ao GP) e lido por índice. Com `cursor`, a paginação é feita por cursor (keyset). Requer autenticação de qualquer usuário válido."
 )
 async def get_overdue_projects(
+    pagination: dict = Depends(get_pagination_params),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next_cursor/prev_cursor"),
+    include_total: TotalMode = Query(TotalMode.EXACT, description="Cálculo do total: exact, estimate (estatísticas do banco) ou false (não calcula)"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
-    """
-    Retorna uma lista de projetos em atraso.
-    Um projeto é considerado em atraso se a data de término estimada passou
-    e seu status ainda é 'ativo' ou 'em espera'.
-    """
+    page = pagination["page"]
+    size = pagination["size"]
+    skip = (page - 1) * size
+
     repo = ProjectRepository(db)
-    return await repo.get_overdue_projects()
\ No newline at end of file
+    if cursor:
+        try:
+            items, next_cursor, prev_cursor, total = await repo.get_page_by_cursor(
+                cursor=cursor, limit=size, total_mode=include_total, overdue=True
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        items, total = await repo.get_all(skip=skip, limit=size, total_mode=include_total, overdue=True)
+        next_cursor, prev_cursor = offset_page_cursors(PROJECT_KEYSET, items, skip=skip, size=size, total=total)
+
+    return schemas.PaginatedResponse(
+        total=total,
+        page=page,
+        size=size,
+        pages=page_count(total, size),
+        items=items,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
@@ -1,21 +1,37 @@
-import math
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from project_management_api.infrastructure.db.database import get_db
 from project_management_api.infrastructure.api import security
 from project_management_api.application import schemas
-from project_management_api.domain.models import User
-from project_management_api.infrastructure.repositories.audit_log_repository import AuditLogRepository
-from project_management_api.infrastructure.api.dependencies import get_pagination_params
+from project_management_api.domain.models import User, AuditLog
+from project_management_api.infrastructure.repositories.audit_log_repository import AuditLogRepository, AUDIT_LOG_KEYSET
+from project_management_api.infrastructure.repositories.pagination import InvalidCursorError
+from project_management_api.infrastructure.api.dependencies import get_pagination_params, offset_page_cursors, page_count
+from project_management_api.infrastructure.api.fieldsets import Fieldset, FieldSelection
+from project_management_api.infrastructure.api import serialization
+from project_management_api.infrastructure.api.exports import ExportFormat, export_response
+from project_management_api.infrastructure.repositories.totals import TotalMode
 
 router = APIRouter(prefix="/api/admin/audit-logs", tags=["Admin: Audit Logs"])
 
+AUDIT_LOG_FIELDS = Fieldset(
+    AuditLog, schemas.AuditLogFields,
+    relationships={"user": AuditLog.user},
+    nested_schemas={"user": schemas.UserInProject},
+    always_load=("timestamp",),
+)
+AUDIT_LOG_SERIALIZER = serialization.ModelSerializer(schemas.AuditLogRead)
 
-@router.get("/", response_model=schemas.PaginatedResponse[schemas.AuditLogRead])
+
+@router.get("/", response_model=Union[schemas.PaginatedResponse[schemas.AuditLogRead], schemas.PaginatedResponse[schemas.AuditLogFields]],
+    response_model_exclude_unset=True)
 async def get_audit_logs(
     pagination: dict = Depends(get_pagination_params),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next_cursor/prev_cursor"),
+    include_total: TotalMode = Query(TotalMode.EXACT, description="Cálculo do total: exact, estimate (estatísticas do banco) ou false (não calcula)"),
+    selection: Optional[FieldSelection] = Depends(AUDIT_LOG_FIELDS.query),
     db: AsyncSession = Depends(get_db),
     admin: User = Depends(security.get_current_admin_user)
 ):
@@ -25,16 +41,58 @@ async def get_audit_logs(
     Retorna uma lista paginada de todos os logs de auditoria do sistema,
     incluindo informações sobre o usuário que realizou a ação, a ação executada,
     detalhes contextuais e timestamp.
+
+    Com `cursor`, a página é buscada por (timestamp, id) em vez de OFFSET, o que
+    mantém a latência constante mesmo em páginas profundas de tabelas grandes.
+    Em tabelas grandes, `include_total=estimate` ou `include_total=false` evitam
+    o COUNT(*) completo. `fields`/`include` limitam as colunas carregadas e o
+    join com o usuário.
     """
     repo = AuditLogRepository(db)
-    skip = (pagination["page"] - 1) * pagination["size"]
+    size = pagination["size"]
+    skip = (pagination["page"] - 1) * size
+    options = AUDIT_LOG_FIELDS.load_options(selection) if selection else None
     
-    items, total = await repo.get_all(skip=skip, limit=pagination["size"])
+    if cursor:
+        try:
+            items, next_cursor, prev_cursor, total = await repo.get_page_by_cursor(
+                cursor=cursor, limit=size, total_mode=include_total, options=options
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    else:
+        items, total = await repo.get_all(skip=skip, limit=size, total_mode=include_total, options=options)
+        next_cursor, prev_cursor = offset_page_cursors(AUDIT_LOG_KEYSET, items, skip=skip, size=size, total=total)
     
+    if selection:
+        items = [AUDIT_LOG_FIELDS.serialize(item, selection) for item in items]
+    elif serialization.enabled():
+        return serialization.page_response(
+            AUDIT_LOG_SERIALIZER, items, total=total, page=pagination["page"], size=size,
+            pages=page_count(total, size), next_cursor=next_cursor, prev_cursor=prev_cursor
+        )
     return schemas.PaginatedResponse(
         total=total,
         page=pagination["page"],
-        size=pagination["size"],
-        pages=math.ceil(total / pagination["size"]) if total > 0 else 1,
-        items=items
-    )
\ No newline at end of file
+        size=size,
+        pages=page_count(total, size),
+        items=items,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
+    )
+
+
+@router.get("/export")
+async def export_audit_logs(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato da exportação: ndjson ou csv"),
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(security.get_current_admin_user)
+):
+    """
+    Exporta todo o log de auditoria em NDJSON ou CSV (apenas para administradores).
+
+    As linhas são lidas por cursor do servidor e enviadas em streaming à medida
+    que chegam, na ordem da listagem, sem paginação nem COUNT; a memória usada
+    não depende do tamanho do log.
+    """
+    return export_response(db, AuditLogRepository(db).stream_all(), AUDIT_LOG_SERIALIZER, format, filename="audit-logs")
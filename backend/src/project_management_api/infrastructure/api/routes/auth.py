@@ -6,8 +6,10 @@ from datetime import timedelta
 from project_management_api.infrastructure.api import security
 from project_management_api.application import schemas
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.infrastructure.repositories.user_repository import UserRepository
 from project_management_api.application.services import audit_service
+from project_management_api.infrastructure.metrics import AUTH_FAILURES
 
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
@@ -18,7 +20,8 @@ router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 async def login_for_access_token(db: AsyncSession = Depends(get_db), form_data: OAuth2PasswordRequestForm = Depends()):
     repo = UserRepository(db)
     user = await repo.get_by_email(email=form_data.username)
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not user or not await security.verify_password_async(form_data.password, user.hashed_password):
+        AUTH_FAILURES.inc(reason="bad_credentials")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -26,15 +29,16 @@ async def login_for_access_token(db: AsyncSession = Depends(get_db), form_data:
         )
     
     # Registrar log de auditoria para login bem-sucedido
-    await audit_service.create_audit_log(
-        db, 
-        user=user, 
-        action="USER_LOGIN", 
-        details={"email": user.email, "user_id": str(user.id)}
-    )
+    async with UnitOfWork(db):
+        await audit_service.create_audit_log(
+            db, 
+            user=user, 
+            action="USER_LOGIN", 
+            details={"email": user.email, "user_id": str(user.id)}
+        )
     
     access_token_expires = timedelta(minutes=security.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = security.create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data=security.build_token_claims(user), expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
\ No newline at end of file
@@ -1,18 +1,28 @@
 import uuid
 import shutil
 import os
-from typing import List
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.application import schemas
-from project_management_api.domain.models import User, Document
+from project_management_api.domain.models import User, Document, DocumentStatus
+from project_management_api.domain.ids import new_id
 from project_management_api.infrastructure.api import security
-from project_management_api.infrastructure.repositories.document_repository import DocumentRepository
+from project_management_api.infrastructure.api.fieldsets import Fieldset, FieldSelection
+from project_management_api.infrastructure.api import serialization
+from project_management_api.infrastructure.api.dependencies import set_cursor_headers
+from project_management_api.infrastructure.api.conditional import Validators
+from project_management_api.infrastructure.repositories.document_repository import DocumentRepository, DOCUMENT_SORT_FIELDS, DOCUMENT_DEFAULT_SORT
+from project_management_api.infrastructure.repositories.pagination import InvalidCursorError, InvalidSortError, parse_sort, sort_field_names
 
 router = APIRouter(prefix="/api/projects/{project_id}/documents", tags=["Documents"])
 UPLOAD_DIR = "/app/uploads"
 
+DOCUMENT_FIELDS = Fieldset(Document, schemas.DocumentFields, relationships={}, nested_schemas={})
+DOCUMENT_SERIALIZER = serialization.ModelSerializer(schemas.DocumentRead)
+
 
 @router.post("/upload", response_model=schemas.DocumentRead, status_code=201,
     summary="Upload de Documento",
@@ -32,25 +42,61 @@ async def upload_document(
         shutil.copyfileobj(file.file, file_object)
     
     db_doc = Document(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         name=file.filename,
         file_path=file_location,
         file_type=file.content_type,
         project_id=project_id
     )
-    return await repo.create(db_doc)
+    async with UnitOfWork(db):
+        return await repo.create(db_doc)
 
 
-@router.get("/", response_model=List[schemas.DocumentRead],
+@router.get("/", response_model=Union[List[schemas.DocumentRead], List[schemas.DocumentFields]],
+    response_model_exclude_unset=True,
     summary="Lista Documentos do Projeto",
-    description="Retorna todos os documentos associados a um projeto específico. Requer autenticação de qualquer usuário válido."
+    description="Retorna os documentos de um projeto, com filtros por status, tipo e nome, ordenação por múltiplas chaves (`sort=name,-version`) e paginação por cursor: o cursor da próxima página vem no cabeçalho `X-Next-Cursor`. Com `fields`, retorna apenas os campos pedidos. A resposta traz um ETag da coleção; com `If-None-Match`, retorna 304 sem corpo se nada mudou. Requer autenticação de qualquer usuário válido."
 )
 async def get_documents(
     project_id: str,
+    request: Request,
+    response: Response,
+    status: Optional[List[DocumentStatus]] = Query(None, description="Filtrar por status (pode repetir o parâmetro)"),
+    type: Optional[str] = Query(None, description="Filtrar pelo tipo do documento (ex.: BRD)"),
+    q: Optional[str] = Query(None, min_length=1, description="Busca por texto no nome do documento"),
+    sort: Optional[str] = Query(None, description=f"Ordenação, separada por vírgula; prefixo '-' para decrescente. Campos: {', '.join(DOCUMENT_SORT_FIELDS)}"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco dos cabeçalhos X-Next-Cursor/X-Prev-Cursor"),
+    limit: int = Query(100, gt=0, le=500, description="Quantidade máxima de documentos por página"),
+    selection: Optional[FieldSelection] = Depends(DOCUMENT_FIELDS.query),
     db: AsyncSession = Depends(get_db),
     user: User = Depends(security.allow_all_authenticated)
 ):
-    return await DocumentRepository(db).get_by_project(project_id)
+    repo = DocumentRepository(db)
+    validators = Validators.for_collection("documents", request, *await repo.search_version(project_id, status=status, type=type, q=q))
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    try:
+        options = ()
+        if selection:
+            # A ordenação é validada antes: os campos dela entram no load_only
+            parse_sort(sort, DOCUMENT_SORT_FIELDS, DOCUMENT_DEFAULT_SORT)
+            options = DOCUMENT_FIELDS.load_options(selection, extra_columns=sort_field_names(sort, DOCUMENT_DEFAULT_SORT))
+        documents, next_cursor, prev_cursor = await repo.search_by_project(
+            project_id, status=status, type=type, q=q, sort=sort, cursor=cursor, limit=limit, options=options,
+        )
+    except (InvalidCursorError, InvalidSortError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not selection and serialization.enabled():
+        json_response = serialization.list_response(DOCUMENT_SERIALIZER, documents)
+        set_cursor_headers(json_response, next_cursor, prev_cursor)
+        validators.apply(json_response)
+        return json_response
+    set_cursor_headers(response, next_cursor, prev_cursor)
+    validators.apply(response)
+    if not selection:
+        return documents
+    return [DOCUMENT_FIELDS.serialize(document, selection) for document in documents]
 
 
 @router.put("/{document_id}", response_model=schemas.DocumentRead,
@@ -68,7 +114,8 @@ async def update_document_metadata(
     if not doc_to_update or doc_to_update.project_id != project_id:
         raise HTTPException(status_code=404, detail="Document not found in this project")
     
-    return await repo.update(document_id, doc_data)
+    async with UnitOfWork(db):
+        return await repo.update(document_id, doc_data)
 
 
 @router.delete("/{document_id}", status_code=status.HTTP_204_NO_CONTENT,
@@ -96,4 +143,5 @@ async def delete_document(
         raise HTTPException(status_code=500, detail=f"Error removing file: {e}")
 
     # Excluir o registro do banco de dados
-    await repo.delete(doc_to_delete)
\ No newline at end of file
+    async with UnitOfWork(db):
+        await repo.delete(doc_to_delete)
\ No newline at end of file
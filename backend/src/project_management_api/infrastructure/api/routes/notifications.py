@@ -3,6 +3,7 @@ from typing import List
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.application import schemas
 from project_management_api.domain.models import User
 from project_management_api.infrastructure.api import security
@@ -38,4 +39,5 @@ async def mark_notification_as_read(
         raise HTTPException(status_code=404, detail="Notification not found")
     if notif.is_read:
         return notif  # Já está lida, apenas retorna
-    return await repo.mark_as_read(notif)
\ No newline at end of file
+    async with UnitOfWork(db):
+        return await repo.mark_as_read(notif)
\ No newline at end of file
@@ -0,0 +1,51 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from project_management_api.infrastructure.api import security
+from project_management_api.application import schemas
+from project_management_api.domain.models import User
+from project_management_api.infrastructure.api.profiling import PROFILE_TOKEN_HEADER, create_profile_token, profile_store
+
+router = APIRouter(prefix="/api/admin/profiling", tags=["Admin: Profiling"])
+
+
+@router.post("/token", response_model=schemas.ProfileTokenRead,
+    summary="Token de Profiling",
+    description="Emite um token de curta duração; requisições que o enviarem no cabeçalho X-Profile-Token (ou no parâmetro __profile) são perfiladas e o id do perfil volta no cabeçalho X-Profile-Id. Requer permissão de ADMIN."
+)
+async def create_token(admin: User = Depends(security.allow_only_admins)):
+    token, expires_in = create_profile_token(admin)
+    return {"token": token, "header": PROFILE_TOKEN_HEADER, "expires_in": expires_in}
+
+
+@router.get("/", response_model=List[schemas.ProfileSummary],
+    summary="Lista Perfis",
+    description="Lista os perfis mais recentes gravados neste servidor. Requer permissão de ADMIN."
+)
+async def list_profiles(
+    limit: int = Query(50, ge=1, le=200),
+    admin: User = Depends(security.allow_only_admins)
+):
+    return profile_store.list(limit)
+
+
+@router.get("/{profile_id}", response_model=schemas.ProfileSummary,
+    summary="Resumo do Perfil",
+    description="Tempo total, CPU por fase (autenticação, validação, banco, serialização, endpoint, framework) e espera do banco de uma requisição perfilada. Requer permissão de ADMIN."
+)
+async def get_profile(profile_id: str, admin: User = Depends(security.allow_only_admins)):
+    summary = profile_store.summary(profile_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return summary
+
+
+@router.get("/{profile_id}/collapsed",
+    summary="Pilhas do Perfil",
+    description="Pilhas amostradas no formato collapsed, pronto para flamegraph.pl ou speedscope. Requer permissão de ADMIN."
+)
+async def get_profile_stacks(profile_id: str, admin: User = Depends(security.allow_only_admins)):
+    collapsed = profile_store.collapsed(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(collapsed, media_type="text/plain; charset=utf-8")
@@ -1,57 +1,129 @@
 import uuid
-import math
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from datetime import datetime
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.application.schemas import ProjectRead, ProjectCreate, ProjectUpdate
-from project_management_api.infrastructure.repositories.project_repository import ProjectRepository
-from project_management_api.domain.models import User, ProjectStatus
+from project_management_api.infrastructure.repositories.project_repository import ProjectRepository, PROJECT_KEYSET
+from project_management_api.infrastructure.repositories.pagination import InvalidCursorError
+from project_management_api.domain.models import User, Project, ProjectStatus
 from project_management_api.infrastructure.api import security
-from project_management_api.infrastructure.api.dependencies import get_pagination_params
+from project_management_api.infrastructure.api.dependencies import get_pagination_params, offset_page_cursors, page_count
+from project_management_api.infrastructure.api.fieldsets import Fieldset, FieldSelection
+from project_management_api.infrastructure.api import serialization
+from project_management_api.infrastructure.api.exports import ExportFormat, export_response
+from project_management_api.infrastructure.api.conditional import Validators
+from project_management_api.infrastructure.repositories.totals import TotalMode
 from project_management_api.application.services.project_workflow_service import ProjectWorkflowService, QualityGateNotPassedError
 from project_management_api.infrastructure.repositories.document_repository import DocumentRepository
+from project_management_api.infrastructure.repositories.phase_interval_repository import PhaseIntervalRepository
 from project_management_api.application import schemas
 from project_management_api.application.services.notification_service import create_notification
 from project_management_api.application.services import audit_service
+from project_management_api.infrastructure.metrics import QUALITY_GATE_REJECTIONS
 
 router = APIRouter(prefix="/api/projects", tags=["Projects"])
 
+PROJECT_FIELDS = Fieldset(
+    Project, schemas.ProjectFields,
+    relationships={"project_manager": Project.project_manager, "technical_lead": Project.technical_lead},
+    nested_schemas={"project_manager": schemas.UserInProject, "technical_lead": schemas.UserInProject},
+    always_load=("createdAt",),
+)
+PROJECT_SERIALIZER = serialization.ModelSerializer(schemas.ProjectRead)
+
 
-@router.get("/", response_model=schemas.PaginatedResponse[schemas.ProjectRead],
+@router.get("/", response_model=Union[schemas.PaginatedResponse[schemas.ProjectRead], schemas.PaginatedResponse[schemas.ProjectFields]],
+    response_model_exclude_unset=True,
     summary="Lista Projetos com Paginação",
-    description="Retorna uma lista paginada de todos os projetos do sistema. Permite filtrar por status do projeto. Requer autenticação de qualquer usuário válido."
+    description="Retorna uma lista paginada de todos os projetos do sistema. Permite filtrar por status do projeto. Com `cursor`, a paginação é feita por cursor (keyset) em vez de número de página, com custo constante em páginas profundas. Com `fields` e/ou `include`, retorna apenas os campos e relacionamentos pedidos. A resposta traz um ETag da coleção; com `If-None-Match`, retorna 304 sem corpo se nada mudou. Requer autenticação de qualquer usuário válido."
 )
 async def read_projects(
+    request: Request,
+    response: Response,
     pagination: dict = Depends(get_pagination_params),
     status: Optional[ProjectStatus] = Query(None, description="Filtrar por status do projeto"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco retornado em next_cursor/prev_cursor"),
+    include_total: TotalMode = Query(TotalMode.EXACT, description="Cálculo do total: exact, estimate (estatísticas do banco) ou false (não calcula)"),
+    selection: Optional[FieldSelection] = Depends(PROJECT_FIELDS.query),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.get_current_user)
 ):
     page = pagination["page"]
     size = pagination["size"]
     skip = (page - 1) * size
+    options = PROJECT_FIELDS.load_options(selection) if selection else None
 
     repo = ProjectRepository(db)
-    items, total = await repo.get_all(skip=skip, limit=size, status=status)
+    validators = Validators.for_collection("projects", request, *await repo.listing_version(status=status))
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    if cursor:
+        try:
+            items, next_cursor, prev_cursor, total = await repo.get_page_by_cursor(
+                cursor=cursor, limit=size, status=status, total_mode=include_total, options=options
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    else:
+        items, total = await repo.get_all(skip=skip, limit=size, status=status, total_mode=include_total, options=options)
+        next_cursor, prev_cursor = offset_page_cursors(PROJECT_KEYSET, items, skip=skip, size=size, total=total)
     
+    if selection:
+        items = [PROJECT_FIELDS.serialize(item, selection) for item in items]
+    elif serialization.enabled():
+        json_response = serialization.page_response(
+            PROJECT_SERIALIZER, items, total=total, page=page, size=size, pages=page_count(total, size),
+            next_cursor=next_cursor, prev_cursor=prev_cursor
+        )
+        validators.apply(json_response)
+        return json_response
+    validators.apply(response)
     return schemas.PaginatedResponse(
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 1,
-        items=items
+        pages=page_count(total, size),
+        items=items,
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor
     )
 
 
+@router.get("/export",
+    summary="Exporta Projetos",
+    description="Exporta todos os projetos do filtro em NDJSON (um objeto por linha) ou CSV, em streaming: as linhas são lidas do banco por cursor do servidor e enviadas conforme chegam, com memória constante independentemente do volume. Aceita os mesmos filtros da listagem. Requer autenticação de qualquer usuário válido."
+)
+async def export_projects(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato da exportação: ndjson ou csv"),
+    status: Optional[ProjectStatus] = Query(None, description="Filtrar por status do projeto"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(security.get_current_user)
+):
+    batches = ProjectRepository(db).stream_all(status=status)
+    return export_response(db, batches, PROJECT_SERIALIZER, format, filename="projects")
+
+
 @router.get("/{project_id}", response_model=ProjectRead,
     summary="Busca Projeto por ID",
-    description="Retorna os detalhes completos de um projeto específico pelo seu ID único. Requer autenticação de qualquer usuário válido."
+    description="Retorna os detalhes completos de um projeto específico pelo seu ID único. A resposta traz ETag e Last-Modified; com `If-None-Match` ou `If-Modified-Since`, retorna 304 sem corpo se o projeto não mudou. Requer autenticação de qualquer usuário válido."
 )
-async def get_project(project_id: uuid.UUID, db: AsyncSession = Depends(get_db), current_user: User = Depends(security.allow_all_authenticated)):
-    project = await ProjectRepository(db).get_by_id(project_id)
+async def get_project(project_id: uuid.UUID, request: Request, response: Response, db: AsyncSession = Depends(get_db), current_user: User = Depends(security.allow_all_authenticated)):
+    repo = ProjectRepository(db)
+    # Só a versão é lida antes de decidir; o projeto e seus relacionamentos são carregados apenas se mudou
+    found, updated_at = await repo.get_version(project_id)
+    if not found:
+        raise HTTPException(status_code=404, detail="Project not found")
+    validators = Validators.for_resource("project", project_id, updated_at)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    project = await repo.get_by_id(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
+    Validators.for_resource("project", project_id, project.updatedAt).apply(response)
     return project
 
 
@@ -61,15 +133,16 @@ async def get_project(project_id: uuid.UUID, db: AsyncSession = Depends(get_db),
 )
 async def create_project(p: ProjectCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(security.allow_managers_and_admins)):
     repo = ProjectRepository(db)
-    new_project = await repo.create(p)
-    
-    # Registrar log de auditoria para criação de projeto
-    await audit_service.create_audit_log(
-        db, 
-        user=current_user, 
-        action="PROJECT_CREATED", 
-        details={"project_id": str(new_project.id), "project_name": new_project.name}
-    )
+    async with UnitOfWork(db):
+        new_project = await repo.create(p)
+        
+        # Registrar log de auditoria para criação de projeto
+        await audit_service.create_audit_log(
+            db, 
+            user=current_user, 
+            action="PROJECT_CREATED", 
+            details={"project_id": str(new_project.id), "project_name": new_project.name}
+        )
     
     return new_project
 
@@ -84,37 +157,40 @@ async def update_project(p_id: uuid.UUID, p: ProjectUpdate, db: AsyncSession = D
     current_project = await project_repo.get_by_id(p_id)
     if not current_project:
         raise HTTPException(status_code=404, detail="Project not found")
+    original_project_manager_id = current_project.project_manager_id
+    original_technical_lead_id = current_project.technical_lead_id
     
-    # Atualizar o projeto
-    proj = await project_repo.update(p_id, p)
-    if not proj:
-        raise HTTPException(status_code=404, detail="Project not found")
-    
-    # Registrar log de auditoria para atualização de projeto
-    await audit_service.create_audit_log(
-        db, 
-        user=current_user, 
-        action="PROJECT_UPDATED", 
-        details={"project_id": str(p_id), "project_name": proj.name}
-    )
-    
-    # Verificar se houve mudança no Project Manager (GP)
-    if p.project_manager_id and p.project_manager_id != current_project.project_manager_id:
-        await create_notification(
-            db=db,
-            user_id=p.project_manager_id,
-            message=f"Você foi designado como Gerente de Projeto (GP) do projeto '{proj.name}'",
-            link=f"/projects/{proj.id}"
-        )
-    
-    # Verificar se houve mudança no Technical Lead (LT)
-    if p.technical_lead_id and p.technical_lead_id != current_project.technical_lead_id:
-        await create_notification(
-            db=db,
-            user_id=p.technical_lead_id,
-            message=f"Você foi designado como Líder Técnico (LT) do projeto '{proj.name}'",
-            link=f"/projects/{proj.id}"
+    # Atualização, auditoria e notificações são gravadas em uma única transação
+    async with UnitOfWork(db):
+        proj = await project_repo.update(p_id, p)
+        if not proj:
+            raise HTTPException(status_code=404, detail="Project not found")
+        
+        # Registrar log de auditoria para atualização de projeto
+        await audit_service.create_audit_log(
+            db, 
+            user=current_user, 
+            action="PROJECT_UPDATED", 
+            details={"project_id": str(p_id), "project_name": proj.name}
         )
+        
+        # Verificar se houve mudança no Project Manager (GP)
+        if p.project_manager_id and p.project_manager_id != original_project_manager_id:
+            await create_notification(
+                db=db,
+                user_id=p.project_manager_id,
+                message=f"Você foi designado como Gerente de Projeto (GP) do projeto '{proj.name}'",
+                link=f"/projects/{proj.id}"
+            )
+        
+        # Verificar se houve mudança no Technical Lead (LT)
+        if p.technical_lead_id and p.technical_lead_id != original_technical_lead_id:
+            await create_notification(
+                db=db,
+                user_id=p.technical_lead_id,
+                message=f"Você foi designado como Líder Técnico (LT) do projeto '{proj.name}'",
+                link=f"/projects/{proj.id}"
+            )
     
     return proj
 
@@ -129,17 +205,18 @@ async def delete_project(p_id: uuid.UUID, db: AsyncSession = Depends(get_db), cu
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    # Registrar log de auditoria antes de deletar o projeto
-    await audit_service.create_audit_log(
-        db, 
-        user=current_user, 
-        action="PROJECT_DELETED", 
-        details={"project_id": str(p_id), "project_name": project.name}
-    )
-    
-    deleted = await project_repo.delete(p_id)
-    if not deleted:
-        raise HTTPException(status_code=404, detail="Project not found")
+    async with UnitOfWork(db):
+        # Registrar log de auditoria antes de deletar o projeto
+        await audit_service.create_audit_log(
+            db, 
+            user=current_user, 
+            action="PROJECT_DELETED", 
+            details={"project_id": str(p_id), "project_name": project.name}
+        )
+        
+        deleted = await project_repo.delete(p_id)
+        if not deleted:
+            raise HTTPException(status_code=404, detail="Project not found")
 
 
 @router.post("/{project_id}/advance-phase", response_model=schemas.ProjectRead,
@@ -161,30 +238,43 @@ async def advance_project_phase(
     # Busca os documentos que serão usados na validação
     documents = await doc_repo.get_by_project(project_id)
     workflow_service = ProjectWorkflowService()
+    # Lida antes da transação: após o rollback os atributos do projeto expiram
+    current_phase = project.phase
 
     try:
-        # Chama o serviço completo, que agora pode lançar uma exceção
-        updated_project = workflow_service.advance_phase(project, documents)
-        
-        # Se a validação passar, o serviço modifica o objeto. Agora, salvamos.
-        result = await project_repo.update(project_id, schemas.ProjectUpdate(phase=updated_project.phase))
-        
-        # Registrar log de auditoria para avanço de fase
-        await audit_service.create_audit_log(
-            db, 
-            user=current_user, 
-            action="PROJECT_PHASE_ADVANCED", 
-            details={
-                "project_id": str(project_id), 
-                "project_name": project.name,
-                "old_phase": project.phase.value,
-                "new_phase": updated_project.phase.value
-            }
-        )
+        async with UnitOfWork(db):
+            # Chama o serviço completo, que agora pode lançar uma exceção
+            updated_project = workflow_service.advance_phase(project, documents)
+            
+            # Se a validação passar, o serviço modifica o objeto. Agora, salvamos.
+            result = await project_repo.update(project_id, schemas.ProjectUpdate(phase=updated_project.phase))
+            
+            # Registrar log de auditoria para avanço de fase
+            advanced_at = datetime.utcnow()
+            log_entry = await audit_service.create_audit_log(
+                db, 
+                user=current_user, 
+                action="PROJECT_PHASE_ADVANCED", 
+                details={
+                    "project_id": str(project_id), 
+                    "project_name": project.name,
+                    # O serviço altera o projeto em memória: a fase anterior é a lida antes
+                    "old_phase": current_phase.value,
+                    "new_phase": updated_project.phase.value
+                }
+            )
+            log_entry.timestamp = advanced_at
+
+            # Rollup de tempo por fase (o log de auditoria não é consultado pelo analytics)
+            if updated_project.phase != current_phase:
+                await PhaseIntervalRepository(db).record_advance(
+                    project_id, current_phase, updated_project.phase, advanced_at, project.createdAt
+                )
         
         return result
 
     except QualityGateNotPassedError as e:
+        QUALITY_GATE_REJECTIONS.inc(phase=current_phase.value)
         # Se o Quality Gate falhar, retorna um erro 400 com os detalhes
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1,42 +1,135 @@
 import uuid
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.application import schemas
-from project_management_api.domain.models import User
+from project_management_api.domain.models import User, Task, TaskStatus, TaskPriority
 from project_management_api.infrastructure.api import security
-from project_management_api.infrastructure.repositories.task_repository import TaskRepository
+from project_management_api.infrastructure.api.fieldsets import Fieldset, FieldSelection
+from project_management_api.infrastructure.api import serialization
+from project_management_api.infrastructure.api.exports import ExportFormat, export_response
+from project_management_api.infrastructure.api.conditional import Validators
+from project_management_api.infrastructure.api.dependencies import set_cursor_headers
+from project_management_api.infrastructure.repositories.task_repository import TaskRepository, TASK_SORT_FIELDS, TASK_DEFAULT_SORT
+from project_management_api.infrastructure.repositories.pagination import InvalidCursorError, InvalidSortError, parse_sort, sort_field_names
 from project_management_api.application.services.notification_service import create_notification
 
 router = APIRouter(prefix="/api/projects/{project_id}/tasks", tags=["Tasks"])
 
+TASK_FIELDS = Fieldset(
+    Task, schemas.TaskFields,
+    relationships={"assigned_to": Task.assigned_to},
+    nested_schemas={"assigned_to": schemas.UserInTask},
+)
+TASK_SERIALIZER = serialization.ModelSerializer(schemas.TaskRead)
+
+
+def task_filters(
+    status: Optional[List[TaskStatus]] = Query(None, description="Filtrar por status (pode repetir o parâmetro)"),
+    priority: Optional[List[TaskPriority]] = Query(None, description="Filtrar por prioridade (pode repetir o parâmetro)"),
+    assigned_to_id: Optional[uuid.UUID] = Query(None, description="Filtrar pelo responsável"),
+    due_from: Optional[date] = Query(None, description="Prazo a partir de (inclusive)"),
+    due_to: Optional[date] = Query(None, description="Prazo até (inclusive)"),
+    q: Optional[str] = Query(None, min_length=1, description="Busca por texto no título e na descrição"),
+) -> Dict[str, Any]:
+    """Filtros comuns à listagem e à exportação de tarefas."""
+    return {
+        "status": status, "priority": priority, "assigned_to_id": assigned_to_id,
+        "due_from": due_from, "due_to": due_to, "q": q,
+    }
 
-@router.get("/", response_model=List[schemas.TaskRead],
+
+@router.get("/", response_model=Union[List[schemas.TaskRead], List[schemas.TaskFields]],
+    response_model_exclude_unset=True,
     summary="Lista Tarefas do Projeto",
-    description="Retorna todas as tarefas associadas a um projeto específico. Requer autenticação de qualquer usuário válido."
+    description="Retorna as tarefas de um projeto, com filtros por status, prioridade, responsável, intervalo de prazo e texto, ordenação por múltiplas chaves (`sort=-priority,dueDate`) e paginação por cursor: o cursor da próxima página vem no cabeçalho `X-Next-Cursor`. Com `fields` e/ou `include`, retorna apenas os campos e relacionamentos pedidos (ex.: quadros kanban). A resposta traz um ETag da coleção; com `If-None-Match`, retorna 304 sem corpo se nada mudou. Requer autenticação de qualquer usuário válido."
 )
 async def get_tasks_for_project(
     project_id: uuid.UUID,
+    request: Request,
+    response: Response,
+    filters: Dict[str, Any] = Depends(task_filters),
+    sort: Optional[str] = Query(None, description=f"Ordenação, separada por vírgula; prefixo '-' para decrescente. Campos: {', '.join(TASK_SORT_FIELDS)}"),
+    cursor: Optional[str] = Query(None, description="Cursor opaco dos cabeçalhos X-Next-Cursor/X-Prev-Cursor"),
+    limit: int = Query(100, gt=0, le=500, description="Quantidade máxima de tarefas por página"),
+    selection: Optional[FieldSelection] = Depends(TASK_FIELDS.query),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(security.allow_all_authenticated)
+):
+    repo = TaskRepository(db)
+    validators = Validators.for_collection("tasks", request, *await repo.search_version(project_id, **filters))
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+
+    try:
+        options = None
+        if selection:
+            # A ordenação é validada antes: os campos dela entram no load_only
+            parse_sort(sort, TASK_SORT_FIELDS, TASK_DEFAULT_SORT)
+            options = TASK_FIELDS.load_options(selection, extra_columns=sort_field_names(sort, TASK_DEFAULT_SORT))
+        tasks, next_cursor, prev_cursor = await repo.search_by_project(
+            project_id, sort=sort, cursor=cursor, limit=limit, options=options, **filters
+        )
+    except (InvalidCursorError, InvalidSortError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not selection and serialization.enabled():
+        json_response = serialization.list_response(TASK_SERIALIZER, tasks)
+        set_cursor_headers(json_response, next_cursor, prev_cursor)
+        validators.apply(json_response)
+        return json_response
+    set_cursor_headers(response, next_cursor, prev_cursor)
+    validators.apply(response)
+    if not selection:
+        return tasks
+    return [TASK_FIELDS.serialize(task, selection) for task in tasks]
+
+
+@router.get("/export",
+    summary="Exporta Tarefas do Projeto",
+    description="Exporta todas as tarefas do projeto que atendem aos filtros, em NDJSON (um objeto por linha) ou CSV. As linhas são lidas por cursor do servidor e enviadas em streaming conforme chegam, com memória constante. Aceita os mesmos filtros e a mesma ordenação da listagem. Requer autenticação de qualquer usuário válido."
+)
+async def export_tasks_for_project(
+    project_id: uuid.UUID,
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="Formato da exportação: ndjson ou csv"),
+    filters: Dict[str, Any] = Depends(task_filters),
+    sort: Optional[str] = Query(None, description=f"Ordenação, separada por vírgula; prefixo '-' para decrescente. Campos: {', '.join(TASK_SORT_FIELDS)}"),
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.allow_all_authenticated)
 ):
-    return await TaskRepository(db).get_by_project(project_id)
+    try:
+        batches = TaskRepository(db).stream_by_project(project_id, sort=sort, **filters)
+    except InvalidSortError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return export_response(db, batches, TASK_SERIALIZER, format, filename=f"tasks-{project_id}")
 
 
 @router.get("/{task_id}", response_model=schemas.TaskRead,
     summary="Busca Tarefa por ID",
-    description="Retorna os detalhes de uma tarefa específica dentro de um projeto. Valida se a tarefa pertence ao projeto informado. Requer autenticação de qualquer usuário válido."
+    description="Retorna os detalhes de uma tarefa específica dentro de um projeto. Valida se a tarefa pertence ao projeto informado. A resposta traz ETag e Last-Modified; com `If-None-Match` ou `If-Modified-Since`, retorna 304 sem corpo se a tarefa não mudou. Requer autenticação de qualquer usuário válido."
 )
 async def get_task(
     project_id: uuid.UUID,
     task_id: uuid.UUID,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.allow_all_authenticated)
 ):
-    task = await TaskRepository(db).get_by_id(task_id)
-    if not task or task.project_id != project_id:
+    repo = TaskRepository(db)
+    # Só a versão é lida antes de decidir; a tarefa e o responsável são carregados apenas se mudou
+    found, updated_at = await repo.get_version(task_id, project_id)
+    if not found:
         raise HTTPException(status_code=404, detail="Task not found in this project")
+    validators = Validators.for_resource("task", task_id, updated_at)
+    if validators.is_not_modified(request):
+        return validators.not_modified()
+    task = await repo.get_by_id(str(task_id))
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found in this project")
+    Validators.for_resource("task", task_id, task.updatedAt).apply(response)
     return task
 
 
@@ -50,16 +143,17 @@ async def create_task(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(security.allow_all_authenticated)
 ):
-    created_task = await TaskRepository(db).create_for_project(project_id, task)
-    
-    # Criar notificação se um usuário foi atribuído à tarefa
-    if task.assigned_to_id:
-        await create_notification(
-            db=db,
-            user_id=task.assigned_to_id,
-            message=f"Você foi atribuído à tarefa '{created_task.title}'",
-            link=f"/projects/{project_id}/tasks/{created_task.id}"
-        )
+    async with UnitOfWork(db):
+        created_task = await TaskRepository(db).create_for_project(project_id, task)
+        
+        # Criar notificação se um usuário foi atribuído à tarefa
+        if task.assigned_to_id:
+            await create_notification(
+                db=db,
+                user_id=task.assigned_to_id,
+                message=f"Você foi atribuído à tarefa '{created_task.title}'",
+                link=f"/projects/{project_id}/tasks/{created_task.id}"
+            )
     
     return created_task
 
@@ -84,16 +178,17 @@ async def update_task(
     # Salvar o assigned_to_id original antes da atualização
     original_assigned_to_id = task_to_update.assigned_to_id
     
-    updated_task = await repo.update(task_id, task)
-    
-    # Criar notificação se houve mudança na atribuição de usuário
-    if task.assigned_to_id and task.assigned_to_id != original_assigned_to_id:
-        await create_notification(
-            db=db,
-            user_id=task.assigned_to_id,
-            message=f"Você foi atribuído à tarefa '{updated_task.title}'",
-            link=f"/projects/{project_id}/tasks/{updated_task.id}"
-        )
+    async with UnitOfWork(db):
+        updated_task = await repo.update(task_id, task)
+        
+        # Criar notificação se houve mudança na atribuição de usuário
+        if task.assigned_to_id and task.assigned_to_id != original_assigned_to_id:
+            await create_notification(
+                db=db,
+                user_id=task.assigned_to_id,
+                message=f"Você foi atribuído à tarefa '{updated_task.title}'",
+                link=f"/projects/{project_id}/tasks/{updated_task.id}"
+            )
     
     return updated_task
 
@@ -114,4 +209,5 @@ async def delete_task(
     if not task_to_delete or task_to_delete.project_id != project_id:
         raise HTTPException(status_code=404, detail="Task not found in this project")
 
-    await repo.delete(task_id)
\ No newline at end of file
+    async with UnitOfWork(db):
+        await repo.delete(task_id)
\ No newline at end of file
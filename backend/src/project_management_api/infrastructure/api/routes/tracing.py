@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from project_management_api.infrastructure.api import security
+from project_management_api.application import schemas
+from project_management_api.domain.models import User
+from project_management_api.infrastructure.tracing import trace_sampler
+
+router = APIRouter(prefix="/api/admin/tracing", tags=["Admin: Tracing"])
+
+
+@router.get("/sampling", response_model=schemas.TraceSamplingRead,
+    summary="Taxas de Amostragem de Traces",
+    description="Retorna as taxas de amostragem de traces em uso e as rotas com rastreamento integral ativado por lentidão. Requer permissão de ADMIN."
+)
+async def get_trace_sampling(admin: User = Depends(security.get_current_admin_user)):
+    return trace_sampler.settings()
+
+
+@router.put("/sampling", response_model=schemas.TraceSamplingRead,
+    summary="Ajusta Amostragem de Traces",
+    description="Altera a taxa base e/ou as taxas por rota sem reiniciar a aplicação; todos os workers aplicam a mudança em até um segundo. Requer permissão de ADMIN."
+)
+async def update_trace_sampling(
+    update: schemas.TraceSamplingUpdate,
+    admin: User = Depends(security.get_current_admin_user)
+):
+    try:
+        return trace_sampler.configure(base_rate=update.base_rate, route_rates=update.route_rates)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid route_rates, expected 'prefix=rate,...'")
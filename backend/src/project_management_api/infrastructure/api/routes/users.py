@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from project_management_api.infrastructure.db.database import get_db
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
 from project_management_api.infrastructure.api import security
 from project_management_api.application import schemas
 from project_management_api.domain.models import User
@@ -18,11 +19,10 @@ async def create_user(user: schemas.UserCreate, db: AsyncSession = Depends(get_d
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    hashed_password = security.get_password_hash(user.password)
+    hashed_password = await security.get_password_hash_async(user.password)
     db_user = User(email=user.email, hashed_password=hashed_password, role=user.role)
-    db.add(db_user)
-    await db.commit()
-    await db.refresh(db_user)
+    async with UnitOfWork(db):
+        db.add(db_user)
     return db_user
 
 @router.get("/me", response_model=schemas.UserRead,
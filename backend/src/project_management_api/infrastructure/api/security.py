@@ -1,7 +1,11 @@
 # src/project_management_api/infrastructure/api/security.py
 import os
-from datetime import datetime, timedelta
-from typing import Optional, List
+import time
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict
 from jose import JWTError, jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -12,6 +16,10 @@ from project_management_api.application.schemas import TokenData
 from project_management_api.domain.models import User, UserRole
 from project_management_api.infrastructure.db.database import get_db
 from project_management_api.infrastructure.repositories.user_repository import UserRepository
+from project_management_api.infrastructure.api.principal_cache import principal_cache
+from project_management_api.infrastructure.api.revocation import revocation_filter
+from project_management_api.infrastructure.api.request_context import set_request_user
+from project_management_api.infrastructure.metrics import AUTH_FAILURES
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -22,10 +30,55 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+
+# O bcrypt é propositalmente lento (~100-300 ms). Nos handlers assíncronos ele roda
+# em um executor dedicado, com concorrência limitada, para não travar o event loop.
+PASSWORD_HASH_CONCURRENCY = int(os.getenv("PASSWORD_HASH_CONCURRENCY", "2"))
+_password_executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_CONCURRENCY, thread_name_prefix="password-hash")
+_password_stats_lock = threading.Lock()
+_password_stats = {"queued": 0, "in_flight": 0, "completed": 0, "max_queue_depth": 0}
+
+
+def _run_password_job(fn, *args):
+    with _password_stats_lock:
+        _password_stats["queued"] -= 1
+        _password_stats["in_flight"] += 1
+    try:
+        return fn(*args)
+    finally:
+        with _password_stats_lock:
+            _password_stats["in_flight"] -= 1
+            _password_stats["completed"] += 1
+
+
+async def _submit_password_job(fn, *args):
+    with _password_stats_lock:
+        _password_stats["queued"] += 1
+        _password_stats["max_queue_depth"] = max(_password_stats["max_queue_depth"], _password_stats["queued"])
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, _run_password_job, fn, *args)
+
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await _submit_password_job(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password) -> str:
+    return await _submit_password_job(get_password_hash, password)
+
+
+def password_hash_stats() -> Dict[str, int]:
+    """Retorna a profundidade da fila e o uso do executor de hashing de senhas."""
+    with _password_stats_lock:
+        return {"concurrency": PASSWORD_HASH_CONCURRENCY, **_password_stats}
+
 # JWT Configuration
 SECRET_KEY = os.getenv("SECRET_KEY", "a_super_secret_key_for_dev")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Quando ativo, o token carrega id e papel do usuário como claims assinadas,
+# e a autorização dispensa o banco de dados salvo em caso de revogação.
+JWT_ROLE_CLAIMS = os.getenv("JWT_ROLE_CLAIMS", "false").lower() == "true"
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
 
@@ -35,7 +88,43 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
+def build_token_claims(user: User) -> dict:
+    """Monta as claims do token de acesso para o usuário autenticado."""
+    claims = {"sub": user.email}
+    if JWT_ROLE_CLAIMS:
+        claims.update({"uid": str(user.id), "role": user.role.value, "iat": round(time.time(), 3)})
+    return claims
+
+async def _get_user_from_role_claims(payload: dict, db: AsyncSession, credentials_exception: HTTPException) -> User:
+    try:
+        role = UserRole(payload["role"])
+    except ValueError:
+        raise credentials_exception
+    user_id = payload["uid"]
+    issued_at = payload.get("iat", 0)
+
+    await revocation_filter.refresh_if_stale(db)
+    if not revocation_filter.might_be_revoked(user_id, issued_at):
+        # Principal montado apenas a partir das claims assinadas, sem ir ao banco
+        return User(id=user_id, email=payload["sub"], role=role)
+
+    user = await UserRepository(db).get_by_id(user_id)
+    if user is None or (user.tokens_valid_after and issued_at < user.tokens_valid_after.replace(tzinfo=timezone.utc).timestamp()):
+        raise credentials_exception
+    return user
+
 async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+    try:
+        user = await _authenticate(token, db)
+    except HTTPException:
+        AUTH_FAILURES.inc(reason="invalid_token")
+        raise
+    # Identifica o usuário no log de acesso da requisição
+    set_request_user(user.id)
+    return user
+
+
+async def _authenticate(token: str, db: AsyncSession):
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -49,10 +138,22 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession
         token_data = TokenData(email=email)
     except JWTError:
         raise credentials_exception
-    
+
+    if JWT_ROLE_CLAIMS and "uid" in payload and "role" in payload:
+        return await _get_user_from_role_claims(payload, db, credentials_exception)
+
+    # O token já foi validado acima; o cache só evita a consulta ao usuário
+    user = principal_cache.get(token)
+    if user is not None:
+        return user
+
     user = await UserRepository(db).get_by_email(email=token_data.email)
     if user is None:
         raise credentials_exception
+
+    # Nunca manter o principal em cache além da expiração do próprio token
+    exp = payload.get("exp")
+    principal_cache.set(token, user, ttl_seconds=exp - time.time() if exp else None)
     return user
 
 
@@ -63,6 +164,7 @@ class RoleChecker:
 
     def __call__(self, current_user: User = Depends(get_current_user)):
         if current_user.role not in self.allowed_roles:
+            AUTH_FAILURES.inc(reason="forbidden")
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="The user does not have enough privileges for this action"
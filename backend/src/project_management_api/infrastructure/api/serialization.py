@@ -0,0 +1,116 @@
+# src/project_management_api/infrastructure/api/serialization.py
+import os
+import typing
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Type
+
+import pydantic_core
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson vem com fastapi[all], mas é opcional
+    orjson = None
+
+# fast: entidades ORM confiáveis viram dicts sem validação e são codificadas com orjson
+# validated: validação pelos TypeAdapters pré-compilados e JSON gerado pelo pydantic-core
+# default: caminho padrão do FastAPI (response_model + jsonable_encoder)
+RESPONSE_SERIALIZATION = os.getenv("RESPONSE_SERIALIZATION", "fast").lower()
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(Response):
+    """Resposta JSON que aceita o corpo já serializado (bytes) ou qualquer valor suportado por `dumps`."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+def _unwrap_optional(annotation: Any) -> Any:
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+class ModelSerializer:
+    """
+    Serializador de respostas pré-compilado para um schema de leitura.
+
+    No modo `fast`, os campos do schema são lidos diretamente das entidades ORM
+    (já validadas na escrita) e o resultado vai direto para o orjson, sem passar
+    pela validação do Pydantic nem pelo `jsonable_encoder`. No modo `validated`,
+    usa um `TypeAdapter` criado uma única vez por schema.
+    """
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+        self._fields = [(name, self._converter(field.annotation)) for name, field in schema.model_fields.items()]
+        # Campos que são um único modelo aninhado (ex.: project_manager)
+        self.nested_models = {
+            name: _unwrap_optional(field.annotation)
+            for name, field in schema.model_fields.items() if _is_model(_unwrap_optional(field.annotation))
+        }
+        self._list_adapter = TypeAdapter(List[schema])
+
+    @classmethod
+    def _converter(cls, annotation: Any) -> Optional[Callable[[Any], Any]]:
+        annotation = _unwrap_optional(annotation)
+        if _is_model(annotation):
+            nested = cls(annotation)
+            return lambda value: nested.to_dict(value) if value is not None else None
+        if typing.get_origin(annotation) in (list, List):
+            (item_type,) = typing.get_args(annotation) or (Any,)
+            if _is_model(_unwrap_optional(item_type)):
+                nested = cls(_unwrap_optional(item_type))
+                return lambda value: [nested.to_dict(item) for item in value] if value is not None else None
+        return None
+
+    def to_dict(self, obj: Any) -> Dict[str, Any]:
+        return {
+            name: convert(getattr(obj, name)) if convert else getattr(obj, name)
+            for name, convert in self._fields
+        }
+
+    def to_list(self, items: Iterable[Any]) -> List[Dict[str, Any]]:
+        to_dict = self.to_dict
+        return [to_dict(item) for item in items]
+
+    def payload(self, items: Iterable[Any]) -> List[Any]:
+        """Itens prontos para codificação conforme o modo configurado."""
+        if RESPONSE_SERIALIZATION == "validated":
+            return self._list_adapter.validate_python(list(items), from_attributes=True)
+        return self.to_list(items)
+
+
+def encode(content: Any) -> bytes:
+    if RESPONSE_SERIALIZATION == "validated":
+        return pydantic_core.to_json(content)
+    return dumps(content)
+
+
+def enabled() -> bool:
+    """Indica se as rotas de leitura devem contornar o caminho padrão do FastAPI."""
+    return RESPONSE_SERIALIZATION in ("fast", "validated")
+
+
+def list_response(serializer: ModelSerializer, items: Iterable[Any], headers: Optional[Mapping[str, str]] = None) -> Response:
+    return FastJSONResponse(encode(serializer.payload(items)), headers=headers)
+
+
+def page_response(serializer: ModelSerializer, items: Iterable[Any], **page: Any) -> Response:
+    """Resposta no formato de `PaginatedResponse` (total, page, size, pages, cursores) com os itens serializados."""
+    return FastJSONResponse(encode({**page, "items": serializer.payload(items)}))
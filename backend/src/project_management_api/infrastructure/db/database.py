@@ -1,15 +1,215 @@
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+import hmac
+import time
+import hashlib
+import itertools
+from typing import Any, Dict, List, Optional
+from fastapi import Request, Response
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, AsyncEngine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from dotenv import load_dotenv
 
+from project_management_api.infrastructure.cache import TTLCache
+from project_management_api.infrastructure.db.unit_of_work import after_commit
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
-engine = create_async_engine(DATABASE_URL, echo=True)
+# Réplicas de leitura opcionais, separadas por vírgula
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+# Janela em que as leituras de um cliente ficam presas ao primário após uma escrita
+READ_YOUR_WRITES_SECONDS = float(os.getenv("READ_YOUR_WRITES_SECONDS", "5"))
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+# O token de consistência é assinado com a mesma chave dos JWTs (security.SECRET_KEY)
+CONSISTENCY_TOKEN_SECRET = os.getenv("SECRET_KEY", "a_super_secret_key_for_dev")
+# Tolerância à diferença de relógio entre os workers na validade do token
+CONSISTENCY_TOKEN_CLOCK_SKEW_SECONDS = 1.0
+
+# Configuração do pool de conexões (ignorada para SQLite, que usa pools próprios)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+# Cache de SQL compilado do SQLAlchemy e cache de prepared statements do asyncpg
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", "500"))
+DB_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DB_PREPARED_STATEMENT_CACHE_SIZE", "100"))
+# "false" (padrão), "true" (loga cada statement) ou "debug" (inclui as linhas retornadas)
+DB_ECHO = os.getenv("DB_ECHO", "false").lower()
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Pool de conexões que registra o tempo de espera por uma conexão e os timeouts."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        # Esperas que terminaram em timeout não são checkouts
+        self.checkouts += 1
+        return connection
+
+
+def _echo_setting():
+    if DB_ECHO == "debug":
+        return "debug"
+    return DB_ECHO == "true"
+
+
+def build_engine(url: str, **overrides: Any) -> AsyncEngine:
+    """Cria a engine assíncrona a partir das configurações de ambiente."""
+    options: Dict[str, Any] = {
+        "echo": _echo_setting(),
+        "query_cache_size": DB_STATEMENT_CACHE_SIZE,
+    }
+    parsed_url = make_url(url)
+    if parsed_url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT,
+            pool_recycle=DB_POOL_RECYCLE,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+        if parsed_url.get_driver_name() == "asyncpg":
+            parsed_url = parsed_url.update_query_dict(
+                {"prepared_statement_cache_size": str(DB_PREPARED_STATEMENT_CACHE_SIZE)}
+            )
+    options.update(overrides)
+    return create_async_engine(parsed_url, **options)
+
+
+def get_pool_stats(target: AsyncEngine = None) -> Dict[str, Any]:
+    """Retorna estatísticas do pool de conexões da engine informada (padrão: principal)."""
+    pool = (target or engine).pool
+    stats: Dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            checked_in=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, InstrumentedAsyncQueuePool):
+        stats.update(
+            checkouts=pool.checkouts,
+            timeouts=pool.timeouts,
+            total_wait_ms=round(pool.total_wait_seconds * 1000, 3),
+            max_wait_ms=round(pool.max_wait_seconds * 1000, 3),
+        )
+    return stats
+
+
+class DatabaseRouter:
+    """
+    Escolhe a sessão de cada requisição: leituras (GET/HEAD/OPTIONS) vão para uma
+    réplica, escritas vão para o primário.
+
+    Após uma escrita confirmada (commit), as leituras do mesmo cliente ficam
+    presas ao primário por `pin_seconds`. O cliente é identificado pelo
+    cabeçalho Authorization neste worker; o cabeçalho X-Consistency-Token
+    devolvido na resposta (validade assinada com HMAC) estende a garantia
+    entre workers quando o cliente o reenvia.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(self, primary: sessionmaker, replicas: Optional[List[sessionmaker]] = None, pin_seconds: float = READ_YOUR_WRITES_SECONDS,
+                 secret: str = CONSISTENCY_TOKEN_SECRET):
+        self.primary = primary
+        self.replicas = replicas or []
+        self.pin_seconds = pin_seconds
+        self._secret = secret.encode()
+        self._replica_cycle = itertools.cycle(self.replicas) if self.replicas else None
+        self._pins = TTLCache(max_entries=10000, ttl_seconds=pin_seconds)
+
+    @staticmethod
+    def _client_key(request: Request) -> Optional[str]:
+        authorization = request.headers.get("authorization")
+        if not authorization:
+            return None
+        return hashlib.sha256(authorization.encode()).hexdigest()[:32]
+
+    def _sign(self, expires: str) -> str:
+        return hmac.new(self._secret, expires.encode(), hashlib.sha256).hexdigest()
+
+    def consistency_token(self) -> str:
+        """Token `<validade>:<assinatura>` que prende as leituras ao primário até a validade."""
+        expires = f"{time.time() + self.pin_seconds:.3f}"
+        return f"{expires}:{self._sign(expires)}"
+
+    def _has_fresh_consistency_token(self, request: Request) -> bool:
+        token = request.headers.get(CONSISTENCY_TOKEN_HEADER)
+        if not token:
+            return False
+        expires, _, signature = token.partition(":")
+        if not hmac.compare_digest(signature, self._sign(expires)):
+            return False
+        try:
+            expires_at = float(expires)
+        except ValueError:
+            return False
+        # Validade além da janela de fixação não foi emitida por nós (ou é de outra configuração)
+        now = time.time()
+        return now < expires_at <= now + self.pin_seconds + CONSISTENCY_TOKEN_CLOCK_SKEW_SECONDS
+
+    def session_factory_for(self, request: Request) -> sessionmaker:
+        if not self.replicas or request.method not in self.SAFE_METHODS:
+            return self.primary
+
+        client_key = self._client_key(request)
+        if (client_key and self._pins.get(client_key)) or self._has_fresh_consistency_token(request):
+            return self.primary
+        return next(self._replica_cycle)
+
+    def pin_after_commit(self, session: AsyncSession, request: Request, response: Optional[Response] = None) -> None:
+        """
+        Prende as leituras do cliente ao primário quando a escrita da
+        requisição for confirmada; escritas que falham ou são desfeitas não
+        prendem o cliente.
+        """
+        if not self.replicas or request.method in self.SAFE_METHODS:
+            return
+        client_key = self._client_key(request)
+
+        async def pin() -> None:
+            if client_key:
+                self._pins.set(client_key, True)
+            if response is not None:
+                response.headers[CONSISTENCY_TOKEN_HEADER] = self.consistency_token()
+
+        after_commit(session, "read_your_writes", pin)
+
+
+engine = build_engine(DATABASE_URL)
 AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+replica_engines = [build_engine(url) for url in DATABASE_REPLICA_URLS]
+db_router = DatabaseRouter(
+    AsyncSessionLocal,
+    [sessionmaker(replica, class_=AsyncSession, expire_on_commit=False) for replica in replica_engines],
+)
 
 
-async def get_db():
-    async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+async def get_db(request: Request, response: Response):
+    async with db_router.session_factory_for(request)() as session:
+        db_router.pin_after_commit(session, request, response)
+        yield session
@@ -0,0 +1,97 @@
+# src/project_management_api/infrastructure/db/instrumentation.py
+import os
+import re
+import json
+import time
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Statements mais lentos que este limite são logados com seus parâmetros
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", "200"))
+# Quantas execuções do mesmo formato de statement em uma requisição indicam um N+1
+DB_N_PLUS_ONE_THRESHOLD = int(os.getenv("DB_N_PLUS_ONE_THRESHOLD", "5"))
+SLOWEST_STATEMENTS_KEPT = 3
+
+# Listas IN expandidas geram um statement diferente para cada quantidade de itens
+_IN_LIST_PATTERN = re.compile(r"\((?:\s*(?:\?|%s|\$\d+|:\w+)\s*,)+\s*(?:\?|%s|\$\d+|:\w+)\s*\)")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """Normaliza um statement para agrupar execuções que diferem apenas nos parâmetros."""
+    return _IN_LIST_PATTERN.sub("(?...)", _WHITESPACE_PATTERN.sub(" ", statement).strip())
+
+
+class QueryStats:
+    """Contadores de SQL de uma única requisição."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.slowest: List[Tuple[float, str]] = []
+        self.shapes: Counter = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.total_seconds += duration
+        self.shapes[statement_shape(statement)] += 1
+        if len(self.slowest) < SLOWEST_STATEMENTS_KEPT or duration > self.slowest[-1][0]:
+            self.slowest.append((duration, statement))
+            self.slowest.sort(key=lambda item: item[0], reverse=True)
+            del self.slowest[SLOWEST_STATEMENTS_KEPT:]
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_seconds * 1000, 3)
+
+    def repeated_shapes(self, threshold: int = DB_N_PLUS_ONE_THRESHOLD) -> List[Tuple[str, int]]:
+        return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.total_ms};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def begin_request_stats() -> QueryStats:
+    """Inicia a coleta para a requisição corrente (chamado pelo middleware)."""
+    stats = QueryStats()
+    _current_stats.set(stats)
+    return stats
+
+
+def current_request_stats() -> Optional[QueryStats]:
+    return _current_stats.get()
+
+
+def log_repeated_statements(stats: QueryStats, method: str, path: str) -> None:
+    """Sinaliza possíveis N+1: o mesmo formato de statement executado muitas vezes."""
+    for shape, n in stats.repeated_shapes():
+        logger.warning(json.dumps({"n_plus_one_suspect": shape, "executions": n, "method": method, "path": path}))
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_start_time = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context._query_start_time
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.record(statement, duration)
+    if duration * 1000 >= DB_SLOW_QUERY_MS:
+        logger.warning(json.dumps({
+            "slow_query_ms": round(duration * 1000, 3),
+            "statement": statement,
+            "parameters": repr(parameters),
+        }))
@@ -0,0 +1,46 @@
+# src/project_management_api/infrastructure/db/unit_of_work.py
+from typing import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Chave em `session.info` das ações pendentes até o commit
+_AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(session: AsyncSession, key: str, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Agenda `callback` para depois do commit da UnitOfWork (uma vez por chave).
+
+    Descartado se a transação for desfeita.
+    """
+    session.info.setdefault(_AFTER_COMMIT_KEY, {})[key] = callback
+
+
+class UnitOfWork:
+    """
+    Escopo transacional de uma operação de escrita.
+
+    Repositórios e serviços apenas adicionam/flusham alterações na sessão; o
+    commit acontece uma única vez ao sair do bloco, e qualquer exceção (inclusive
+    HTTPException) desfaz a transação inteira.
+
+    Uso:
+        async with UnitOfWork(db):
+            project = await ProjectRepository(db).update(...)
+            await audit_service.create_audit_log(db, ...)
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.session.commit()
+            for callback in self.session.info.pop(_AFTER_COMMIT_KEY, {}).values():
+                await callback()
+        else:
+            await self.session.rollback()
+            self.session.info.pop(_AFTER_COMMIT_KEY, None)
@@ -0,0 +1,370 @@
+# src/project_management_api/infrastructure/metrics.py
+"""
+Métricas no formato de texto do Prometheus, agregadas entre workers.
+
+Cada processo grava apenas no seu próprio arquivo mapeado em memória
+(`METRICS_DIR/<tipo>_<pid>.db`), então a coleta não usa locks: o event loop
+é o único escritor do arquivo do worker. A exposição lê os arquivos de todos
+os workers e soma os valores; gauges de workers que já terminaram são
+descartados, contadores e histogramas são mantidos para não parecerem
+reinícios. Na inicialização de cada worker, os arquivos de workers encerrados
+são consolidados (`Registry.compact`), então o diretório não cresce a cada
+reciclagem ou deploy.
+"""
+import os
+import mmap
+import fcntl
+import json
+import glob
+import struct
+import bisect
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# Diretório compartilhado pelos workers; arquivos de workers encerrados são consolidados
+# na inicialização. Por padrão, um diretório por processo mestre (os workers do uvicorn compartilham o pai)
+METRICS_DIR = os.getenv("METRICS_DIR") or os.path.join(tempfile.gettempdir(), f"project-management-metrics-{os.getppid()}")
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+
+_INITIAL_SIZE = 64 * 1024
+_HEADER = struct.Struct("i")      # bytes usados do arquivo
+_ENTRY_SIZE = struct.Struct("i")  # tamanho da chave
+_VALUE = struct.Struct("d")
+# Sufixo do arquivo que acumula contadores e histogramas de workers encerrados
+_ARCHIVE = "archive"
+
+
+class MmapStore:
+    """
+    Dicionário chave -> float persistido em um arquivo mapeado em memória.
+
+    Layout: [usados: i32][pad][entrada...], com cada entrada formada por
+    [tamanho da chave: i32][chave utf-8, alinhada em 8 bytes][valor: f64].
+    Novas chaves são gravadas por inteiro antes de o cabeçalho ser atualizado,
+    então leitores de outros processos nunca veem uma entrada pela metade.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "a+b")
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self._file.truncate(_INITIAL_SIZE)
+        self._capacity = os.fstat(self._file.fileno()).st_size
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+        self._positions: Dict[str, int] = {}
+        self._used = _HEADER.unpack_from(self._mmap, 0)[0] or 8
+        if self._used == 8:
+            _HEADER.pack_into(self._mmap, 0, self._used)
+        for key, _, position in _read_entries(self._mmap, self._used):
+            self._positions[key] = position
+
+    def _position(self, key: str) -> int:
+        position = self._positions.get(key)
+        if position is None:
+            position = self._append(key)
+        return position
+
+    def _append(self, key: str) -> int:
+        encoded = key.encode("utf-8")
+        padded = len(encoded) + (-(len(encoded) + _ENTRY_SIZE.size) % 8)
+        entry_size = _ENTRY_SIZE.size + padded + _VALUE.size
+        while self._used + entry_size > self._capacity:
+            self._grow()
+        offset = self._used
+        _ENTRY_SIZE.pack_into(self._mmap, offset, len(encoded))
+        self._mmap[offset + _ENTRY_SIZE.size:offset + _ENTRY_SIZE.size + len(encoded)] = encoded
+        position = offset + _ENTRY_SIZE.size + padded
+        _VALUE.pack_into(self._mmap, position, 0.0)
+        self._used += entry_size
+        _HEADER.pack_into(self._mmap, 0, self._used)
+        self._positions[key] = position
+        return position
+
+    def _grow(self) -> None:
+        self._capacity *= 2
+        self._mmap.close()
+        self._file.truncate(self._capacity)
+        self._mmap = mmap.mmap(self._file.fileno(), self._capacity)
+
+    def increment(self, key: str, amount: float = 1.0) -> None:
+        position = self._position(key)
+        _VALUE.pack_into(self._mmap, position, _VALUE.unpack_from(self._mmap, position)[0] + amount)
+
+    def set(self, key: str, value: float) -> None:
+        _VALUE.pack_into(self._mmap, self._position(key), value)
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+
+def _read_entries(buffer, used: int) -> Iterable[Tuple[str, float, int]]:
+    offset = 8
+    while offset < used:
+        length = _ENTRY_SIZE.unpack_from(buffer, offset)[0]
+        key = bytes(buffer[offset + _ENTRY_SIZE.size:offset + _ENTRY_SIZE.size + length]).decode("utf-8")
+        padded = length + (-(length + _ENTRY_SIZE.size) % 8)
+        position = offset + _ENTRY_SIZE.size + padded
+        yield key, _VALUE.unpack_from(buffer, position)[0], position
+        offset = position + _VALUE.size
+
+
+def read_store(path: str) -> List[Tuple[str, float]]:
+    """Lê todas as entradas de um arquivo de métricas (de qualquer processo)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < 8:
+        return []
+    used = _HEADER.unpack_from(data, 0)[0]
+    return [(key, value) for key, value, _ in _read_entries(data, min(used, len(data)))]
+
+
+def _key(name: str, labels: Dict[str, str]) -> str:
+    return json.dumps([name, sorted(labels.items())], separators=(",", ":"))
+
+
+# Limites em segundos, próximos aos padrões do Prometheus com mais resolução em APIs rápidas
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, registry: "Registry", name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        # Chaves serializadas por combinação de labels, montadas uma única vez
+        self._keys: Dict[Tuple[str, ...], object] = {}
+        registry.register(self)
+
+    def _series_key(self, suffix: str, labels: Dict[str, str]) -> str:
+        values = tuple(str(labels.get(name, "")) for name in self.label_names)
+        key = self._keys.get(values)
+        if key is None:
+            key = self._keys[values] = _key(self.name + suffix, dict(zip(self.label_names, values)))
+        return key
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self.registry.store("counter").increment(self._series_key("_total", labels), amount)
+
+
+class Gauge(Metric):
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        self.registry.store("gauge").increment(self._series_key("", labels), amount)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        self.registry.store("gauge").set(self._series_key("", labels), value)
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, registry: "Registry", name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        super().__init__(registry, name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_labels = [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+
+    def _histogram_keys(self, labels: Dict[str, str]) -> Tuple[List[str], str, str]:
+        values = tuple(str(labels.get(name, "")) for name in self.label_names)
+        keys = self._keys.get(values)
+        if keys is None:
+            series = dict(zip(self.label_names, values))
+            keys = self._keys[values] = (
+                [_key(self.name + "_bucket", {**series, "le": le}) for le in self._bucket_labels],
+                _key(self.name + "_count", series),
+                _key(self.name + "_sum", series),
+            )
+        return keys
+
+    def observe(self, value: float, **labels: str) -> None:
+        store = self.registry.store("histogram")
+        bucket_keys, count_key, sum_key = self._histogram_keys(labels)
+        # Cada observação incrementa só o seu bucket; a soma acumulada é feita na exposição
+        store.increment(bucket_keys[bisect.bisect_left(self.buckets, value)])
+        store.increment(count_key)
+        store.increment(sum_key, value)
+
+
+def _format_value(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Sequence[Tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Registry:
+    """Conjunto de métricas do processo e leitura agregada de todos os workers."""
+
+    def __init__(self, directory: str = METRICS_DIR):
+        self.directory = directory
+        self.metrics: Dict[str, Metric] = {}
+        self._stores: Dict[str, MmapStore] = {}
+        self._pid: Optional[int] = None
+
+    def register(self, metric: Metric) -> None:
+        self.metrics[metric.name] = metric
+
+    def store(self, kind: str) -> MmapStore:
+        # Após um fork, o filho abre seus próprios arquivos
+        if self._pid != os.getpid():
+            self._stores = {}
+            self._pid = os.getpid()
+            os.makedirs(self.directory, exist_ok=True)
+        store = self._stores.get(kind)
+        if store is None:
+            store = self._stores[kind] = MmapStore(os.path.join(self.directory, f"{kind}_{self._pid}.db"))
+        return store
+
+    @contextmanager
+    def _locked(self, operation: int) -> Iterator[None]:
+        """Lock do diretório: compartilhado na coleta, exclusivo na consolidação."""
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, ".lock"), "a") as lock:
+            fcntl.flock(lock, operation)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _files(self) -> Iterable[Tuple[str, str, str]]:
+        for path in glob.glob(os.path.join(self.directory, "*.db")):
+            kind, _, pid = os.path.basename(path)[:-3].rpartition("_")
+            yield path, kind, pid
+
+    def compact(self) -> int:
+        """
+        Consolida os arquivos de workers encerrados: gauges são apagados;
+        contadores e histogramas são somados em `<tipo>_archive.db` e apagados,
+        mantendo os totais sem reler um arquivo por worker que já existiu.
+        Retorna quantos arquivos foram removidos.
+        """
+        removed = 0
+        with self._locked(fcntl.LOCK_EX):
+            for path, kind, pid in list(self._files()):
+                if not pid.isdigit() or _pid_alive(int(pid)):
+                    continue
+                if kind != "gauge":
+                    archive = MmapStore(os.path.join(self.directory, f"{kind}_{_ARCHIVE}.db"))
+                    try:
+                        for key, value in read_store(path):
+                            archive.increment(key, value)
+                    finally:
+                        archive.close()
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def collect(self) -> Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float]:
+        """Soma os valores de todos os arquivos de métricas do diretório."""
+        totals: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = {}
+        # Uma consolidação concorrente não pode fazer um arquivo ser somado duas vezes
+        with self._locked(fcntl.LOCK_SH):
+            for path, kind, pid in self._files():
+                if kind == "gauge" and pid.isdigit() and not _pid_alive(int(pid)):
+                    continue
+                try:
+                    entries = read_store(path)
+                except FileNotFoundError:
+                    continue
+                for key, value in entries:
+                    name, labels = json.loads(key)
+                    sample = (name, tuple((label, label_value) for label, label_value in labels))
+                    totals[sample] = totals.get(sample, 0.0) + value
+        return totals
+
+    def exposition(self) -> str:
+        """Texto no formato de exposição do Prometheus (version=0.0.4)."""
+        samples = self.collect()
+        by_family: Dict[str, List[Tuple[str, Tuple[Tuple[str, str], ...], float]]] = {}
+        for (name, labels), value in samples.items():
+            for family in (name, name.rsplit("_", 1)[0]):
+                if family in self.metrics:
+                    by_family.setdefault(family, []).append((name, labels, value))
+                    break
+
+        lines = []
+        for family, metric in sorted(self.metrics.items()):
+            lines.append(f"# HELP {family} {metric.documentation}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            family_samples = sorted(by_family.get(family, []))
+            if isinstance(metric, Histogram):
+                lines.extend(self._histogram_lines(metric, family_samples))
+            else:
+                lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for name, labels, value in family_samples)
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _histogram_lines(metric: Histogram, samples) -> List[str]:
+        buckets: Dict[Tuple[Tuple[str, str], ...], Dict[str, float]] = {}
+        sums: Dict[Tuple[Tuple[str, str], ...], Dict[str, float]] = {}
+        for name, labels, value in samples:
+            if name.endswith("_bucket"):
+                series = tuple(label for label in labels if label[0] != "le")
+                le = next(label_value for label_name, label_value in labels if label_name == "le")
+                buckets.setdefault(series, {})[le] = value
+            else:
+                sums.setdefault(labels, {})[name[len(metric.name) + 1:]] = value
+        lines = []
+        for series in sorted(sums):
+            cumulative = 0.0
+            for le in metric._bucket_labels:
+                cumulative += buckets.get(series, {}).get(le, 0.0)
+                lines.append(f"{metric.name}_bucket{_format_labels(series + (('le', le),))} {_format_value(cumulative)}")
+            lines.append(f"{metric.name}_count{_format_labels(series)} {_format_value(sums[series].get('count', 0.0))}")
+            lines.append(f"{metric.name}_sum{_format_labels(series)} {_format_value(sums[series].get('sum', 0.0))}")
+        return lines
+
+
+registry = Registry()
+
+HTTP_REQUEST_DURATION = Histogram(
+    registry, "http_request_duration_seconds", "Duração das requisições HTTP por rota e status.",
+    ("method", "route", "status"),
+)
+HTTP_RESPONSE_SIZE = Histogram(
+    registry, "http_response_size_bytes", "Tamanho do corpo das respostas HTTP por rota.",
+    ("method", "route"), buckets=SIZE_BUCKETS,
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(registry, "http_requests_in_flight", "Requisições HTTP em andamento.")
+DB_POOL_CONNECTIONS = Gauge(
+    registry, "db_pool_connections", "Conexões do pool por estado (checked_out, checked_in, overflow, size), por worker.",
+    ("engine", "state", "pid"),
+)
+# Contadores sem `pid`: a série sobrevive à reciclagem dos workers em vez de criar uma nova por processo
+DB_POOL_CHECKOUTS = Counter(registry, "db_pool_checkouts", "Conexões obtidas do pool.", ("engine",))
+DB_POOL_TIMEOUTS = Counter(registry, "db_pool_timeouts", "Timeouts esperando uma conexão do pool.", ("engine",))
+AUTH_FAILURES = Counter(registry, "auth_failures", "Falhas de autenticação/autorização por motivo.", ("reason",))
+QUALITY_GATE_REJECTIONS = Counter(
+    registry, "quality_gate_rejections", "Avanços de fase recusados pelo quality gate, por fase.", ("phase",),
+)
@@ -0,0 +1,120 @@
+# src/project_management_api/infrastructure/overdue_job.py
+"""
+Job periódico de detecção de atrasos de projetos e tarefas.
+
+Roda dentro do processo da API (iniciado no lifespan do app). A cada execução,
+em lotes de OVERDUE_JOB_BATCH_SIZE e uma transação por lote:
+- marca `is_overdue` nos projetos/tarefas que passaram do prazo, com um
+  UPDATE ... RETURNING, e notifica o GP ou o responsável de cada um com um
+  único INSERT de múltiplas linhas;
+- desmarca os que deixaram de estar em atraso (prazo estendido, concluídos
+  ou alterados fora da API).
+
+Com vários workers, todos executam o job; o UPDATE condicional (e o SKIP
+LOCKED no PostgreSQL) garante que cada item seja marcado e notificado uma vez.
+"""
+import os
+import asyncio
+import logging
+from datetime import date
+from typing import Dict, Optional
+
+from sqlalchemy.orm import sessionmaker
+
+from project_management_api.infrastructure.db.database import AsyncSessionLocal
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
+from project_management_api.infrastructure.repositories.project_repository import ProjectRepository
+from project_management_api.infrastructure.repositories.task_repository import TaskRepository
+from project_management_api.infrastructure.repositories.notification_repository import NotificationRepository
+
+logger = logging.getLogger(__name__)
+
+OVERDUE_JOB_ENABLED = os.getenv("OVERDUE_JOB_ENABLED", "true").lower() == "true"
+OVERDUE_JOB_INTERVAL_SECONDS = float(os.getenv("OVERDUE_JOB_INTERVAL_SECONDS", "900"))
+OVERDUE_JOB_BATCH_SIZE = int(os.getenv("OVERDUE_JOB_BATCH_SIZE", "500"))
+
+
+async def _mark_projects(db, today: date, batch_size: int) -> int:
+    marked = await ProjectRepository(db).mark_overdue(today, batch_size)
+    await NotificationRepository(db).create_many([
+        {
+            "user_id": project_manager_id,
+            "message": f"O projeto '{name}' está em atraso: a data estimada de término já passou",
+            "link": f"/projects/{project_id}",
+        }
+        for project_id, name, project_manager_id in marked if project_manager_id
+    ])
+    return len(marked)
+
+
+async def _mark_tasks(db, today: date, batch_size: int) -> int:
+    marked = await TaskRepository(db).mark_overdue(today, batch_size)
+    await NotificationRepository(db).create_many([
+        {
+            "user_id": assigned_to_id,
+            "message": f"A tarefa '{title}' está em atraso: o prazo já passou",
+            "link": f"/projects/{project_id}/tasks/{task_id}",
+        }
+        for task_id, title, project_id, assigned_to_id in marked if assigned_to_id
+    ])
+    return len(marked)
+
+
+async def run_overdue_job(session_factory: sessionmaker = AsyncSessionLocal, today: Optional[date] = None,
+                          batch_size: int = OVERDUE_JOB_BATCH_SIZE) -> Dict[str, int]:
+    """Executa uma rodada completa do job; retorna quantos itens foram marcados e desmarcados."""
+    today = today or date.today()
+    steps = {
+        "projects_marked": lambda db: _mark_projects(db, today, batch_size),
+        "tasks_marked": lambda db: _mark_tasks(db, today, batch_size),
+        "projects_cleared": lambda db: ProjectRepository(db).clear_overdue(today, batch_size),
+        "tasks_cleared": lambda db: TaskRepository(db).clear_overdue(today, batch_size),
+    }
+    totals = {}
+    for name, step in steps.items():
+        totals[name] = 0
+        while True:
+            # Um lote por transação: bloqueios curtos e progresso preservado se o job for interrompido
+            async with session_factory() as db:
+                async with UnitOfWork(db):
+                    count = await step(db)
+            totals[name] += count
+            if count < batch_size:
+                break
+    return totals
+
+
+class OverdueJob:
+    """Executa `run_overdue_job` a cada `interval_seconds` em uma task do event loop."""
+
+    def __init__(self, interval_seconds: float = OVERDUE_JOB_INTERVAL_SECONDS, session_factory: sessionmaker = AsyncSessionLocal):
+        self.interval_seconds = interval_seconds
+        self.session_factory = session_factory
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                totals = await run_overdue_job(self.session_factory)
+                if any(totals.values()):
+                    logger.info("overdue job: %s", totals)
+            except Exception:
+                # Uma falha (ex.: banco indisponível) não derruba o agendamento
+                logger.exception("overdue job failed")
+            await asyncio.sleep(self.interval_seconds)
+
+
+overdue_job = OverdueJob()
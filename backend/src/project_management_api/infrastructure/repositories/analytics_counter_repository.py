@@ -0,0 +1,149 @@
+# src/project_management_api/infrastructure/repositories/analytics_counter_repository.py
+import enum
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, delete, func, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project_management_api.domain.models import AnalyticsCounter, Project, ProjectPhase, ProjectStatus, User
+
+
+class AnalyticsDimension(str, enum.Enum):
+    """Dimensões do resumo de projetos do dashboard."""
+    STATUS = "status"
+    PHASE = "phase"
+    PROJECT_MANAGER = "pm"
+    TECHNICAL_LEAD = "tl"
+    CLIENT = "client"
+
+
+# Coluna de `projects` que alimenta cada contador; GP/LT são contados por id
+# e o e-mail é resolvido na leitura
+DIMENSION_COLUMNS = {
+    AnalyticsDimension.STATUS: Project.status,
+    AnalyticsDimension.PHASE: Project.phase,
+    AnalyticsDimension.PROJECT_MANAGER: Project.project_manager_id,
+    AnalyticsDimension.TECHNICAL_LEAD: Project.technical_lead_id,
+    AnalyticsDimension.CLIENT: Project.client,
+}
+_USER_DIMENSIONS = (AnalyticsDimension.PROJECT_MANAGER, AnalyticsDimension.TECHNICAL_LEAD)
+_ENUMS = {AnalyticsDimension.STATUS: ProjectStatus, AnalyticsDimension.PHASE: ProjectPhase}
+
+CounterKey = Tuple[AnalyticsDimension, str]
+
+
+def _counter_value(value: Any) -> str:
+    if value is None:
+        return ""
+    # Enums são guardados pelo nome, como nas colunas SQLEnum
+    return value.name if isinstance(value, enum.Enum) else str(value)
+
+
+def project_counter_values(project: Any) -> Dict[AnalyticsDimension, str]:
+    """Chaves de contador de um projeto (instância ORM ou linha com as colunas das dimensões)."""
+    return {dimension: _counter_value(getattr(project, column.key)) for dimension, column in DIMENSION_COLUMNS.items()}
+
+
+class AnalyticsCounterRepository:
+    """
+    Contadores do dashboard mantidos incrementalmente.
+
+    As escritas em `projects` chamam `apply` com os valores antes/depois; os
+    deltas viram um único INSERT ... ON CONFLICT DO UPDATE que soma no banco,
+    então escritas concorrentes não se sobrescrevem. `verify` e `rebuild`
+    comparam com (e recalculam a partir de) uma varredura de `projects`.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(self, old: Optional[Mapping[AnalyticsDimension, str]],
+                    new: Optional[Mapping[AnalyticsDimension, str]]) -> None:
+        deltas: Counter = Counter()
+        for dimension, value in (old or {}).items():
+            deltas[(dimension, value)] -= 1
+        for dimension, value in (new or {}).items():
+            deltas[(dimension, value)] += 1
+        rows = [
+            {"dimension": dimension.value, "value": value, "count": delta}
+            for (dimension, value), delta in deltas.items() if delta
+        ]
+        if rows:
+            await self.db.execute(self._upsert(rows))
+
+    def _upsert(self, rows: List[Dict[str, Any]]):
+        dialect = postgresql if self.db.bind.dialect.name == "postgresql" else sqlite
+        statement = dialect.insert(AnalyticsCounter).values(rows)
+        return statement.on_conflict_do_update(
+            index_elements=[AnalyticsCounter.dimension, AnalyticsCounter.value],
+            set_={"count": AnalyticsCounter.count + statement.excluded.count},
+        )
+
+    async def counts(self, dimensions: Sequence[AnalyticsDimension]) -> Dict[AnalyticsDimension, List[Tuple[Any, int]]]:
+        """
+        Contagens por dimensão lidas dos contadores: status e fase como enums,
+        GP/LT pelo e-mail (None para projetos sem responsável), clientes pelo nome.
+        """
+        dimensions = list(dict.fromkeys(dimensions))
+        query = (
+            select(AnalyticsCounter.dimension, AnalyticsCounter.value, AnalyticsCounter.count, User.email)
+            .outerjoin(User, and_(
+                AnalyticsCounter.dimension.in_([dimension.value for dimension in _USER_DIMENSIONS]),
+                User.id == AnalyticsCounter.value,
+            ))
+            .where(AnalyticsCounter.dimension.in_([dimension.value for dimension in dimensions]), AnalyticsCounter.count > 0)
+            .order_by(AnalyticsCounter.dimension, AnalyticsCounter.count.desc(), AnalyticsCounter.value)
+        )
+        counts: Dict[AnalyticsDimension, List[Tuple[Any, int]]] = {dimension: [] for dimension in dimensions}
+        for dimension_value, value, count, email in (await self.db.execute(query)).all():
+            dimension = AnalyticsDimension(dimension_value)
+            if dimension in _USER_DIMENSIONS:
+                value = email if value else None
+            elif dimension in _ENUMS:
+                value = _ENUMS[dimension].__members__.get(value, value)
+            counts[dimension].append((value, count))
+        return counts
+
+    async def scan(self) -> Dict[CounterKey, int]:
+        """Contagens calculadas a partir de `projects` (uma varredura, agrupada pelas cinco colunas)."""
+        columns = list(DIMENSION_COLUMNS.values())
+        result = await self.db.execute(select(*columns, func.count(Project.id)).group_by(*columns))
+        totals: Counter = Counter()
+        for row in result.all():
+            for dimension, value in zip(DIMENSION_COLUMNS, row):
+                totals[(dimension, _counter_value(value))] += row[-1]
+        return dict(totals)
+
+    async def stored(self) -> Dict[CounterKey, int]:
+        result = await self.db.execute(
+            select(AnalyticsCounter.dimension, AnalyticsCounter.value, AnalyticsCounter.count).where(AnalyticsCounter.count != 0)
+        )
+        return {(AnalyticsDimension(dimension), value): count for dimension, value, count in result.all()}
+
+    @staticmethod
+    def _drift(expected: Dict[CounterKey, int], stored: Dict[CounterKey, int]) -> List[Dict[str, Any]]:
+        return [
+            {"dimension": key[0].value, "value": key[1], "stored": stored.get(key, 0), "expected": expected.get(key, 0)}
+            for key in sorted(set(expected) | set(stored))
+            if stored.get(key, 0) != expected.get(key, 0)
+        ]
+
+    async def verify(self) -> List[Dict[str, Any]]:
+        """Diferenças entre os contadores e a varredura de `projects` (lista vazia = sem drift)."""
+        return self._drift(await self.scan(), await self.stored())
+
+    async def rebuild(self) -> List[Dict[str, Any]]:
+        """Recalcula todos os contadores na transação corrente; retorna o drift corrigido."""
+        if self.db.bind.dialect.name == "postgresql":
+            # Bloqueia os incrementos concorrentes até o commit; escritas já feitas em
+            # `projects` e ainda não contadas aplicam seu delta depois, sobre a reconstrução
+            await self.db.execute(text("LOCK TABLE analytics_counters IN EXCLUSIVE MODE"))
+        expected = await self.scan()
+        drift = self._drift(expected, await self.stored())
+        await self.db.execute(delete(AnalyticsCounter))
+        rows = [{"dimension": dimension.value, "value": value, "count": count} for (dimension, value), count in expected.items()]
+        if rows:
+            await self.db.execute(self._upsert(rows))
+        return drift
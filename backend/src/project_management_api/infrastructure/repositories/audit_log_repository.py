@@ -1,41 +1,63 @@
-from typing import List, Tuple
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
 from sqlalchemy.orm import joinedload
 from project_management_api.domain.models import AuditLog
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator
+from project_management_api.infrastructure.repositories.totals import TotalMode, fetch_offset_page, fetch_cursor_page
+from project_management_api.infrastructure.repositories.streaming import stream_batches
+
+# Ordenação da listagem: mais recentes primeiro, id como desempate
+AUDIT_LOG_KEYSET = KeysetPaginator([(AuditLog.timestamp, True), (AuditLog.id, True)])
 
 
 class AuditLogRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all(self, *, skip: int = 0, limit: int = 20) -> Tuple[List[AuditLog], int]:
+    async def get_all(self, *, skip: int = 0, limit: int = 20, total_mode: TotalMode = TotalMode.EXACT,
+                      options: Optional[Sequence[Any]] = None) -> Tuple[List[AuditLog], Optional[int]]:
         """
         Busca logs de auditoria com paginação, ordenados por timestamp decrescente.
         
         Args:
             skip: Número de registros para pular
             limit: Número máximo de registros para retornar
+            total_mode: Como calcular o total (exato, estimado ou não calcular)
+            options: Opções de carregamento no lugar do join padrão com o usuário
             
         Returns:
-            Tupla contendo (lista de logs, total de registros)
+            Tupla contendo (lista de logs, total de registros ou None)
         """
         # Query para os itens paginados com join do usuário
-        query = (
+        query = AUDIT_LOG_KEYSET.order_by(
             select(AuditLog)
-            .options(joinedload(AuditLog.user))
-            .order_by(AuditLog.timestamp.desc())
+            .options(*(options if options is not None else [joinedload(AuditLog.user)]))
         )
-        
-        # Query para a contagem total
-        count_query = select(func.count()).select_from(AuditLog)
+        return await fetch_offset_page(self.db, query, skip=skip, limit=limit, mode=total_mode)
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
+    async def get_page_by_cursor(self, *, cursor: Optional[str], limit: int = 20,
+                                 total_mode: TotalMode = TotalMode.EXACT, options: Optional[Sequence[Any]] = None) -> Tuple[List[AuditLog], Optional[str], Optional[str], Optional[int]]:
+        """
+        Busca uma página de logs a partir de um cursor opaco, buscando por
+        (timestamp, id) em vez de OFFSET; páginas profundas custam o mesmo que a primeira.
 
-        paginated_query = query.offset(skip).limit(limit)
-        items_result = await self.db.execute(paginated_query)
-        items = items_result.scalars().all()
-        
-        return items, total
\ No newline at end of file
+        Args:
+            cursor: Cursor retornado pela página anterior (None para a primeira página)
+            limit: Número máximo de registros para retornar
+            total_mode: Como calcular o total (exato, estimado ou não calcular)
+            options: Opções de carregamento no lugar do join padrão com o usuário
+
+        Returns:
+            Tupla contendo (lista de logs, cursor da próxima página, cursor da página anterior, total ou None)
+        """
+        query = select(AuditLog).options(*(options if options is not None else [joinedload(AuditLog.user)]))
+        return await fetch_cursor_page(self.db, AUDIT_LOG_KEYSET, query, cursor=cursor, limit=limit, mode=total_mode)
+
+    def stream_all(self, *, batch_size: Optional[int] = None) -> AsyncIterator[List[AuditLog]]:
+        """
+        Todos os logs, do mais recente ao mais antigo, em lotes lidos por cursor
+        do servidor (exportação). O join com o usuário é many-to-one, compatível com `yield_per`.
+        """
+        query = AUDIT_LOG_KEYSET.order_by(select(AuditLog).options(joinedload(AuditLog.user)))
+        return stream_batches(self.db, query, batch_size)
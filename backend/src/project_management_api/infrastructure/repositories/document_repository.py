@@ -1,10 +1,20 @@
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete
-from project_management_api.domain.models import Document
+from project_management_api.domain.models import Document, DocumentStatus
 from project_management_api.application.schemas import DocumentUpdate
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator, SortField, parse_sort
+from project_management_api.infrastructure.repositories.versions import collection_version, filter_key
+
+DOCUMENT_DEFAULT_SORT = "-uploadedAt"
+DOCUMENT_SORT_FIELDS = {
+    "uploadedAt": SortField(Document.uploadedAt),
+    "name": SortField(Document.name),
+    "version": SortField(Document.version),
+}
 
 
 class DocumentRepository:
@@ -13,20 +23,66 @@ class DocumentRepository:
     
     async def create(self, doc: Document) -> Document:
         self.db.add(doc)
-        await self.db.commit()
-        await self.db.refresh(doc)
+        await self.db.flush()
         return doc
     
-    async def get_by_project(self, project_id: uuid.UUID) -> List[Document]:
-        from sqlalchemy.orm import selectinload
-        
+    async def get_by_project(self, project_id: uuid.UUID, options: Sequence[Any] = ()) -> List[Document]:
+        # O projeto não faz parte da resposta; nenhum relacionamento é carregado por padrão
         result = await self.db.execute(
             select(Document)
-            .options(selectinload(Document.project))
+            .options(*options)
             .filter(Document.project_id == project_id)
         )
         return result.scalars().all()
     
+    def _search_query(
+        self,
+        project_id: uuid.UUID,
+        *,
+        status: Optional[Sequence[DocumentStatus]] = None,
+        type: Optional[str] = None,
+        q: Optional[str] = None,
+        options: Sequence[Any] = (),
+    ):
+        query = select(Document).options(*options).filter(Document.project_id == str(project_id))
+        if status:
+            query = query.filter(Document.status.in_(status))
+        if type:
+            query = query.filter(Document.type == type)
+        if q:
+            query = query.filter(Document.name.icontains(q, autoescape=True))
+        return query
+
+    async def search_by_project(
+        self,
+        project_id: uuid.UUID,
+        *,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> Tuple[List[Document], Optional[str], Optional[str]]:
+        """
+        Busca paginada por cursor dos documentos de um projeto, com filtros e
+        ordenação por múltiplas chaves (ex.: `sort=name,-version`).
+
+        Filtros aceitos: status, type, q e `options` (opções de carregamento).
+
+        Returns:
+            Tupla contendo (documentos, cursor da próxima página, cursor da página anterior)
+        """
+        keys = parse_sort(sort, DOCUMENT_SORT_FIELDS, default=DOCUMENT_DEFAULT_SORT)
+        # O id desempata na mesma direção da última chave
+        paginator = KeysetPaginator(keys + [(Document.id, keys[-1][1])])
+        items, next_cursor, prev_cursor, _ = await paginator.fetch(self.db, self._search_query(project_id, **filters), cursor, limit)
+        return items, next_cursor, prev_cursor
+
+    async def search_version(self, project_id: uuid.UUID, **filters: Any) -> Tuple[Optional[datetime], int]:
+        """(maior updatedAt, quantidade) dos documentos da busca, para o ETag da listagem."""
+        return await collection_version(
+            self.db, self._search_query(project_id, **filters), Document.updatedAt, filter_key(str(project_id), **filters)
+        )
+
     async def get_by_id(self, doc_id: uuid.UUID) -> Optional[Document]:
         res = await self.db.execute(select(Document).filter(Document.id == doc_id))
         return res.scalars().first()
@@ -38,9 +94,8 @@ class DocumentRepository:
         
         q = sqlalchemy_update(Document).where(Document.id == doc_id).values(update_data).returning(Document)
         res = await self.db.execute(q)
-        await self.db.commit()
         return res.scalars().first()
         
     async def delete(self, doc: Document) -> None:
         await self.db.delete(doc)
-        await self.db.commit()
\ No newline at end of file
+        await self.db.flush()
\ No newline at end of file
@@ -1,8 +1,9 @@
 # infrastructure/repositories/notification_repository.py
 import uuid
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy import false, insert
 from ...domain.models import Notification
 
 
@@ -11,7 +12,12 @@ class NotificationRepository:
         self.db = db
 
     async def get_unread_for_user(self, user_id: uuid.UUID) -> List[Notification]:
-        q = select(Notification).filter_by(user_id=user_id, is_read=False).order_by(Notification.created_at.desc())
+        # `false()` é renderizado como literal para casar com o predicado do índice parcial
+        q = (
+            select(Notification)
+            .filter(Notification.user_id == user_id, Notification.is_read == false())
+            .order_by(Notification.created_at.desc())
+        )
         res = await self.db.execute(q)
         return res.scalars().all()
 
@@ -20,6 +26,15 @@ class NotificationRepository:
 
     async def mark_as_read(self, notification: Notification) -> Notification:
         notification.is_read = True
-        await self.db.commit()
-        await self.db.refresh(notification)
-        return notification
\ No newline at end of file
+        await self.db.flush()
+        return notification
+
+    async def create_many(self, notifications: List[Dict[str, Any]]) -> int:
+        """
+        Grava várias notificações (user_id, message, link) em um único
+        INSERT de múltiplas linhas; retorna quantas.
+        """
+        if not notifications:
+            return 0
+        await self.db.execute(insert(Notification).values(notifications))
+        return len(notifications)
@@ -0,0 +1,182 @@
+import json
+import base64
+import enum
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, tuple_, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+
+class InvalidCursorError(ValueError):
+    """Cursor de paginação malformado ou incompatível com a ordenação pedida."""
+
+
+class InvalidSortError(ValueError):
+    """Campo de ordenação desconhecido."""
+
+
+class SortField(NamedTuple):
+    """
+    Campo ordenável de uma listagem. `expression` é a coluna (ou expressão SQL)
+    usada no ORDER BY; `getter` extrai da entidade o valor correspondente para o
+    cursor quando a expressão não é uma coluna simples.
+    """
+    expression: Any
+    getter: Optional[Callable[[Any], Any]] = None
+
+
+def sort_field_names(sort: Optional[str], default: str) -> List[str]:
+    """Nomes dos campos de `sort=-priority,dueDate`, sem o prefixo de direção."""
+    return [part.strip().lstrip("-+") for part in (sort or default).split(",") if part.strip()]
+
+
+def parse_sort(sort: Optional[str], fields: Dict[str, SortField], default: str) -> List[Tuple[Any, bool, Optional[Callable]]]:
+    """
+    Converte `sort=-priority,dueDate` em chaves para o KeysetPaginator
+    (prefixo `-` = decrescente). O desempate pelo id é responsabilidade de quem chama.
+    """
+    parts = [part.strip() for part in (sort or default).split(",") if part.strip()]
+    if not parts:
+        raise InvalidSortError("Ordenação vazia")
+    keys = []
+    for part, name in zip(parts, sort_field_names(",".join(parts), default)):
+        if name not in fields:
+            raise InvalidSortError(f"Campo de ordenação desconhecido: {name}")
+        field = fields[name]
+        keys.append((field.expression, part.startswith("-"), field.getter))
+    return keys
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+def _decode_value(value: Any, column) -> Any:
+    if value is None:
+        return None
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    if issubclass(python_type, enum.Enum):
+        return python_type(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], direction: str = "next") -> str:
+    payload = json.dumps({"v": [_encode_value(v) for v in values], "d": direction}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[List[Any], str]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = payload["v"], payload["d"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Cursor de paginação inválido")
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        raise InvalidCursorError("Cursor de paginação inválido")
+    return values, direction
+
+
+class KeysetPaginator:
+    """
+    Paginação por cursor (keyset/seek) sobre uma ordenação determinística.
+
+    `keys` é a lista de (coluna, decrescente) que define a ordem; a última chave
+    deve ser única (normalmente o id) para desempatar. Em vez de OFFSET, cada
+    página filtra a partir dos valores da última linha da página anterior, o que
+    mantém o custo constante com um índice sobre as mesmas colunas.
+    """
+
+    def __init__(self, keys: Sequence[tuple]):
+        # Cada chave é (coluna, decrescente) ou (expressão, decrescente, getter do valor)
+        self.keys = [(key[0], key[1]) for key in keys]
+        self._getters = [key[2] if len(key) > 2 and key[2] else self._attribute_getter(key[0]) for key in keys]
+
+    @staticmethod
+    def _attribute_getter(column) -> Callable[[Any], Any]:
+        return lambda item: getattr(item, column.key)
+
+    def order_by(self, query: Select, reverse: bool = False) -> Select:
+        clauses = []
+        for column, descending in self.keys:
+            descending = descending != reverse
+            clauses.append(column.desc() if descending else column.asc())
+        return query.order_by(*clauses)
+
+    def _seek_condition(self, values: List[Any], reverse: bool):
+        directions = {descending != reverse for _, descending in self.keys}
+        columns = [column for column, _ in self.keys]
+        if len(directions) == 1:
+            # Todas as chaves na mesma direção: comparação de tuplas, aproveitável pelo índice
+            descending = directions.pop()
+            bound = tuple_(*[literal(value, type_=column.type) for column, value in zip(columns, values)])
+            return tuple_(*columns) < bound if descending else tuple_(*columns) > bound
+        conditions = []
+        for i, (column, descending) in enumerate(self.keys):
+            descending = descending != reverse
+            equal_prefix = [self.keys[j][0] == values[j] for j in range(i)]
+            step = column < values[i] if descending else column > values[i]
+            conditions.append(and_(*equal_prefix, step))
+        return or_(*conditions)
+
+    def cursor_for(self, item: Any, direction: str = "next") -> str:
+        return encode_cursor([getter(item) for getter in self._getters], direction)
+
+    def _decode(self, cursor: str) -> Tuple[List[Any], str]:
+        values, direction = decode_cursor(cursor)
+        if len(values) != len(self.keys):
+            raise InvalidCursorError("Cursor de paginação incompatível com esta listagem")
+        try:
+            return [_decode_value(v, column) for v, (column, _) in zip(values, self.keys)], direction
+        except (ValueError, TypeError):
+            raise InvalidCursorError("Cursor de paginação inválido")
+
+    async def fetch(
+        self, db: AsyncSession, query: Select, cursor: Optional[str], limit: int, total_column: Any = None
+    ) -> Tuple[List[Any], Optional[str], Optional[str], Optional[int]]:
+        """
+        Executa a consulta (já filtrada, sem ORDER BY) e retorna
+        (itens, cursor da próxima página, cursor da página anterior, total).
+
+        `total_column`, quando informado, é uma expressão escalar selecionada
+        junto com cada linha (ex.: subconsulta de contagem); o total é None se
+        não foi pedido ou se a página veio vazia.
+        """
+        direction = "next"
+        if cursor:
+            values, direction = self._decode(cursor)
+            query = query.filter(self._seek_condition(values, reverse=direction == "prev"))
+        reverse = direction == "prev"
+        if total_column is not None:
+            query = query.add_columns(total_column)
+        result = await db.execute(self.order_by(query, reverse=reverse).limit(limit + 1))
+        if total_column is not None:
+            rows = result.all()
+            total = rows[0][-1] if rows else None
+            items = [row[0] for row in rows]
+        else:
+            items, total = list(result.scalars().all()), None
+        has_more = len(items) > limit
+        items = items[:limit]
+        if reverse:
+            items.reverse()
+        if not items:
+            return items, None, None, total
+
+        if reverse:
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, cursor is not None
+        next_cursor = self.cursor_for(items[-1], "next") if has_next else None
+        prev_cursor = self.cursor_for(items[0], "prev") if has_prev else None
+        return items, next_cursor, prev_cursor, total
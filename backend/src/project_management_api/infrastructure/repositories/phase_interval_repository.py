@@ -0,0 +1,196 @@
+# src/project_management_api/infrastructure/repositories/phase_interval_repository.py
+import math
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from project_management_api.domain.models import AuditLog, Project, ProjectPhase, ProjectPhaseInterval
+from project_management_api.application.services.quality_gates import PHASE_ORDER
+
+# Percentis do tempo de ciclo por fase
+CYCLE_TIME_PERCENTILES = (0.5, 0.75, 0.9, 0.95)
+
+PHASE_ADVANCED_ACTION = "PROJECT_PHASE_ADVANCED"
+
+
+def week_start(moment: datetime) -> date:
+    """Segunda-feira da semana de `moment`."""
+    day = moment.date() if isinstance(moment, datetime) else moment
+    return day - timedelta(days=day.weekday())
+
+
+def previous_phase(phase: ProjectPhase) -> Optional[ProjectPhase]:
+    index = PHASE_ORDER.index(phase)
+    return PHASE_ORDER[index - 1] if index > 0 else None
+
+
+def _closed(values: Dict[str, Any], exited_at: datetime) -> Dict[str, Any]:
+    values["exited_at"] = exited_at
+    values["exited_week"] = week_start(exited_at)
+    entered_at = values.get("entered_at")
+    values["duration_seconds"] = (exited_at - entered_at).total_seconds() if entered_at is not None else None
+    return values
+
+
+def intervals_from_advances(advances: Iterable[Tuple[str, ProjectPhase, datetime]],
+                            created_at: Mapping[str, datetime]) -> List[Dict[str, Any]]:
+    """
+    Intervalos de fase a partir dos avanços (projeto, nova fase, instante) em
+    ordem cronológica, como gravados nos logs PROJECT_PHASE_ADVANCED.
+
+    A fase de saída é a anterior à nova em PHASE_ORDER (o workflow avança uma
+    fase por vez; logs antigos gravavam `old_phase` igual a `new_phase`). A
+    primeira fase de cada projeto começa na sua criação. Intervalos abertos de
+    projetos excluídos são descartados.
+    """
+    chains: Dict[str, List[Dict[str, Any]]] = {}
+    for project_id, new_phase, at in advances:
+        chain = chains.setdefault(project_id, [])
+        old_phase = previous_phase(new_phase)
+        current = chain[-1] if chain and chain[-1]["exited_at"] is None else None
+        if current is not None and current["phase"] == new_phase:
+            continue  # avanço sem mudança de fase (projeto já encerrado)
+        if current is not None and current["phase"] != old_phase:
+            # Fase alterada fora do workflow: o período aberto não é confiável
+            chain.pop()
+            current = None
+        if old_phase is not None:
+            if current is None:
+                entered_at = created_at.get(project_id) if not chain and old_phase == PHASE_ORDER[0] else None
+                current = {"project_id": project_id, "phase": old_phase, "entered_at": entered_at, "exited_at": None}
+                chain.append(current)
+            _closed(current, at)
+        chain.append({"project_id": project_id, "phase": new_phase, "entered_at": at, "exited_at": None,
+                      "exited_week": None, "duration_seconds": None})
+    return [
+        interval for project_id, chain in chains.items() for interval in chain
+        if interval["exited_at"] is not None or project_id in created_at
+    ]
+
+
+def percentile(ordered: Sequence[float], fraction: float) -> float:
+    """Interpolação linear entre os vizinhos, como o `percentile_cont` do PostgreSQL."""
+    position = fraction * (len(ordered) - 1)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class PhaseIntervalRepository:
+    """
+    Rollup dos períodos de cada projeto em cada fase.
+
+    O avanço de fase fecha o intervalo aberto e abre o da nova fase na mesma
+    transação; tempo de ciclo e vazão semanal são lidos apenas desta tabela.
+    `rebuild` recalcula tudo a partir dos logs de auditoria (backfill).
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def record_advance(self, project_id: str, old_phase: ProjectPhase, new_phase: ProjectPhase,
+                             at: datetime, project_created_at: Optional[datetime] = None) -> None:
+        """Fecha o intervalo de `old_phase` em `at` e abre o de `new_phase`."""
+        result = await self.db.execute(
+            select(ProjectPhaseInterval)
+            .where(ProjectPhaseInterval.project_id == str(project_id), ProjectPhaseInterval.exited_at.is_(None))
+            .with_for_update()
+        )
+        current = None
+        for interval in result.scalars().all():
+            if interval.phase == old_phase and current is None:
+                current = interval
+            else:
+                # Fase alterada fora do workflow: o período aberto não é confiável
+                await self.db.delete(interval)
+        if current is None:
+            # Primeiro avanço registrado do projeto (ou anterior ao rollup)
+            entered_at = project_created_at if old_phase == PHASE_ORDER[0] else None
+            current = ProjectPhaseInterval(project_id=str(project_id), phase=old_phase, entered_at=entered_at)
+            self.db.add(current)
+        current.exited_at = at
+        current.exited_week = week_start(at)
+        current.duration_seconds = (at - current.entered_at).total_seconds() if current.entered_at is not None else None
+        self.db.add(ProjectPhaseInterval(project_id=str(project_id), phase=new_phase, entered_at=at))
+        await self.db.flush()
+
+    def _completed(self, since: Optional[date], until: Optional[date]):
+        conditions = [ProjectPhaseInterval.exited_at.is_not(None), ProjectPhaseInterval.duration_seconds.is_not(None)]
+        if since is not None:
+            conditions.append(ProjectPhaseInterval.exited_at >= datetime.combine(since, datetime.min.time()))
+        if until is not None:
+            conditions.append(ProjectPhaseInterval.exited_at < datetime.combine(until + timedelta(days=1), datetime.min.time()))
+        return conditions
+
+    async def cycle_times(self, since: Optional[date] = None, until: Optional[date] = None,
+                          percentiles: Sequence[float] = CYCLE_TIME_PERCENTILES) -> List[Dict[str, Any]]:
+        """
+        Tempo (em segundos) dos intervalos concluídos por fase: quantidade,
+        média e percentis. Filtra pela data de saída da fase.
+
+        No PostgreSQL os percentis saem de `percentile_cont`; nos demais bancos
+        as durações de cada fase são lidas ordenadas pelo índice e interpoladas
+        da mesma forma.
+        """
+        duration = ProjectPhaseInterval.duration_seconds
+        conditions = self._completed(since, until)
+        if self.db.bind.dialect.name == "postgresql":
+            query = (
+                select(
+                    ProjectPhaseInterval.phase, func.count(), func.avg(duration),
+                    *(func.percentile_cont(fraction).within_group(duration) for fraction in percentiles),
+                )
+                .where(*conditions)
+                .group_by(ProjectPhaseInterval.phase)
+            )
+            rows = (await self.db.execute(query)).all()
+            stats = {row[0]: (row[1], float(row[2]), [float(value) for value in row[3:]]) for row in rows}
+        else:
+            query = select(ProjectPhaseInterval.phase, duration).where(*conditions).order_by(ProjectPhaseInterval.phase, duration)
+            durations: Dict[ProjectPhase, List[float]] = {}
+            for phase, seconds in (await self.db.execute(query)).all():
+                durations.setdefault(phase, []).append(seconds)
+            stats = {
+                phase: (len(values), sum(values) / len(values), [percentile(values, fraction) for fraction in percentiles])
+                for phase, values in durations.items()
+            }
+        return [
+            {"phase": phase, "count": stats[phase][0], "average": stats[phase][1],
+             "percentiles": dict(zip(percentiles, stats[phase][2]))}
+            for phase in PHASE_ORDER if phase in stats
+        ]
+
+    async def weekly_throughput(self, since: date) -> List[Tuple[date, ProjectPhase, int]]:
+        """Avanços por semana (segunda-feira) e fase concluída, a partir de `since`."""
+        query = (
+            select(ProjectPhaseInterval.exited_week, ProjectPhaseInterval.phase, func.count())
+            .where(ProjectPhaseInterval.exited_week >= week_start(since))
+            .group_by(ProjectPhaseInterval.exited_week, ProjectPhaseInterval.phase)
+        )
+        rows = (await self.db.execute(query)).all()
+        # Fases na ordem do workflow (no banco o enum é ordenado pelo nome)
+        return sorted(rows, key=lambda row: (row[0], PHASE_ORDER.index(row[1])))
+
+    async def rebuild(self) -> int:
+        """
+        Recalcula o rollup a partir dos logs PROJECT_PHASE_ADVANCED, na
+        transação corrente. Retorna a quantidade de intervalos gravados.
+        """
+        created_at = dict((await self.db.execute(select(Project.id, Project.createdAt))).all())
+        logs = await self.db.execute(
+            select(AuditLog.details, AuditLog.timestamp)
+            .where(AuditLog.action == PHASE_ADVANCED_ACTION)
+            .order_by(AuditLog.timestamp, AuditLog.id)
+        )
+        advances = [
+            (details["project_id"], ProjectPhase(details["new_phase"]), timestamp)
+            for details, timestamp in logs.all()
+            if details and details.get("project_id") and details.get("new_phase")
+        ]
+        rows = intervals_from_advances(advances, created_at)
+        await self.db.execute(delete(ProjectPhaseInterval))
+        if rows:
+            await self.db.execute(insert(ProjectPhaseInterval), rows)
+        return len(rows)
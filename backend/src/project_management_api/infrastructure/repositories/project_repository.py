@@ -1,41 +1,87 @@
 import uuid
-from typing import List, Optional, Tuple
-from datetime import date
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, func
+from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_, false, not_, true
 from project_management_api.domain.models import Project, ProjectStatus
 from project_management_api.application.schemas import ProjectCreate, ProjectUpdate
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator
+from project_management_api.infrastructure.repositories.totals import TotalMode, fetch_offset_page, fetch_cursor_page
+from project_management_api.infrastructure.repositories.streaming import stream_batches
+from project_management_api.infrastructure.repositories.versions import row_version, collection_version, filter_key
+from project_management_api.infrastructure.repositories.analytics_counter_repository import (
+    AnalyticsCounterRepository, AnalyticsDimension, DIMENSION_COLUMNS, project_counter_values,
+)
+from project_management_api.infrastructure.analytics_cache import analytics_cache
+
+# Ordenação da listagem: mais recentes primeiro, id como desempate
+PROJECT_KEYSET = KeysetPaginator([(Project.createdAt, True), (Project.id, True)])
+
+# Projetos nestes status podem estar em atraso
+OPEN_STATUSES = (ProjectStatus.ACTIVE, ProjectStatus.HOLD)
+
+
+def overdue_condition(today: date):
+    """Projeto em atraso: término estimado já passou e ainda não está em um estado final."""
+    return and_(Project.estimatedEndDate < today, Project.status.in_(OPEN_STATUSES))
+
+
+def is_project_overdue(project: Project, today: date) -> bool:
+    return project.estimatedEndDate < today and project.status in OPEN_STATUSES
 
 
 class ProjectRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_all(self, *, skip: int = 0, limit: int = 20, status: Optional[ProjectStatus] = None) -> Tuple[List[Project], int]:
+    def _listing_query(self, status: Optional[ProjectStatus], options: Optional[Sequence[Any]] = None, overdue: bool = False):
         from sqlalchemy.orm import selectinload
-        
-        # Query para os itens paginados e filtrados com eager loading dos relacionamentos
-        query = select(Project).options(
-            selectinload(Project.project_manager),
-            selectinload(Project.technical_lead)
-        ).order_by(Project.createdAt.desc())
+
+        # Query para os itens filtrados; por padrão com eager loading dos relacionamentos
+        if options is None:
+            options = [selectinload(Project.project_manager), selectinload(Project.technical_lead)]
+        query = select(Project).options(*options)
         if status:
             query = query.filter(Project.status == status)
-        
-        # Query para a contagem total (com os mesmos filtros)
-        count_query = select(func.count()).select_from(Project)
-        if status:
-            count_query = count_query.filter(Project.status == status)
+        if overdue:
+            # Estado mantido pelo job de atrasos (índice em is_overdue, createdAt, id)
+            query = query.filter(Project.is_overdue == true())
+        return query
 
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar_one()
+    async def get_all(self, *, skip: int = 0, limit: int = 20, status: Optional[ProjectStatus] = None,
+                      total_mode: TotalMode = TotalMode.EXACT, options: Optional[Sequence[Any]] = None,
+                      overdue: bool = False) -> Tuple[List[Project], Optional[int]]:
+        query = PROJECT_KEYSET.order_by(self._listing_query(status, options, overdue))
+        return await fetch_offset_page(self.db, query, skip=skip, limit=limit, mode=total_mode, filters=(status, overdue))
 
-        paginated_query = query.offset(skip).limit(limit)
-        items_result = await self.db.execute(paginated_query)
-        items = items_result.scalars().all()
-        
-        return items, total
+    async def get_page_by_cursor(self, *, cursor: Optional[str], limit: int = 20, status: Optional[ProjectStatus] = None,
+                                 total_mode: TotalMode = TotalMode.EXACT, options: Optional[Sequence[Any]] = None,
+                                 overdue: bool = False) -> Tuple[List[Project], Optional[str], Optional[str], Optional[int]]:
+        """
+        Paginação por cursor sobre (createdAt, id). O custo independe da
+        profundidade da página, ao contrário de OFFSET. `options` substitui o
+        carregamento padrão (ex.: `load_only` para respostas esparsas).
+
+        Returns:
+            Tupla contendo (projetos, cursor da próxima página, cursor da página anterior, total)
+        """
+        return await fetch_cursor_page(
+            self.db, PROJECT_KEYSET, self._listing_query(status, options, overdue),
+            cursor=cursor, limit=limit, mode=total_mode, filters=(status, overdue)
+        )
+
+    def stream_all(self, *, status: Optional[ProjectStatus] = None, batch_size: Optional[int] = None) -> AsyncIterator[List[Project]]:
+        """Todos os projetos do filtro, na ordem da listagem, em lotes lidos por cursor do servidor (exportação)."""
+        return stream_batches(self.db, PROJECT_KEYSET.order_by(self._listing_query(status)), batch_size)
+
+    async def listing_version(self, *, status: Optional[ProjectStatus] = None) -> Tuple[Optional[datetime], int]:
+        """(maior updatedAt, quantidade) dos projetos do filtro, para o ETag da listagem."""
+        return await collection_version(self.db, self._listing_query(status, options=()), Project.updatedAt, filter_key(status))
+
+    async def get_version(self, project_id: uuid.UUID) -> Tuple[bool, Optional[datetime]]:
+        """(existe, updatedAt) do projeto, sem carregar a entidade."""
+        return await row_version(self.db, Project.updatedAt, Project.id == str(project_id))
 
     async def get_by_id(self, project_id: uuid.UUID) -> Optional[Project]:
         from sqlalchemy.orm import selectinload
@@ -50,78 +96,90 @@ class ProjectRepository:
         )
         return result.scalars().first()
 
+    async def _counter_values(self, p_id: uuid.UUID) -> Optional[Dict[AnalyticsDimension, str]]:
+        # FOR UPDATE (no PostgreSQL): duas escritas concorrentes no mesmo projeto
+        # não podem descontar o mesmo valor antigo dos contadores. Sem autoflush,
+        # uma instância já alterada em memória (ex.: avanço de fase) ainda não
+        # foi gravada e a linha lida tem os valores anteriores.
+        with self.db.no_autoflush:
+            result = await self.db.execute(
+                select(*DIMENSION_COLUMNS.values()).where(Project.id == str(p_id)).with_for_update()
+            )
+        row = result.first()
+        return project_counter_values(row) if row else None
+
     async def create(self, p_data: ProjectCreate) -> Project:
         p = Project(**p_data.model_dump())
         self.db.add(p)
-        await self.db.commit()
-        await self.db.refresh(p)
+        await self.db.flush()
+        await AnalyticsCounterRepository(self.db).apply(None, project_counter_values(p))
+        await analytics_cache.invalidate(self.db)
         return p
 
     async def update(self, p_id: uuid.UUID, p_data: ProjectUpdate) -> Optional[Project]:
         update_data = p_data.model_dump(exclude_unset=True)
         if not update_data:
             return await self.get_by_id(p_id)
-        
+
+        counted = {column.key for column in DIMENSION_COLUMNS.values()} & update_data.keys()
+        old_values = await self._counter_values(p_id) if counted else None
         q = sqlalchemy_update(Project).where(Project.id == str(p_id)).values(update_data).returning(Project)
         res = await self.db.execute(q)
-        await self.db.commit()
-        return res.scalars().first()
+        project = res.scalars().first()
+        if project is not None and old_values is not None:
+            await AnalyticsCounterRepository(self.db).apply(old_values, project_counter_values(project))
+            # Os resultados de analytics só dependem das colunas contadas
+            await analytics_cache.invalidate(self.db)
+        if project is not None and project.is_overdue and not is_project_overdue(project, date.today()):
+            # Prazo estendido ou projeto encerrado: deixa de estar em atraso na hora (a marcação fica com o job)
+            project.is_overdue = False
+        return project
 
     async def delete(self, p_id: uuid.UUID) -> bool:
+        old_values = await self._counter_values(p_id)
         q = sqlalchemy_delete(Project).where(Project.id == str(p_id))
         res = await self.db.execute(q)
-        await self.db.commit()
+        if res.rowcount > 0 and old_values is not None:
+            await AnalyticsCounterRepository(self.db).apply(old_values, None)
+            await analytics_cache.invalidate(self.db)
         return res.rowcount > 0
 
-    async def count_by_status(self) -> List[Tuple[str, int]]:
-        query = select(Project.status, func.count(Project.id)).group_by(Project.status)
-        result = await self.db.execute(query)
-        return result.all()
-
-    async def count_by_phase(self) -> List[Tuple[str, int]]:
-        query = select(Project.phase, func.count(Project.id)).group_by(Project.phase)
-        result = await self.db.execute(query)
-        return result.all()
-
-    async def count_by_project_manager(self) -> List[Tuple[str, int]]:
-        from project_management_api.domain.models import User
-        query = select(User.email, func.count(Project.id)).join(
-            User, Project.project_manager_id == User.id, isouter=True
-        ).group_by(User.email)
-        result = await self.db.execute(query)
-        return result.all()
-
-    async def count_by_technical_lead(self) -> List[Tuple[str, int]]:
-        from project_management_api.domain.models import User
-        query = select(User.email, func.count(Project.id)).join(
-            User, Project.technical_lead_id == User.id, isouter=True
-        ).group_by(User.email)
-        result = await self.db.execute(query)
-        return result.all()
-
-    async def count_by_client(self) -> List[Tuple[str, int]]:
-        query = select(Project.client, func.count(Project.id)).group_by(Project.client)
-        result = await self.db.execute(query)
-        return result.all()
-
-    async def get_overdue_projects(self) -> List[Project]:
+    async def mark_overdue(self, today: date, limit: int) -> List[Tuple[str, str, Optional[str]]]:
         """
-        Retorna projetos cuja data estimada de término já passou e que não estão
-        em um estado final (concluído ou cancelado).
+        Marca até `limit` projetos que passaram a estar em atraso, em um único
+        UPDATE ... RETURNING. Retorna (id, nome, GP) dos projetos marcados.
+
+        No PostgreSQL, o lote é selecionado com FOR UPDATE SKIP LOCKED: workers
+        executando o job ao mesmo tempo pegam lotes distintos, e a condição
+        `is_overdue = false` impede que um projeto seja marcado (e notificado) duas vezes.
         """
-        from sqlalchemy.orm import selectinload
-        
-        today = date.today()
-        query = (
-            select(Project)
-            .options(
-                selectinload(Project.project_manager),
-                selectinload(Project.technical_lead)
-            )
-            .filter(
-                Project.estimatedEndDate < today,
-                Project.status.in_([ProjectStatus.ACTIVE, ProjectStatus.HOLD])
-            )
+        batch = (
+            select(Project.id)
+            .where(Project.is_overdue == false(), overdue_condition(today))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        q = (
+            sqlalchemy_update(Project)
+            .where(Project.id.in_(batch.scalar_subquery()), Project.is_overdue == false())
+            .values(is_overdue=True)
+            .returning(Project.id, Project.name, Project.project_manager_id)
+            .execution_options(synchronize_session=False)
+        )
+        return (await self.db.execute(q)).all()
+
+    async def clear_overdue(self, today: date, limit: int) -> int:
+        """Desmarca até `limit` projetos que deixaram de estar em atraso; retorna quantos."""
+        batch = (
+            select(Project.id)
+            .where(Project.is_overdue == true(), not_(overdue_condition(today)))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        q = (
+            sqlalchemy_update(Project)
+            .where(Project.id.in_(batch.scalar_subquery()))
+            .values(is_overdue=False)
+            .execution_options(synchronize_session=False)
         )
-        result = await self.db.execute(query)
-        return result.scalars().all()
\ No newline at end of file
+        return (await self.db.execute(q)).rowcount
@@ -0,0 +1,27 @@
+# src/project_management_api/infrastructure/repositories/streaming.py
+import os
+from typing import Any, AsyncIterator, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+# Linhas buscadas por vez do cursor do servidor durante exportações
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+
+async def stream_batches(db: AsyncSession, query: Select, batch_size: Optional[int] = None) -> AsyncIterator[List[Any]]:
+    """
+    Percorre o resultado de `query` em lotes de `batch_size` entidades.
+
+    Usa cursor do lado do servidor (`yield_per` ativa `stream_results`), então só
+    um lote fica em memória por vez, independentemente do tamanho do resultado.
+    Os relacionamentos com `selectinload` são carregados por lote. O identity map
+    da sessão guarda referências fracas, então as entidades de lotes já
+    consumidos são liberadas.
+    """
+    result = await db.stream(query.execution_options(yield_per=batch_size or EXPORT_BATCH_SIZE))
+    try:
+        async for partition in result.scalars().partitions():
+            yield partition
+    finally:
+        await result.close()
@@ -1,29 +1,125 @@
 import uuid
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete
+from sqlalchemy import update as sqlalchemy_update, delete as sqlalchemy_delete, and_, case, false, func, not_, or_, true
 from sqlalchemy.orm import selectinload
-from project_management_api.domain.models import Task
+from project_management_api.domain.models import Task, TaskStatus, TaskPriority
 from project_management_api.application.schemas import TaskCreate, TaskUpdate
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator, SortField, parse_sort
+from project_management_api.infrastructure.repositories.streaming import stream_batches
+from project_management_api.infrastructure.repositories.versions import row_version, collection_version, filter_key
+
+TASK_DEFAULT_SORT = "createdAt"
+
+# Ordem semântica dos enums (o banco guarda os nomes, cuja ordem alfabética não significa nada)
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(TaskPriority)}
+STATUS_RANK = {status: rank for rank, status in enumerate(TaskStatus)}
+# Tarefas sem prazo ficam depois de todas as outras na ordenação por dueDate
+NO_DUE_DATE = date(9999, 12, 31)
+
+
+def overdue_condition(today: date):
+    """Tarefa em atraso: prazo já passou e ainda não foi concluída."""
+    return and_(Task.dueDate < today, Task.status != TaskStatus.DONE)
+
+
+def is_task_overdue(task: Task, today: date) -> bool:
+    return task.dueDate is not None and task.dueDate < today and task.status != TaskStatus.DONE
+
+
+def _rank(column, ranks):
+    # Comparações com a coluna (e não `case(value=...)`) para que o enum seja convertido pelo tipo da coluna
+    return case(*[(column == member, rank) for member, rank in ranks.items()])
+
+
+TASK_SORT_FIELDS = {
+    "createdAt": SortField(Task.createdAt),
+    "title": SortField(Task.title),
+    "dueDate": SortField(func.coalesce(Task.dueDate, NO_DUE_DATE), lambda task: task.dueDate or NO_DUE_DATE),
+    "priority": SortField(_rank(Task.priority, PRIORITY_RANK), lambda task: PRIORITY_RANK[task.priority]),
+    "status": SortField(_rank(Task.status, STATUS_RANK), lambda task: STATUS_RANK[task.status]),
+}
 
 
 class TaskRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def get_by_project(self, project_id: uuid.UUID) -> List[Task]:
-        from sqlalchemy.orm import selectinload
-        
-        result = await self.db.execute(
-            select(Task)
-            .options(
-                selectinload(Task.project),
-                selectinload(Task.assigned_to)
-            )
-            .filter(Task.project_id == str(project_id))
+    def _search_query(
+        self,
+        project_id: uuid.UUID,
+        *,
+        status: Optional[Sequence[TaskStatus]] = None,
+        priority: Optional[Sequence[TaskPriority]] = None,
+        assigned_to_id: Optional[uuid.UUID] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        q: Optional[str] = None,
+        options: Optional[Sequence[Any]] = None,
+    ):
+        if options is None:
+            options = [selectinload(Task.assigned_to)]
+        query = select(Task).options(*options).filter(Task.project_id == str(project_id))
+        if status:
+            query = query.filter(Task.status.in_(status))
+        if priority:
+            query = query.filter(Task.priority.in_(priority))
+        if assigned_to_id:
+            query = query.filter(Task.assigned_to_id == str(assigned_to_id))
+        if due_from:
+            query = query.filter(Task.dueDate >= due_from)
+        if due_to:
+            query = query.filter(Task.dueDate <= due_to)
+        if q:
+            query = query.filter(or_(Task.title.icontains(q, autoescape=True), Task.description.icontains(q, autoescape=True)))
+        return query
+
+    @staticmethod
+    def _paginator(sort: Optional[str]) -> KeysetPaginator:
+        keys = parse_sort(sort, TASK_SORT_FIELDS, default=TASK_DEFAULT_SORT)
+        # O id desempata na mesma direção da última chave
+        return KeysetPaginator(keys + [(Task.id, keys[-1][1])])
+
+    async def search_by_project(
+        self,
+        project_id: uuid.UUID,
+        *,
+        sort: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        **filters: Any,
+    ) -> Tuple[List[Task], Optional[str], Optional[str]]:
+        """
+        Busca paginada por cursor das tarefas de um projeto, com filtros e
+        ordenação por múltiplas chaves (ex.: `sort=-priority,dueDate`).
+
+        Filtros aceitos: status, priority, assigned_to_id, due_from, due_to, q
+        e `options` (opções de carregamento).
+
+        Returns:
+            Tupla contendo (tarefas, cursor da próxima página, cursor da página anterior)
+        """
+        paginator = self._paginator(sort)
+        items, next_cursor, prev_cursor, _ = await paginator.fetch(self.db, self._search_query(project_id, **filters), cursor, limit)
+        return items, next_cursor, prev_cursor
+
+    def stream_by_project(self, project_id: uuid.UUID, *, sort: Optional[str] = None, batch_size: Optional[int] = None,
+                          **filters: Any) -> AsyncIterator[List[Task]]:
+        """Todas as tarefas da busca, na ordem pedida, em lotes lidos por cursor do servidor (exportação)."""
+        query = self._paginator(sort).order_by(self._search_query(project_id, **filters))
+        return stream_batches(self.db, query, batch_size)
+
+    async def search_version(self, project_id: uuid.UUID, **filters: Any) -> Tuple[Optional[datetime], int]:
+        """(maior updatedAt, quantidade) das tarefas da busca, para o ETag da listagem."""
+        return await collection_version(
+            self.db, self._search_query(project_id, options=(), **filters), Task.updatedAt, filter_key(str(project_id), **filters)
         )
-        return result.scalars().all()
+
+    async def get_version(self, task_id: uuid.UUID, project_id: uuid.UUID) -> Tuple[bool, Optional[datetime]]:
+        """(existe no projeto, updatedAt) da tarefa, sem carregar a entidade."""
+        return await row_version(self.db, Task.updatedAt, Task.id == str(task_id), Task.project_id == str(project_id))
 
     async def get_by_id(self, task_id: uuid.UUID) -> Optional[Task]:
         result = await self.db.execute(
@@ -36,8 +132,7 @@ class TaskRepository:
     async def create_for_project(self, project_id: uuid.UUID, task: TaskCreate) -> Task:
         db_task = Task(**task.model_dump(), project_id=project_id)
         self.db.add(db_task)
-        await self.db.commit()
-        await self.db.refresh(db_task)
+        await self.db.flush()
         
         # Recarregar a tarefa com os relacionamentos
         return await self.get_by_id(db_task.id)
@@ -49,13 +144,52 @@ class TaskRepository:
         
         q = sqlalchemy_update(Task).where(Task.id == task_id).values(update_data)
         await self.db.execute(q)
-        await self.db.commit()
         
         # Recarregar a tarefa com os relacionamentos
-        return await self.get_by_id(task_id)
+        updated = await self.get_by_id(task_id)
+        if updated is not None and updated.is_overdue and not is_task_overdue(updated, date.today()):
+            # Concluída ou com prazo estendido: deixa de estar em atraso na hora (a marcação fica com o job)
+            updated.is_overdue = False
+        return updated
         
     async def delete(self, task_id: uuid.UUID) -> bool:
         q = sqlalchemy_delete(Task).where(Task.id == task_id)
         res = await self.db.execute(q)
-        await self.db.commit()
-        return res.rowcount > 0
\ No newline at end of file
+        return res.rowcount > 0
+
+    async def mark_overdue(self, today: date, limit: int) -> List[Tuple[str, str, str, Optional[str]]]:
+        """
+        Marca até `limit` tarefas que passaram a estar em atraso, em um único
+        UPDATE ... RETURNING. Retorna (id, título, projeto, responsável) das
+        tarefas marcadas. Ver `ProjectRepository.mark_overdue`.
+        """
+        batch = (
+            select(Task.id)
+            .where(Task.is_overdue == false(), overdue_condition(today))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        q = (
+            sqlalchemy_update(Task)
+            .where(Task.id.in_(batch.scalar_subquery()), Task.is_overdue == false())
+            .values(is_overdue=True)
+            .returning(Task.id, Task.title, Task.project_id, Task.assigned_to_id)
+            .execution_options(synchronize_session=False)
+        )
+        return (await self.db.execute(q)).all()
+
+    async def clear_overdue(self, today: date, limit: int) -> int:
+        """Desmarca até `limit` tarefas que deixaram de estar em atraso; retorna quantas."""
+        batch = (
+            select(Task.id)
+            .where(Task.is_overdue == true(), or_(Task.dueDate.is_(None), not_(overdue_condition(today))))
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        q = (
+            sqlalchemy_update(Task)
+            .where(Task.id.in_(batch.scalar_subquery()))
+            .values(is_overdue=False)
+            .execution_options(synchronize_session=False)
+        )
+        return (await self.db.execute(q)).rowcount
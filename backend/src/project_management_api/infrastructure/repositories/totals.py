@@ -0,0 +1,217 @@
+# src/project_management_api/infrastructure/repositories/totals.py
+import os
+import enum
+import json
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from project_management_api.infrastructure.cache import TTLCache
+from project_management_api.infrastructure.db.unit_of_work import after_commit
+from project_management_api.infrastructure.repositories.pagination import KeysetPaginator
+
+# Totais exatos ficam pouco tempo em cache; estimativas podem durar mais
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("COUNT_CACHE_TTL_SECONDS", "5"))
+COUNT_ESTIMATE_TTL_SECONDS = float(os.getenv("COUNT_ESTIMATE_TTL_SECONDS", "60"))
+COUNT_CACHE_MAX_ENTRIES = int(os.getenv("COUNT_CACHE_MAX_ENTRIES", "1024"))
+
+# Chave em `session.info` das tabelas a invalidar de novo após o commit
+_PENDING_TABLES_KEY = "count_cache_tables"
+
+
+class TotalMode(str, enum.Enum):
+    """Como o total de itens de uma listagem paginada é calculado."""
+    NONE = "false"
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+
+
+class CountCache:
+    """
+    Cache de totais (e versões de coleção, para os ETags) por tabela e filtro.
+
+    Cada tabela tem uma geração que é incrementada quando a sessão grava
+    nela (no flush e de novo após o commit); a geração faz parte da chave,
+    então escritas no próprio processo invalidam os totais na hora. Escritas
+    de outros processos aparecem após o TTL.
+    """
+
+    def __init__(self):
+        self._cache = TTLCache(
+            max_entries=COUNT_CACHE_MAX_ENTRIES,
+            ttl_seconds=max(COUNT_CACHE_TTL_SECONDS, COUNT_ESTIMATE_TTL_SECONDS),
+        )
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, table: str, kind: str, filters: Hashable) -> Tuple:
+        return (table, self._generations.get(table, 0), kind, filters)
+
+    def get(self, table: str, mode: TotalMode, filters: Hashable) -> Optional[int]:
+        return self._cache.get(self._key(table, mode.value, filters))
+
+    def set(self, table: str, mode: TotalMode, filters: Hashable, total: int) -> None:
+        ttl = COUNT_ESTIMATE_TTL_SECONDS if mode == TotalMode.ESTIMATE else COUNT_CACHE_TTL_SECONDS
+        self._cache.set(self._key(table, mode.value, filters), total, ttl_seconds=ttl)
+
+    def get_version(self, table: str, filters: Hashable) -> Optional[Tuple[Any, int]]:
+        """Versão (maior updatedAt, quantidade) da coleção, com a mesma geração dos totais."""
+        return self._cache.get(self._key(table, "version", filters))
+
+    def set_version(self, table: str, filters: Hashable, version: Tuple[Any, int]) -> None:
+        self._cache.set(self._key(table, "version", filters), version, ttl_seconds=COUNT_CACHE_TTL_SECONDS)
+
+    def invalidate(self, table: str) -> None:
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generations.clear()
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+
+count_cache = CountCache()
+
+
+def table_name(query: Select) -> str:
+    # Tabela da entidade principal da listagem (ignora joins de eager loading)
+    return query.column_descriptions[0]["entity"].__table__.name
+
+
+def count_query(query: Select) -> Select:
+    """SELECT count(*) com os mesmos filtros da listagem (sem ordenação nem paginação)."""
+    return select(func.count()).select_from(query.order_by(None).limit(None).offset(None).subquery())
+
+
+async def _estimate(db: AsyncSession, query: Select) -> Optional[int]:
+    """Estimativa a partir das estatísticas do planejador do PostgreSQL, sem varrer a tabela."""
+    if db.bind.dialect.name != "postgresql":
+        return None
+    if query.whereclause is None:
+        result = await db.execute(
+            text("SELECT reltuples::bigint FROM pg_class WHERE relname = :table"),
+            {"table": table_name(query)},
+        )
+        estimate = result.scalar()
+    else:
+        compiled = query.order_by(None).compile(dialect=db.bind.dialect, compile_kwargs={"literal_binds": True})
+        result = await db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        estimate = plan[0]["Plan"]["Plan Rows"]
+    # reltuples = -1 indica tabela nunca analisada
+    return int(estimate) if estimate is not None and estimate >= 0 else None
+
+
+async def count_total(db: AsyncSession, query: Select, mode: TotalMode, filters: Hashable = None) -> Optional[int]:
+    """
+    Total de itens da listagem `query` conforme o modo pedido, usando o cache por filtro.
+
+    `estimate` usa as estatísticas do planejador quando disponíveis (PostgreSQL) e,
+    nos demais bancos, recai em uma contagem exata mantida em cache pelo TTL de estimativa.
+    """
+    if mode == TotalMode.NONE:
+        return None
+    table = table_name(query)
+    total = count_cache.get(table, mode, filters)
+    if total is not None:
+        return total
+    if mode == TotalMode.ESTIMATE:
+        total = await _estimate(db, query)
+    if total is None:
+        total = (await db.execute(count_query(query))).scalar_one()
+    count_cache.set(table, mode, filters, total)
+    return total
+
+
+async def fetch_offset_page(
+    db: AsyncSession, query: Select, *, skip: int, limit: int, mode: TotalMode, filters: Hashable = None
+) -> Tuple[List[Any], Optional[int]]:
+    """
+    Executa uma página por OFFSET/LIMIT e calcula o total conforme `mode`.
+
+    No modo exato sem total em cache, a contagem vem na mesma consulta da página
+    (`count(*) OVER ()`), em uma única ida ao banco.
+    """
+    table = table_name(query)
+    if mode == TotalMode.EXACT and count_cache.get(table, mode, filters) is None:
+        result = await db.execute(query.add_columns(func.count().over()).offset(skip).limit(limit))
+        rows = result.all()
+        items = [row[0] for row in rows]
+        if rows:
+            total = rows[0][-1]
+            count_cache.set(table, mode, filters, total)
+            return items, total
+        # Página além do fim: a janela não traz linhas, conta à parte
+        return items, await count_total(db, query, mode, filters)
+
+    result = await db.execute(query.offset(skip).limit(limit))
+    items = list(result.scalars().all())
+    return items, await count_total(db, query, mode, filters)
+
+
+async def fetch_cursor_page(
+    db: AsyncSession, paginator: KeysetPaginator, query: Select, *, cursor: Optional[str], limit: int,
+    mode: TotalMode, filters: Hashable = None
+) -> Tuple[List[Any], Optional[str], Optional[str], Optional[int]]:
+    """
+    Executa uma página por cursor e calcula o total conforme `mode`.
+
+    O total exato não pode vir de uma janela (a busca pelo cursor já filtra as
+    linhas anteriores); sem total em cache, ele vai como subconsulta escalar
+    na mesma consulta da página.
+    """
+    table = table_name(query)
+    if mode == TotalMode.EXACT and count_cache.get(table, mode, filters) is None:
+        items, next_cursor, prev_cursor, total = await paginator.fetch(
+            db, query, cursor, limit, total_column=count_query(query).scalar_subquery()
+        )
+        if total is None:
+            total = await count_total(db, query, mode, filters)
+        else:
+            count_cache.set(table, mode, filters, total)
+        return items, next_cursor, prev_cursor, total
+
+    items, next_cursor, prev_cursor, _ = await paginator.fetch(db, query, cursor, limit)
+    return items, next_cursor, prev_cursor, await count_total(db, query, mode, filters)
+
+
+def _invalidate_tables(session: Session, tables: Set[str]) -> None:
+    """
+    Invalida os totais das tabelas agora e de novo após o commit da
+    UnitOfWork: uma leitura concorrente entre a escrita e o commit ainda conta
+    as linhas antigas e guardaria esse total na geração nova até o TTL.
+    """
+    for table in tables:
+        count_cache.invalidate(table)
+    session.info.setdefault(_PENDING_TABLES_KEY, set()).update(tables)
+
+    async def reinvalidate() -> None:
+        for table in session.info.pop(_PENDING_TABLES_KEY, ()):
+            count_cache.invalidate(table)
+
+    after_commit(session, "count_cache", reinvalidate)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session, flush_context):
+    """Invalida os totais das tabelas que receberam inserções, alterações ou exclusões."""
+    tables = {obj.__table__.name for obj in (*session.new, *session.dirty, *session.deleted) if hasattr(obj, "__table__")}
+    if tables:
+        _invalidate_tables(session, tables)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_bulk_write(orm_execute_state):
+    """INSERT/UPDATE/DELETE em massa (ex.: `sqlalchemy_update(Project)`) não passam pelo flush."""
+    if (orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete) and orm_execute_state.bind_mapper is not None:
+        _invalidate_tables(orm_execute_state.session, {orm_execute_state.bind_mapper.local_table.name})
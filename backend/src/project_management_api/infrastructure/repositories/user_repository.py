@@ -8,4 +8,8 @@ class UserRepository:
     
     async def get_by_email(self, email: str):
         res = await self.db.execute(select(User).filter(User.email == email))
+        return res.scalars().first()
+
+    async def get_by_id(self, user_id: str):
+        res = await self.db.execute(select(User).filter(User.id == str(user_id)))
         return res.scalars().first()
\ No newline at end of file
@@ -0,0 +1,45 @@
+# src/project_management_api/infrastructure/repositories/versions.py
+from datetime import datetime
+from typing import Any, Hashable, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from project_management_api.infrastructure.repositories.totals import count_cache, table_name
+
+
+async def row_version(db: AsyncSession, column: Any, *criteria: Any) -> Tuple[bool, Optional[datetime]]:
+    """
+    Lê apenas a coluna de versão (`updatedAt`) de uma linha, sem carregar a
+    entidade nem seus relacionamentos. Retorna (encontrada, updatedAt).
+    """
+    row = (await db.execute(select(column).filter(*criteria))).first()
+    return (row is not None, row[0] if row is not None else None)
+
+
+def filter_key(*args: Any, **filters: Any) -> Hashable:
+    """Chave de cache de uma busca: listas de filtros viram tuplas."""
+    return args + tuple(sorted((name, tuple(value) if isinstance(value, list) else value) for name, value in filters.items()))
+
+
+async def collection_version(db: AsyncSession, query: Select, column: Any, filters: Hashable) -> Tuple[Optional[datetime], int]:
+    """
+    Versão de uma coleção filtrada: (maior updatedAt, quantidade de linhas).
+
+    A contagem acompanha o maior updatedAt porque exclusões não alteram o
+    máximo; juntos, mudam a cada inserção, alteração ou exclusão no conjunto.
+    Fica no `count_cache` por tabela e `filters`, invalidada pelas escritas
+    como os totais: coleções sem alteração não custam nenhuma consulta.
+    """
+    table = table_name(query)
+    version = count_cache.get_version(table, filters)
+    if version is not None:
+        return version
+    # Mesmos FROM/WHERE da listagem, mas só as agregações: o índice de filtro basta, sem ler as linhas
+    version_query = query.order_by(None).limit(None).offset(None).with_only_columns(
+        func.max(column), func.count(), maintain_column_froms=True
+    )
+    latest, count = (await db.execute(version_query)).one()
+    count_cache.set_version(table, filters, (latest, count))
+    return latest, count
@@ -0,0 +1,181 @@
+# src/project_management_api/infrastructure/tracing.py
+"""
+Amostragem de traces do Sentry por rota, ajustável em tempo de execução.
+
+Erros continuam sendo enviados sempre (`sample_rate=1.0`); a amostragem vale
+só para transações. Rotas quentes (health, notificações, analytics) usam
+taxas baixas. Quando uma requisição é lenta ou termina em 5xx, a rota passa a
+ser rastreada a 100% por TRACES_BOOST_SECONDS e, se a própria requisição não
+foi amostrada, um evento "slow request" é enviado no lugar do trace.
+
+As taxas vêm do ambiente e podem ser sobrescritas pelo arquivo
+TRACES_SAMPLING_FILE (JSON `{"base_rate": 0.05, "route_rates": "..."}`),
+relido por todos os workers quando muda.
+"""
+import os
+import json
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import sentry_sdk
+
+from project_management_api.infrastructure.metrics import METRICS_DIR
+
+# Taxa de traces para rotas sem regra específica (0 a 1)
+TRACES_SAMPLE_RATE = float(os.getenv("TRACES_SAMPLE_RATE", "0.05"))
+# Taxas por prefixo de caminho, "prefixo=taxa" separados por vírgula; vence o prefixo mais longo
+TRACES_SAMPLE_RATES = os.getenv(
+    "TRACES_SAMPLE_RATES", "/api/health=0,/api/metrics=0,/api/notifications/me=0.01,/api/analytics=0.01",
+)
+# Fração das transações amostradas que também são perfiladas
+PROFILES_SAMPLE_RATE = float(os.getenv("PROFILES_SAMPLE_RATE", "0.1"))
+# Requisições mais lentas que este limite ativam o rastreamento integral da rota
+TRACES_SLOW_MS = float(os.getenv("TRACES_SLOW_MS", "1000"))
+TRACES_BOOST_SECONDS = float(os.getenv("TRACES_BOOST_SECONDS", "300"))
+# Arquivo compartilhado pelos workers com as taxas ajustadas em tempo de execução
+TRACES_SAMPLING_FILE = os.getenv("TRACES_SAMPLING_FILE") or os.path.join(METRICS_DIR, "trace-sampling.json")
+_RELOAD_INTERVAL_SECONDS = 1.0
+
+
+def parse_sample_rates(spec: str) -> List[Tuple[str, float]]:
+    """
+    Converte "prefixo=taxa,..." (LOG_SAMPLE_RATES, TRACES_SAMPLE_RATES) em
+    [(prefixo, taxa)], do prefixo mais longo para o mais curto.
+    """
+    rates = []
+    for part in spec.split(","):
+        prefix, separator, rate = part.strip().rpartition("=")
+        if not separator or not prefix:
+            continue
+        rates.append((prefix.strip(), min(max(float(rate), 0.0), 1.0)))
+    return sorted(rates, key=lambda item: len(item[0]), reverse=True)
+
+
+class TraceSampler:
+    """`traces_sampler` do Sentry: taxa por rota, com reforço automático para rotas lentas."""
+
+    def __init__(self, base_rate: float = TRACES_SAMPLE_RATE, route_rates: str = TRACES_SAMPLE_RATES,
+                 slow_ms: float = TRACES_SLOW_MS, boost_seconds: float = TRACES_BOOST_SECONDS,
+                 config_file: Optional[str] = TRACES_SAMPLING_FILE):
+        self.enabled = False
+        self.slow_ms = slow_ms
+        self.boost_seconds = boost_seconds
+        self.config_file = config_file
+        self._defaults = (base_rate, route_rates)
+        self._apply(base_rate, route_rates)
+        # Template da rota -> (rota, expiração do reforço)
+        self._boosted: Dict[str, Tuple[Any, float]] = {}
+        self._config_mtime: Optional[float] = None
+        self._checked_at = 0.0
+
+    def _apply(self, base_rate: float, route_rates: str) -> None:
+        self.base_rate = min(max(float(base_rate), 0.0), 1.0)
+        self.route_rates_spec = route_rates
+        self.route_rates = parse_sample_rates(route_rates)
+
+    def _reload_if_changed(self) -> None:
+        now = time.monotonic()
+        if self.config_file is None or now - self._checked_at < _RELOAD_INTERVAL_SECONDS:
+            return
+        self._checked_at = now
+        try:
+            mtime = os.stat(self.config_file).st_mtime
+        except FileNotFoundError:
+            mtime = None
+        if mtime == self._config_mtime:
+            return
+        self._config_mtime = mtime
+        base_rate, route_rates = self._defaults
+        if mtime is not None:
+            try:
+                with open(self.config_file) as f:
+                    config = json.load(f)
+                base_rate = config.get("base_rate", base_rate)
+                route_rates = config.get("route_rates", route_rates)
+            except (OSError, ValueError):
+                return
+        self._apply(base_rate, route_rates)
+
+    def configure(self, base_rate: Optional[float] = None, route_rates: Optional[str] = None) -> Dict[str, Any]:
+        """Altera as taxas de todos os workers gravando o arquivo compartilhado."""
+        self._reload_if_changed()
+        parse_sample_rates(route_rates or "")  # valida antes de gravar
+        self._apply(self.base_rate if base_rate is None else base_rate,
+                    self.route_rates_spec if route_rates is None else route_rates)
+        if self.config_file is not None:
+            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+            temporary = f"{self.config_file}.{os.getpid()}.tmp"
+            with open(temporary, "w") as f:
+                json.dump({"base_rate": self.base_rate, "route_rates": self.route_rates_spec}, f)
+            os.replace(temporary, self.config_file)
+            self._config_mtime = os.stat(self.config_file).st_mtime
+        return self.settings()
+
+    def settings(self) -> Dict[str, Any]:
+        self._reload_if_changed()
+        now = time.monotonic()
+        return {
+            "base_rate": self.base_rate,
+            "route_rates": self.route_rates_spec,
+            "profiles_sample_rate": PROFILES_SAMPLE_RATE,
+            "slow_ms": self.slow_ms,
+            "boosted_routes": sorted(template for template, (_, until) in self._boosted.items() if until > now),
+        }
+
+    def rate_for_path(self, path: str) -> float:
+        self._reload_if_changed()
+        if self._boosted:
+            now = time.monotonic()
+            for template, (route, until) in list(self._boosted.items()):
+                if until <= now:
+                    del self._boosted[template]
+                elif route.path_regex.match(path):
+                    return 1.0
+        return next((rate for prefix, rate in self.route_rates if path.startswith(prefix)), self.base_rate)
+
+    def __call__(self, sampling_context: Dict[str, Any]) -> float:
+        # Decisão de um serviço anterior (trace distribuído) é respeitada
+        parent_sampled = sampling_context.get("parent_sampled")
+        if parent_sampled is not None:
+            return 1.0 if parent_sampled else 0.0
+        scope = sampling_context.get("asgi_scope") or {}
+        path = scope.get("path")
+        if path is None:
+            return self.base_rate
+        return self.rate_for_path(path)
+
+    def record(self, scope, status_code: int, duration_ms: float) -> None:
+        """Chamado ao fim de cada requisição: reforça rotas lentas ou com erro."""
+        if status_code < 500 and duration_ms < self.slow_ms:
+            return
+        route = scope.get("route")
+        if route is None or not hasattr(route, "path_regex"):
+            return
+        now = time.monotonic()
+        already_boosted = self._boosted.get(route.path, (None, 0.0))[1] > now
+        self._boosted[route.path] = (route, now + self.boost_seconds)
+        span = sentry_sdk.get_current_span()
+        if already_boosted or (span is not None and span.sampled):
+            return
+        # A requisição não foi rastreada: envia um resumo para não perder o caso
+        with sentry_sdk.new_scope() if hasattr(sentry_sdk, "new_scope") else sentry_sdk.push_scope() as event_scope:
+            event_scope.set_tag("route", route.path)
+            event_scope.set_tag("status_code", status_code)
+            event_scope.set_extra("duration_ms", round(duration_ms, 3))
+            event_scope.set_extra("path", scope.get("path"))
+            sentry_sdk.capture_message(f"Slow request: {scope.get('method')} {route.path}", level="warning")
+
+
+trace_sampler = TraceSampler()
+
+
+def init_tracing(dsn: str, **options: Any) -> None:
+    """Inicializa o Sentry com o amostrador por rota."""
+    sentry_sdk.init(
+        dsn=dsn,
+        sample_rate=1.0,
+        traces_sampler=trace_sampler,
+        profiles_sample_rate=PROFILES_SAMPLE_RATE,
+        **options,
+    )
+    trace_sampler.enabled = True
@@ -18,6 +18,9 @@ from project_management_api.infrastructure.api.main import app
 from project_management_api.infrastructure.db.database import get_db
 from project_management_api.domain.models import Base, User
 from project_management_api.infrastructure.api import security
+from project_management_api.infrastructure.api.principal_cache import principal_cache
+from project_management_api.infrastructure.repositories.totals import count_cache
+from project_management_api.infrastructure.analytics_cache import analytics_cache
 
 # Test database URL
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -72,6 +75,10 @@ async def client(test_session):
         yield test_session
     
     app.dependency_overrides[get_db] = override_get_db
+    # Cada teste usa um banco novo; principais, totais e analytics de testes anteriores não podem vazar
+    principal_cache.clear()
+    count_cache.clear()
+    await analytics_cache.clear()
     
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
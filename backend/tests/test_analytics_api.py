@@ -0,0 +1,84 @@
+# backend/tests/test_analytics_api.py
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.application import schemas
+from project_management_api.domain.models import Project, ProjectPhase
+from project_management_api.infrastructure.repositories.project_repository import ProjectRepository
+from project_management_api.infrastructure.repositories.analytics_counter_repository import AnalyticsCounterRepository
+
+pytestmark = pytest.mark.asyncio
+
+DIMENSION_ENDPOINTS = {
+    "status": "projects-by-status",
+    "phase": "projects-by-phase",
+    "pm": "projects-by-pm",
+    "tl": "projects-by-tl",
+    "client": "projects-by-client",
+}
+
+
+async def test_summary_matches_individual_endpoints(authenticated_client: AsyncClient, test_user):
+    for i in range(5):
+        response = await authenticated_client.post("/api/projects/", json={
+            "name": f"Projeto {i}",
+            "client": f"Cliente {i % 2}",
+            "startDate": "2025-01-01",
+            "estimatedEndDate": "2025-12-31",
+            "project_manager_id": test_user.id if i % 2 else None,
+        })
+        assert response.status_code == 201
+
+    response = await authenticated_client.get("/api/analytics/summary")
+    assert response.status_code == 200
+    summary = response.json()
+    assert set(summary) == set(DIMENSION_ENDPOINTS)
+    for dimension, endpoint in DIMENSION_ENDPOINTS.items():
+        individual = (await authenticated_client.get(f"/api/analytics/{endpoint}")).json()
+        assert sorted(summary[dimension], key=str) == sorted(individual, key=str)
+    assert {"category": "Unassigned", "count": 3} in summary["pm"]
+
+    response = await authenticated_client.get("/api/analytics/summary?dimension=client&dimension=pm")
+    assert set(response.json()) == {"client", "pm"}
+    assert sorted(response.json()["client"], key=str) == [{"category": "Cliente 0", "count": 3}, {"category": "Cliente 1", "count": 2}]
+
+
+async def test_counters_follow_project_writes(authenticated_client: AsyncClient, test_session, test_user):
+    ids = []
+    for i in range(3):
+        response = await authenticated_client.post("/api/projects/", json={
+            "name": f"Projeto {i}", "client": "Cliente A", "startDate": "2025-01-01", "estimatedEndDate": "2025-12-31",
+        })
+        ids.append(response.json()["id"])
+
+    response = await authenticated_client.put(f"/api/projects/{ids[0]}", json={
+        "status": "hold", "client": "Cliente B", "technical_lead_id": test_user.id,
+    })
+    assert response.status_code == 200
+    assert (await authenticated_client.put(f"/api/projects/{ids[1]}", json={"name": "Sem dimensões"})).status_code == 200
+    assert (await authenticated_client.delete(f"/api/projects/{ids[2]}")).status_code == 204
+
+    # Avanço de fase: a instância é alterada em memória antes do update do repositório
+    projects = ProjectRepository(test_session)
+    project = await projects.get_by_id(ids[1])
+    project.phase = ProjectPhase.DEFINITION
+    await projects.update(ids[1], schemas.ProjectUpdate(phase=project.phase))
+    await test_session.commit()
+
+    counters = AnalyticsCounterRepository(test_session)
+    assert await counters.verify() == []
+    summary = (await authenticated_client.get("/api/analytics/summary?dimension=status&dimension=client&dimension=tl")).json()
+    assert sorted(summary["status"], key=str) == [{"category": "active", "count": 1}, {"category": "hold", "count": 1}]
+    assert sorted(summary["client"], key=str) == [{"category": "Cliente A", "count": 1}, {"category": "Cliente B", "count": 1}]
+    assert sorted(summary["tl"], key=str) == [{"category": "Unassigned", "count": 1}, {"category": test_user.email, "count": 1}]
+
+    # Escrita fora do repositório gera drift; o rebuild corrige
+    test_session.add(Project(name="Manual", client="Cliente A", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 6, 1)))
+    await test_session.commit()
+    drift = await counters.verify()
+    assert {"dimension": "client", "value": "Cliente A", "stored": 1, "expected": 2} in drift
+    assert await counters.rebuild() == drift
+    await test_session.commit()
+    assert await counters.verify() == []
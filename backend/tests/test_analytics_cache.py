@@ -0,0 +1,109 @@
+# backend/tests/test_analytics_cache.py
+import asyncio
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.infrastructure.analytics_cache import (
+    AnalyticsCache, MemoryCacheBackend, RedisCacheBackend, analytics_cache,
+)
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeRedis:
+    """Substituto local do redis.asyncio com os comandos usados pelo cache."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = (value.encode(), time.monotonic() + ex if ex else None)
+
+    async def incr(self, key):
+        value = int((await self.get(key)) or 0) + 1
+        self.data[key] = (str(value).encode(), None)
+        return value
+
+
+async def test_cached_until_project_write(authenticated_client: AsyncClient, create_test_project):
+    await create_test_project()
+    stats = analytics_cache.stats()
+
+    first = (await authenticated_client.get("/api/analytics/summary")).json()
+    assert (await authenticated_client.get("/api/analytics/summary")).json() == first
+    assert (await authenticated_client.get("/api/analytics/projects-by-client")).status_code == 200
+    assert analytics_cache.stats()["misses"] - stats["misses"] == 2
+    assert analytics_cache.stats()["hits"] - stats["hits"] == 1
+
+    # Escrita em projects invalida os resultados (sem esperar o TTL)
+    project_id = await create_test_project()
+    response = await authenticated_client.get("/api/analytics/projects-by-client")
+    assert response.json() == [{"category": "Cliente de Teste", "count": 2}]
+    await authenticated_client.put(f"/api/projects/{project_id}", json={"status": "hold"})
+    summary = (await authenticated_client.get("/api/analytics/summary")).json()
+    assert sorted(summary["status"], key=str) == [{"category": "active", "count": 1}, {"category": "hold", "count": 1}]
+
+
+async def test_concurrent_misses_run_one_query():
+    cache = AnalyticsCache(MemoryCacheBackend(), ttl_seconds=30)
+    release = asyncio.Event()
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"total": calls}
+
+    waiting = [asyncio.ensure_future(cache.get_or_load("counts", ("status",), load)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiting) == [{"total": 1}] * 10
+    assert calls == 1
+    assert cache.stats()["coalesced"] == 9
+
+    # Falha da consulta chega a todos que esperavam e nada fica em cache
+    release.clear()
+
+    async def fail():
+        await release.wait()
+        raise RuntimeError("banco indisponível")
+
+    waiting = [asyncio.ensure_future(cache.get_or_load("counts", ("phase",), fail)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiting, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await cache.get_or_load("counts", ("phase",), load) == {"total": 2}
+
+
+async def test_redis_backend_shared_between_workers():
+    client = FakeRedis()
+    worker_a = AnalyticsCache(RedisCacheBackend(client), ttl_seconds=30)
+    worker_b = AnalyticsCache(RedisCacheBackend(client), ttl_seconds=30)
+    loads = []
+
+    def loader(worker):
+        async def load():
+            loads.append(worker)
+            return [{"category": "active", "count": len(loads)}]
+        return load
+
+    assert await worker_a.get_or_load("counts", ("status",), loader("a")) == [{"category": "active", "count": 1}]
+    assert await worker_b.get_or_load("counts", ("status",), loader("b")) == [{"category": "active", "count": 1}]
+    assert loads == ["a"]
+
+    # Invalidação em um worker vale para todos
+    await worker_a.invalidate()
+    assert await worker_b.get_or_load("counts", ("status",), loader("b")) == [{"category": "active", "count": 2}]
+    assert loads == ["a", "b"]
+    assert all(expires_at is not None for key, (_, expires_at) in client.data.items() if key != "analytics:generation")
@@ -0,0 +1,122 @@
+# backend/tests/test_database_routing.py
+import time
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from fastapi import Response
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.future import select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.util import greenlet_spawn
+from starlette.requests import Request
+
+from project_management_api.domain.models import Base, User
+from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
+from project_management_api.infrastructure.db.database import DatabaseRouter, CONSISTENCY_TOKEN_HEADER, InstrumentedAsyncQueuePool
+
+pytestmark = pytest.mark.asyncio
+
+
+def make_request(method: str, token: str = "Bearer abc", extra_headers=None) -> Request:
+    headers = [(b"authorization", token.encode())]
+    for name, value in (extra_headers or {}).items():
+        headers.append((name.lower().encode(), value.encode()))
+    return Request({"type": "http", "method": method, "path": "/", "headers": headers})
+
+
+@pytest_asyncio.fixture
+async def router(tmp_path):
+    """Primário e réplica em dois arquivos SQLite distintos; apenas o primário tem o usuário."""
+    factories = []
+    engines = []
+    for name in ("primary", "replica"):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/{name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        engines.append(engine)
+        factories.append(sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+
+    async with factories[0]() as session:
+        session.add(User(email="written@example.com", hashed_password="x"))
+        await session.commit()
+
+    yield DatabaseRouter(factories[0], [factories[1]], pin_seconds=30)
+    for engine in engines:
+        await engine.dispose()
+
+
+async def find_user(factory) -> bool:
+    async with factory() as session:
+        result = await session.execute(select(User).filter(User.email == "written@example.com"))
+        return result.scalars().first() is not None
+
+
+async def test_reads_go_to_replica_and_writes_to_primary(router):
+    assert await find_user(router.session_factory_for(make_request("GET"))) is False
+    assert await find_user(router.session_factory_for(make_request("POST"))) is True
+
+
+async def write(router, request, fail: bool = False) -> Response:
+    """Simula uma requisição de escrita pela UnitOfWork, como em get_db."""
+    response = Response()
+    async with router.session_factory_for(request)() as session:
+        router.pin_after_commit(session, request, response)
+        try:
+            async with UnitOfWork(session):
+                if fail:
+                    raise ValueError("escrita recusada")
+        except ValueError:
+            pass
+    return response
+
+
+async def test_reads_are_pinned_to_primary_after_a_write(router):
+    response = await write(router, make_request("PUT"))
+    assert CONSISTENCY_TOKEN_HEADER in response.headers
+
+    # Mesmo cliente: lê do primário; outro cliente continua na réplica
+    assert await find_user(router.session_factory_for(make_request("GET"))) is True
+    assert await find_user(router.session_factory_for(make_request("GET", token="Bearer other"))) is False
+
+    # Outro worker/cliente que reenvia o token de consistência também lê do primário
+    request = make_request("GET", token="Bearer other", extra_headers={CONSISTENCY_TOKEN_HEADER: response.headers[CONSISTENCY_TOKEN_HEADER]})
+    assert await find_user(router.session_factory_for(request)) is True
+
+
+async def test_failed_write_does_not_pin(router):
+    response = await write(router, make_request("PUT"), fail=True)
+    assert CONSISTENCY_TOKEN_HEADER not in response.headers
+    assert await find_user(router.session_factory_for(make_request("GET"))) is False
+
+
+async def test_forged_consistency_tokens_are_ignored(router):
+    expires = f"{time.time() + 1e6:.3f}"
+    forged = [
+        "1e12",                                  # formato antigo, sem assinatura
+        f"{time.time() + 10:.3f}:{'0' * 64}",    # assinatura inválida
+        f"{expires}:{router._sign(expires)}",    # assinado, mas além da janela de fixação
+    ]
+    for token in forged:
+        request = make_request("GET", token="Bearer other", extra_headers={CONSISTENCY_TOKEN_HEADER: token})
+        assert await find_user(router.session_factory_for(request)) is False
+    # Com outra chave (outra implantação), o token não é aceito
+    other = DatabaseRouter(router.primary, router.replicas, pin_seconds=30, secret="outra")
+    request = make_request("GET", token="Bearer other", extra_headers={CONSISTENCY_TOKEN_HEADER: other.consistency_token()})
+    assert await find_user(router.session_factory_for(request)) is False
+
+
+async def test_pool_timeouts_are_not_counted_as_checkouts():
+    pool = InstrumentedAsyncQueuePool(lambda: sqlite3.connect(":memory:"), pool_size=1, max_overflow=0, timeout=0.01)
+
+    def checkout_twice():
+        connection = pool.connect()
+        with pytest.raises(PoolTimeoutError):
+            pool.connect()
+        connection.close()
+
+    # O pool assíncrono só pode ser usado dentro de um greenlet do SQLAlchemy
+    await greenlet_spawn(checkout_twice)
+    assert (pool.checkouts, pool.timeouts) == (1, 1)
+    assert pool.max_wait_seconds >= 0.01
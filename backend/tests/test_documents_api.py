@@ -61,4 +61,50 @@ async def test_update_and_delete_document(authenticated_client: AsyncClient, cre
     # Verificação da Exclusão
     response = await authenticated_client.get(f"/api/projects/{project_id}/documents/")
     assert response.status_code == 200
-    assert len(response.json()) == 0
\ No newline at end of file
+    assert len(response.json()) == 0
+
+
+async def test_document_listing_filters_sort_and_cursor(authenticated_client: AsyncClient, create_test_project, test_session):
+    """Filtros por status, tipo e nome, ordenação por múltiplas chaves e paginação por cursor via X-Next-Cursor."""
+    from project_management_api.domain.models import Document, DocumentStatus
+
+    project_id = await create_test_project()
+    statuses = list(DocumentStatus)
+    test_session.add_all([
+        Document(
+            name=f"Documento {i}", type="BRD" if i % 2 else "LLD", file_path=f"/tmp/doc-{project_id}-{i}.pdf",
+            version=i % 3 + 1, status=statuses[i % 3], project_id=project_id,
+        )
+        for i in range(8)
+    ])
+    await test_session.commit()
+    url = f"/api/projects/{project_id}/documents/"
+
+    response = await authenticated_client.get(url, params={"status": "approved", "type": "BRD"})
+    assert {d["name"] for d in response.json()} == {"Documento 1", "Documento 7"}
+
+    response = await authenticated_client.get(url, params={"q": "mento 5"})
+    assert [d["name"] for d in response.json()] == ["Documento 5"]
+
+    # Versão decrescente, depois nome crescente
+    expected = sorted(range(8), key=lambda i: (-(i % 3 + 1), f"Documento {i}"))
+    names, cursor = [], None
+    while True:
+        params = {"sort": "-version,name", "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client.get(url, params=params)
+        assert len(response.json()) <= 3
+        names.extend(d["name"] for d in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert names == [f"Documento {i}" for i in expected]
+
+
+async def test_document_listing_rejects_unknown_sort(authenticated_client: AsyncClient, create_test_project):
+    """Ordenação desconhecida retorna 400, com ou sem seleção de campos."""
+    project_id = await create_test_project()
+    url = f"/api/projects/{project_id}/documents/"
+    for params in ({"sort": "bogus"}, {"sort": "bogus", "fields": "name"}, {"sort": "project", "fields": "name"}):
+        assert (await authenticated_client.get(url, params=params)).status_code == 400
@@ -0,0 +1,50 @@
+# backend/tests/test_exports.py
+import csv
+import io
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.domain.models import AuditLog, Task, TaskPriority
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_streaming_exports(authenticated_client: AsyncClient, create_test_project, test_session, test_user, monkeypatch):
+    """Exportações NDJSON/CSV lidas em vários lotes do cursor do servidor, com os filtros da listagem."""
+    monkeypatch.setattr("project_management_api.infrastructure.repositories.streaming.EXPORT_BATCH_SIZE", 2)
+    project_ids = [await create_test_project() for _ in range(5)]
+    test_session.add_all([
+        Task(title=f"Tarefa {i}", project_id=project_ids[0], priority=list(TaskPriority)[i % 4], assigned_to_id=test_user.id)
+        for i in range(7)
+    ])
+    test_session.add_all([AuditLog(user_id=test_user.id, action="EXPORT_TEST", details={"i": i}) for i in range(3)])
+    await test_session.commit()
+
+    response = await authenticated_client.get("/api/projects/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert {p["id"] for p in lines} == set(project_ids)
+    listing = await authenticated_client.get("/api/projects/", params={"size": 100})
+    assert lines == listing.json()["items"]
+
+    response = await authenticated_client.get("/api/projects/export", params={"format": "csv", "status": "completed"})
+    rows = list(csv.reader(io.StringIO(response.text)))
+    assert rows[0][:2] == ["name", "client"] and "project_manager.email" in rows[0]
+    assert len(rows) == 1
+
+    url = f"/api/projects/{project_ids[0]}/tasks/export"
+    response = await authenticated_client.get(url, params={"priority": ["high", "critical"], "sort": "title"})
+    titles = [json.loads(line)["title"] for line in response.text.splitlines()]
+    assert titles == ["Tarefa 2", "Tarefa 3", "Tarefa 6"]
+    response = await authenticated_client.get(url, params={"sort": "unknown"})
+    assert response.status_code == 400
+
+    response = await authenticated_client.get("/api/admin/audit-logs/export", params={"format": "csv"})
+    assert response.headers["content-disposition"] == 'attachment; filename="audit-logs.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    exported = [row for row in rows if row["action"] == "EXPORT_TEST"]
+    assert [json.loads(row["details"])["i"] for row in exported] == [2, 1, 0]
+    assert all(row["user.email"] == test_user.email for row in exported)
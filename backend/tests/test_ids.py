@@ -0,0 +1,43 @@
+# backend/tests/test_ids.py
+import uuid
+
+from project_management_api.domain import ids
+
+NOW_NS = 1_760_000_000_123 * 1_000_000
+
+
+def _fields(value: uuid.UUID):
+    """(timestamp em ms, contador rand_a) de um UUIDv7."""
+    return value.int >> 80, (value.int >> 64) & 0xFFF
+
+
+def test_version_and_variant():
+    value = ids.uuid7()
+    assert value.version == 7
+    assert value.variant == uuid.RFC_4122
+    assert (value.int >> 62) & 0b11 == 0b10
+    assert uuid.UUID(ids.new_id()).version == 7
+
+
+def test_burst_in_same_millisecond_is_strictly_ordered(monkeypatch):
+    monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS)
+    monkeypatch.setattr(ids, "_last_timestamp_ms", 0)
+    burst = [ids.uuid7() for _ in range(1000)]
+    assert burst == sorted(burst) and len(set(burst)) == len(burst)
+    assert {_fields(value)[0] for value in burst} <= {NOW_NS // 1_000_000, NOW_NS // 1_000_000 + 1}
+    # Texto também ordena (chaves primárias são gravadas como string)
+    assert [str(value) for value in burst] == sorted(str(value) for value in burst)
+
+
+def test_counter_rollover_advances_timestamp(monkeypatch):
+    now_ms = NOW_NS // 1_000_000
+    monkeypatch.setattr(ids.time, "time_ns", lambda: NOW_NS)
+    monkeypatch.setattr(ids, "_last_timestamp_ms", now_ms)
+    monkeypatch.setattr(ids, "_last_counter", 0xFFF)
+
+    first = ids.uuid7()
+    assert _fields(first) == (now_ms + 1, 0)
+    # O relógio ainda está no milissegundo anterior: continua no timestamp avançado
+    second = ids.uuid7()
+    assert _fields(second) == (now_ms + 1, 1)
+    assert first < second
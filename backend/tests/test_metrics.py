@@ -0,0 +1,107 @@
+# backend/tests/test_metrics.py
+import multiprocessing
+
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.infrastructure import metrics
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_metrics_endpoint(authenticated_client: AsyncClient, create_test_project):
+    project_id = await create_test_project()
+    await authenticated_client.get(f"/api/projects/{project_id}")
+    await authenticated_client.get("/api/projects/", headers={"Authorization": "Bearer invalid"})
+
+    response = await authenticated_client.get("/api/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/api/projects/{project_id}",status="200",le="+Inf"}' in body
+    assert 'http_response_size_bytes_count{method="GET",route="/api/projects/{project_id}"}' in body
+    assert 'auth_failures_total{reason="invalid_token"}' in body
+    assert "# TYPE db_pool_connections gauge" in body
+
+
+async def test_metrics_token(client: AsyncClient, monkeypatch):
+    from project_management_api.infrastructure.api import main
+
+    monkeypatch.setattr(main, "METRICS_TOKEN", "scrape-secret")
+    assert (await client.get("/api/metrics")).status_code == 401
+    response = await client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+
+
+def _worker(requests, latency, in_flight):
+    for _ in range(3):
+        requests.inc(route="/a")
+        latency.observe(0.3, route="/a")
+    in_flight.set(5)
+
+
+async def test_aggregation_across_workers(tmp_path):
+    registry = metrics.Registry(str(tmp_path))
+    requests = metrics.Counter(registry, "requests", "Requisições.", ("route",))
+    latency = metrics.Histogram(registry, "latency_seconds", "Latência.", ("route",), buckets=(0.1, 0.5))
+    in_flight = metrics.Gauge(registry, "in_flight", "Em andamento.")
+
+    requests.inc(2, route="/a")
+    latency.observe(0.05, route="/a")
+    in_flight.set(1)
+
+    # Um worker (processo filho) grava no seu próprio arquivo e termina
+    child = multiprocessing.get_context("fork").Process(target=_worker, args=(requests, latency, in_flight))
+    child.start()
+    child.join()
+    assert child.exitcode == 0
+    assert len(list(tmp_path.glob("*.db"))) == 6
+
+    text = registry.exposition()
+    assert 'requests_total{route="/a"} 5.0' in text
+    assert 'latency_seconds_bucket{route="/a",le="0.1"} 1.0' in text
+    assert 'latency_seconds_bucket{route="/a",le="0.5"} 4.0' in text
+    assert 'latency_seconds_bucket{route="/a",le="+Inf"} 4.0' in text
+    assert 'latency_seconds_count{route="/a"} 4.0' in text
+    # O gauge do worker encerrado é descartado; contadores e histogramas são mantidos
+    assert "in_flight 1.0" in text
+
+    # A consolidação troca os arquivos de workers encerrados por um arquivo por tipo, sem alterar os totais
+    assert registry.compact() == 3
+    assert sorted(path.name for path in tmp_path.glob("*_archive.db")) == ["counter_archive.db", "histogram_archive.db"]
+    assert registry.exposition() == text
+    child = multiprocessing.get_context("fork").Process(target=_worker, args=(requests, latency, in_flight))
+    child.start()
+    child.join()
+    assert registry.compact() == 3
+    assert len(list(tmp_path.glob("*.db"))) == 5
+    assert 'requests_total{route="/a"} 8.0' in registry.exposition()
+
+
+async def test_pool_counters_are_fed_as_deltas_without_pid(monkeypatch):
+    from project_management_api.infrastructure.api import middleware
+
+    stats = {"checkouts": 5, "timeouts": 1}
+    monkeypatch.setattr(middleware, "replica_engines", [])
+    monkeypatch.setattr(middleware, "get_pool_stats", lambda target: dict(stats))
+
+    def totals():
+        collected = metrics.registry.collect()
+        return tuple(collected.get((name, (("engine", "primary"),)), 0.0) for name in ("db_pool_checkouts_total", "db_pool_timeouts_total"))
+
+    before = totals()
+    middleware.refresh_pool_metrics()
+    stats["checkouts"] = 8
+    middleware.refresh_pool_metrics()
+    middleware.refresh_pool_metrics()
+    assert totals() == (before[0] + 8, before[1] + 1)
+    assert not any(name.startswith("db_pool_checkouts") and dict(labels).get("pid") for name, labels in metrics.registry.collect())
+
+
+async def test_db_pool_stats_require_admin(authenticated_client: AsyncClient):
+    response = await authenticated_client.get("/api/health/db-pool")
+    assert response.status_code == 200
+    assert "pool_class" in response.json()
+    authenticated_client.headers.pop("Authorization")
+    assert (await authenticated_client.get("/api/health/db-pool")).status_code == 401
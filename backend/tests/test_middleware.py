@@ -0,0 +1,77 @@
+# backend/tests/test_middleware.py
+import logging
+
+import pytest
+from httpx import AsyncClient, ASGITransport
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from project_management_api.infrastructure.api import middleware
+
+pytestmark = pytest.mark.asyncio
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record.msg)
+
+
+@pytest.fixture
+def access_records(monkeypatch):
+    handler = RecordingHandler()
+    recording_logger = logging.getLogger("tests.access")
+    recording_logger.handlers = [handler]
+    recording_logger.propagate = False
+    monkeypatch.setattr(middleware, "access_logger", recording_logger)
+    return handler.records
+
+
+async def test_access_log_record(authenticated_client: AsyncClient, create_test_project, test_user, access_records):
+    project_id = await create_test_project()
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"X-Request-ID": "req-123"})
+    assert response.headers["X-Request-ID"] == "req-123"
+
+    record = access_records[-1]
+    assert record["request_id"] == "req-123"
+    assert record["route"] == "/api/projects/{project_id}"
+    assert record["user_id"] == test_user.id
+    assert record["bytes_out"] == len(response.content)
+    assert record["db_queries"] >= 1 and record["db_time_ms"] >= 0
+
+    # Sem cabeçalho do cliente, um id é gerado
+    response = await authenticated_client.get("/api/health")
+    assert access_records[-1]["request_id"] == response.headers["X-Request-ID"]
+    assert access_records[-1]["user_id"] is None
+
+
+async def test_sampling_and_streaming(access_records):
+    app = FastAPI()
+
+    @app.get("/api/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/api/stream")
+    async def stream():
+        return StreamingResponse(iter([b"a" * 10, b"b" * 5]))
+
+    @app.get("/api/fail")
+    async def fail():
+        raise RuntimeError("boom")
+
+    wrapped = middleware.LoggingMiddleware(app, sample_rate=1.0, sample_rates="/api/health=0,/api/fail=0")
+    async with AsyncClient(transport=ASGITransport(app=wrapped, raise_app_exceptions=False), base_url="http://test") as client:
+        await client.get("/api/health")
+        assert access_records == []
+
+        response = await client.get("/api/stream")
+        assert response.content == b"a" * 10 + b"b" * 5
+        assert access_records[-1]["bytes_out"] == 15
+
+        # Erros do servidor ignoram a amostragem
+        await client.get("/api/fail")
+        assert access_records[-1]["status_code"] == 500
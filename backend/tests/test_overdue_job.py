@@ -0,0 +1,85 @@
+# backend/tests/test_overdue_job.py
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from project_management_api.domain.models import Notification, Project, ProjectStatus, Task, TaskStatus, User
+from project_management_api.infrastructure.overdue_job import run_overdue_job
+
+pytestmark = pytest.mark.asyncio
+
+TODAY = date(2025, 6, 10)
+
+
+def _project(name, end, **kwargs):
+    return Project(name=name, client="Cliente", startDate=date(2025, 1, 1), estimatedEndDate=end, **kwargs)
+
+
+async def test_overdue_job_marks_and_notifies(authenticated_client: AsyncClient, test_engine, test_session, test_user):
+    pm = User(email="pm@example.com", hashed_password="x")
+    test_session.add(pm)
+    await test_session.flush()
+    late = [_project(f"Atrasado {i}", TODAY - timedelta(days=i + 1), project_manager_id=pm.id) for i in range(3)]
+    unassigned = _project("Sem GP", TODAY - timedelta(days=1))
+    test_session.add_all([
+        *late, unassigned,
+        _project("Concluído", TODAY - timedelta(days=1), status=ProjectStatus.COMPLETED),
+        _project("No prazo", TODAY),
+    ])
+    await test_session.flush()
+    test_session.add_all([
+        Task(title="Tarefa atrasada", project_id=late[0].id, dueDate=TODAY - timedelta(days=1), assigned_to_id=test_user.id),
+        Task(title="Tarefa concluída", project_id=late[0].id, dueDate=TODAY - timedelta(days=1), status=TaskStatus.DONE, assigned_to_id=test_user.id),
+        Task(title="Sem prazo", project_id=late[0].id, assigned_to_id=test_user.id),
+    ])
+    await test_session.commit()
+
+    inserts = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO notifications"):
+            inserts.append(executemany)
+
+    session_factory = sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        totals = await run_overdue_job(session_factory, today=TODAY, batch_size=2)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+    assert totals == {"projects_marked": 4, "tasks_marked": 1, "projects_cleared": 0, "tasks_cleared": 0}
+    # Um INSERT de múltiplas linhas por lote com destinatários (2 lotes de projetos, 1 de tarefas)
+    assert inserts == [False, False, False]
+
+    notifications = (await test_session.execute(select(Notification).order_by(Notification.link))).scalars().all()
+    assert sorted(n.user_id for n in notifications) == sorted([pm.id] * 3 + [test_user.id])
+    assert all(n.is_read is False and n.created_at is not None for n in notifications)
+
+    # Nova rodada: nada novo para marcar nem notificar
+    assert await run_overdue_job(session_factory, today=TODAY, batch_size=2) == dict.fromkeys(totals, 0)
+    assert len((await test_session.execute(select(Notification))).scalars().all()) == 4
+    # O job grava por outra sessão; a sessão compartilhada pelos requests do teste precisa recarregar
+    test_session.expire_all()
+
+    response = await authenticated_client.get("/api/analytics/overdue-projects?size=3")
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total"] == 4 and page["pages"] == 2
+    assert all(item["is_overdue"] for item in page["items"])
+    response = await authenticated_client.get(f"/api/analytics/overdue-projects?size=3&cursor={page['next_cursor']}")
+    assert len(response.json()["items"]) == 1
+
+    # Prazo estendido pela API: deixa de estar em atraso sem esperar o job
+    response = await authenticated_client.put(f"/api/projects/{unassigned.id}", json={"estimatedEndDate": "2999-01-01"})
+    assert response.json()["is_overdue"] is False
+    assert (await authenticated_client.get("/api/analytics/overdue-projects")).json()["total"] == 3
+
+    # Alterações fora da API são corrigidas pela rodada seguinte
+    project = await test_session.get(Project, late[0].id)
+    project.status = ProjectStatus.CANCELLED
+    await test_session.commit()
+    totals = await run_overdue_job(session_factory, today=TODAY)
+    assert totals["projects_cleared"] == 1
@@ -0,0 +1,85 @@
+# backend/tests/test_phase_analytics.py
+from datetime import date, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from project_management_api.domain.models import AuditLog, Project, ProjectPhase, ProjectPhaseInterval
+from project_management_api.infrastructure.repositories.phase_interval_repository import PhaseIntervalRepository, week_start
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _intervals(db):
+    result = await db.execute(select(ProjectPhaseInterval).order_by(ProjectPhaseInterval.project_id, ProjectPhaseInterval.entered_at))
+    return [(i.project_id, i.phase, i.entered_at, i.exited_at, i.duration_seconds) for i in result.scalars().all()]
+
+
+async def test_phase_advance_feeds_rollup(authenticated_client: AsyncClient, test_session, create_test_project):
+    project_id = await create_test_project()
+    assert (await authenticated_client.get("/api/analytics/phase-cycle-time")).json() == []
+
+    assert (await authenticated_client.post(f"/api/projects/{project_id}/advance-phase")).status_code == 200
+    cycle_time = (await authenticated_client.get("/api/analytics/phase-cycle-time")).json()
+    assert [(item["phase"], item["count"]) for item in cycle_time] == [("inception", 1)]
+    assert set(cycle_time[0]["percentiles_days"]) == {"p50", "p75", "p90", "p95"}
+    throughput = (await authenticated_client.get("/api/analytics/phase-throughput?weeks=1")).json()
+    assert throughput == [{"week": week_start(datetime.utcnow()).isoformat(), "phase": "inception", "count": 1}]
+
+    log = (await test_session.execute(select(AuditLog).where(AuditLog.action == "PROJECT_PHASE_ADVANCED"))).scalars().one()
+    assert (log.details["old_phase"], log.details["new_phase"]) == ("inception", "definition")
+
+    # O backfill a partir dos logs reproduz o rollup mantido pelo avanço de fase
+    recorded = await _intervals(test_session)
+    assert [(phase, exited is None) for _, phase, _, exited, _ in recorded] == [(ProjectPhase.INCEPTION, False), (ProjectPhase.DEFINITION, True)]
+    # Quality gate recusado: nada muda no rollup
+    assert (await authenticated_client.post(f"/api/projects/{project_id}/advance-phase")).status_code == 400
+    assert await _intervals(test_session) == recorded
+
+    await PhaseIntervalRepository(test_session).rebuild()
+    await test_session.commit()
+    assert await _intervals(test_session) == recorded
+
+
+async def test_backfill_from_audit_logs_and_percentiles(test_session):
+    start = datetime(2025, 3, 3, 9, 0)
+    projects = [Project(name=f"P{i}", client="C", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 12, 31),
+                        createdAt=start, phase=ProjectPhase.DEFINITION) for i in range(4)]
+    test_session.add_all(projects)
+    await test_session.flush()
+    # Logs antigos gravavam old_phase igual a new_phase; a fase de saída vem da ordem do workflow
+    for days, project in zip((1, 2, 3, 10), projects):
+        test_session.add(AuditLog(action="PROJECT_PHASE_ADVANCED", timestamp=start + timedelta(days=days), details={
+            "project_id": project.id, "old_phase": "definition", "new_phase": "definition",
+        }))
+    test_session.add(AuditLog(action="PROJECT_PHASE_ADVANCED", timestamp=start + timedelta(days=12), details={
+        "project_id": projects[0].id, "old_phase": "built", "new_phase": "built",
+    }))
+    # Projeto excluído: o período concluído continua contando
+    test_session.add(AuditLog(action="PROJECT_PHASE_ADVANCED", timestamp=start + timedelta(days=4), details={
+        "project_id": "removido", "old_phase": "definition", "new_phase": "definition",
+    }))
+    await test_session.commit()
+
+    repo = PhaseIntervalRepository(test_session)
+    assert await repo.rebuild() == 10
+    await test_session.commit()
+
+    stats = {item["phase"]: item for item in await repo.cycle_times()}
+    assert stats[ProjectPhase.INCEPTION]["count"] == 4  # o período do projeto excluído não tem início conhecido
+    assert stats[ProjectPhase.INCEPTION]["average"] == 4 * 86400
+    assert stats[ProjectPhase.INCEPTION]["percentiles"][0.5] == 2.5 * 86400
+    assert stats[ProjectPhase.INCEPTION]["percentiles"][0.9] == pytest.approx(7.9 * 86400)
+    assert stats[ProjectPhase.DEFINITION]["count"] == 1
+    assert stats[ProjectPhase.DEFINITION]["average"] == 11 * 86400
+    assert await repo.cycle_times(since=date(2025, 3, 12)) == [
+        {"phase": ProjectPhase.INCEPTION, "count": 1, "average": 10 * 86400, "percentiles": {p: 10 * 86400 for p in (0.5, 0.75, 0.9, 0.95)}},
+        {"phase": ProjectPhase.DEFINITION, "count": 1, "average": 11 * 86400, "percentiles": {p: 11 * 86400 for p in (0.5, 0.75, 0.9, 0.95)}},
+    ]
+
+    assert await repo.weekly_throughput(date(2025, 3, 1)) == [
+        (date(2025, 3, 3), ProjectPhase.INCEPTION, 4),
+        (date(2025, 3, 10), ProjectPhase.INCEPTION, 1),
+        (date(2025, 3, 10), ProjectPhase.DEFINITION, 1),
+    ]
@@ -0,0 +1,68 @@
+# backend/tests/test_profiling.py
+import pytest
+from httpx import AsyncClient, ASGITransport
+from fastapi import Depends, FastAPI
+
+from project_management_api.infrastructure.api import profiling, security
+from project_management_api.infrastructure.api.profiling import ProfileStore, ProfilingMiddleware
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    store = ProfileStore(str(tmp_path))
+    monkeypatch.setattr(profiling, "profile_store", store)
+    monkeypatch.setattr("project_management_api.infrastructure.api.routes.profiling.profile_store", store)
+    return store
+
+
+async def test_profile_request_on_demand(authenticated_client: AsyncClient, create_test_project, store):
+    project_id = await create_test_project()
+
+    # Sem token (ou com um token de acesso comum) nada é perfilado
+    response = await authenticated_client.get(f"/api/projects/{project_id}")
+    assert "X-Profile-Id" not in response.headers
+    access_token = authenticated_client.headers["Authorization"].split()[1]
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"X-Profile-Token": access_token})
+    assert "X-Profile-Id" not in response.headers
+
+    token = (await authenticated_client.post("/api/admin/profiling/token")).json()["token"]
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"X-Profile-Token": token})
+    assert response.status_code == 200
+    profile_id = response.headers["X-Profile-Id"]
+
+    summary = (await authenticated_client.get(f"/api/admin/profiling/{profile_id}")).json()
+    assert summary["route"] == "/api/projects/{project_id}"
+    assert summary["status_code"] == 200
+    assert summary["db_queries"] >= 1
+    assert set(summary["cpu_by_phase_ms"]) == set(profiling.PHASES)
+    assert summary["wall_ms"] >= summary["sampled_cpu_ms"]
+
+    response = await authenticated_client.get(f"/api/admin/profiling/{profile_id}/collapsed")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert [item["id"] for item in (await authenticated_client.get("/api/admin/profiling/")).json()] == [profile_id]
+
+
+async def test_phase_breakdown(test_user, store):
+    hashed = security.get_password_hash("secret")
+
+    async def check_password():
+        return security.verify_password("secret", hashed)
+
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow(valid: bool = Depends(check_password)):
+        return {"valid": valid}
+
+    token, _ = profiling.create_profile_token(test_user)
+    wrapped = ProfilingMiddleware(app, store=store, interval_ms=1)
+    async with AsyncClient(transport=ASGITransport(app=wrapped), base_url="http://test") as client:
+        response = await client.get(f"/slow?__profile={token}")
+    summary = store.summary(response.headers["X-Profile-Id"])
+    # O bcrypt roda dentro de security.py: o tempo é atribuído à autenticação
+    assert summary["samples"] > 0
+    assert summary["cpu_by_phase_ms"]["auth"] > 0.5 * summary["sampled_cpu_ms"]
+    assert "verify_password" in store.collapsed(summary["id"])
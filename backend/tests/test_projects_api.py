@@ -49,4 +49,190 @@ async def test_get_project_by_id(authenticated_client: AsyncClient):
     assert response.status_code == 200
     retrieved_project = response.json()
     assert retrieved_project["id"] == project_id
-    assert retrieved_project["name"] == project_data["name"]
\ No newline at end of file
+    assert retrieved_project["name"] == project_data["name"]
+async def test_update_project_commits_once(authenticated_client: AsyncClient, create_test_project, test_session, test_user):
+    """Atualização, auditoria e notificações devem ser gravadas em um único commit."""
+    from sqlalchemy import event
+
+    project_id = await create_test_project()
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(test_session.sync_session, "after_commit", listener)
+    try:
+        response = await authenticated_client.put(
+            f"/api/projects/{project_id}",
+            json={"name": "Projeto Renomeado", "project_manager_id": str(test_user.id)}
+        )
+    finally:
+        event.remove(test_session.sync_session, "after_commit", listener)
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Projeto Renomeado"
+    assert len(commits) == 1
+
+async def test_unit_of_work_rolls_back_on_error(test_session):
+    """Uma exceção dentro da UnitOfWork deve desfazer todas as escritas pendentes."""
+    from datetime import date
+    from sqlalchemy import func, select
+    from project_management_api.domain.models import Project
+    from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
+
+    with pytest.raises(RuntimeError):
+        async with UnitOfWork(test_session):
+            test_session.add(Project(name="Descartado", client="X", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 2, 1)))
+            await test_session.flush()
+            raise RuntimeError("falha no meio da requisição")
+
+    total = await test_session.execute(select(func.count()).select_from(Project))
+    assert total.scalar_one() == 0
+
+async def test_server_timing_reports_db_queries(authenticated_client: AsyncClient, create_test_project):
+    """Cada resposta deve trazer a contagem e o tempo de SQL no cabeçalho Server-Timing."""
+    project_id = await create_test_project()
+    response = await authenticated_client.get(f"/api/projects/{project_id}")
+    assert response.status_code == 200
+    server_timing = response.headers["Server-Timing"]
+    assert server_timing.startswith("db;dur=")
+    # Busca do usuário autenticado + projeto (+ relacionamentos, se houver)
+    queries = int(server_timing.split('desc="')[1].split(" ")[0])
+    assert queries >= 1
+
+
+async def test_cursor_pagination_walks_all_projects(authenticated_client: AsyncClient, test_session):
+    """A paginação por cursor percorre todos os projetos, inclusive com createdAt empatado, e volta com prev_cursor."""
+    from datetime import date, datetime
+    from project_management_api.domain.models import Project
+
+    same_instant = datetime(2025, 1, 1, 12, 0, 0)
+    test_session.add_all([
+        Project(name=f"Projeto {i}", client="Cliente", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 12, 31), createdAt=same_instant)
+        for i in range(7)
+    ])
+    await test_session.commit()
+
+    first = (await authenticated_client.get("/api/projects/", params={"size": 3})).json()
+    assert first["prev_cursor"] is None
+    seen = [p["id"] for p in first["items"]]
+    pages = [first]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = (await authenticated_client.get("/api/projects/", params={"size": 3, "cursor": cursor})).json()
+        assert page["total"] == 7
+        seen.extend(p["id"] for p in page["items"])
+        pages.append(page)
+        cursor = page["next_cursor"]
+    assert len(seen) == len(set(seen)) == 7
+
+    back = (await authenticated_client.get("/api/projects/", params={"size": 3, "cursor": pages[2]["prev_cursor"]})).json()
+    assert [p["id"] for p in back["items"]] == [p["id"] for p in pages[1]["items"]]
+
+    response = await authenticated_client.get("/api/projects/", params={"cursor": "não-é-um-cursor"})
+    assert response.status_code == 400
+
+
+async def test_include_total_modes_and_invalidation(authenticated_client: AsyncClient, create_test_project):
+    """include_total=false omite o total; o total exato em cache é invalidado quando um projeto é criado."""
+    await create_test_project()
+
+    response = await authenticated_client.get("/api/projects/", params={"include_total": "false"})
+    body = response.json()
+    assert body["total"] is None and body["pages"] is None
+    assert len(body["items"]) == 1
+
+    assert (await authenticated_client.get("/api/projects/")).json()["total"] == 1
+    await create_test_project()
+    assert (await authenticated_client.get("/api/projects/")).json()["total"] == 2
+    assert (await authenticated_client.get("/api/projects/", params={"include_total": "estimate"})).json()["total"] == 2
+
+
+async def test_total_cached_between_flush_and_commit_is_discarded(test_session):
+    """Um total lido por outra requisição entre o flush e o commit não sobrevive ao commit."""
+    from datetime import date
+    from project_management_api.domain.models import Project
+    from project_management_api.infrastructure.db.unit_of_work import UnitOfWork
+    from project_management_api.infrastructure.repositories.totals import TotalMode, count_cache
+
+    async with UnitOfWork(test_session):
+        test_session.add(Project(name="P", client="C", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 6, 1)))
+        await test_session.flush()
+        # Leitura concorrente: ainda conta as linhas antigas, já na geração nova
+        count_cache.set("projects", TotalMode.EXACT, None, 0)
+        assert count_cache.get("projects", TotalMode.EXACT, None) == 0
+    assert count_cache.get("projects", TotalMode.EXACT, None) is None
+
+
+async def test_sparse_fieldsets(authenticated_client: AsyncClient, create_test_project, test_user, test_session):
+    """fields= restringe as colunas retornadas; include= traz apenas os relacionamentos pedidos."""
+    from sqlalchemy import event
+
+    project_id = await create_test_project()
+    await authenticated_client.put(f"/api/projects/{project_id}", json={"project_manager_id": test_user.id})
+
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(test_session.bind.sync_engine, "before_cursor_execute", listener)
+    try:
+        response = await authenticated_client.get("/api/projects/", params={"fields": "id,name", "include_total": "false"})
+    finally:
+        event.remove(test_session.bind.sync_engine, "before_cursor_execute", listener)
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": project_id, "name": "Projeto para Teste"}]
+    # Nem as colunas não pedidas nem os usuários relacionados são carregados
+    assert not any("FROM users" in s for s in statements)
+    assert not any("projects.client" in s for s in statements)
+
+    response = await authenticated_client.get("/api/projects/", params={"fields": "name", "include": "project_manager"})
+    item = response.json()["items"][0]
+    assert item == {"id": project_id, "name": "Projeto para Teste", "project_manager": {"id": test_user.id, "email": test_user.email}}
+
+    response = await authenticated_client.get("/api/projects/", params={"fields": "name,senha"})
+    assert response.status_code == 400
+
+    # Sem fields/include a resposta continua completa
+    item = (await authenticated_client.get("/api/projects/")).json()["items"][0]
+    assert item["client"] == "Cliente de Teste" and item["project_manager"]["id"] == test_user.id
+
+
+async def test_conditional_gets(authenticated_client: AsyncClient, create_test_project, test_session):
+    """ETag/Last-Modified em recursos e listagens, com 304 enquanto nada muda."""
+    from project_management_api.domain.models import Task
+
+    project_id = await create_test_project()
+    response = await authenticated_client.get(f"/api/projects/{project_id}")
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+    assert not etag.startswith("W/")
+
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304 and response.content == b""
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    listing = await authenticated_client.get("/api/projects/")
+    list_etag = listing.headers["ETag"]
+    response = await authenticated_client.get("/api/projects/", headers={"If-None-Match": list_etag})
+    assert response.status_code == 304
+    # Outra página/filtro é outra representação
+    response = await authenticated_client.get("/api/projects/?size=5", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+
+    await authenticated_client.put(f"/api/projects/{project_id}", json={"name": "Renomeado"})
+    response = await authenticated_client.get(f"/api/projects/{project_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200 and response.headers["ETag"] != etag
+    response = await authenticated_client.get("/api/projects/", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+
+    task = Task(title="Tarefa", project_id=project_id)
+    test_session.add(task)
+    await test_session.commit()
+    url = f"/api/projects/{project_id}/tasks/{task.id}"
+    response = await authenticated_client.get(url)
+    assert response.status_code == 200
+    task_etag = response.headers["ETag"]
+    assert (await authenticated_client.get(url, headers={"If-None-Match": task_etag})).status_code == 304
+
+    tasks_etag = (await authenticated_client.get(f"/api/projects/{project_id}/tasks/")).headers["ETag"]
+    task.status = task.status.__class__.DONE
+    await test_session.commit()
+    assert (await authenticated_client.get(url, headers={"If-None-Match": task_etag})).status_code == 200
+    response = await authenticated_client.get(f"/api/projects/{project_id}/tasks/", headers={"If-None-Match": tasks_etag})
+    assert response.status_code == 200
@@ -0,0 +1,184 @@
+# backend/tests/test_query_plans.py
+"""
+Testes de regressão de plano de execução.
+
+Executa cada consulta dos repositórios contra um banco populado, captura o SQL
+emitido e roda EXPLAIN QUERY PLAN em cada SELECT. O teste falha se alguma
+consulta voltar a fazer varredura sequencial (SCAN sem índice) em uma tabela.
+"""
+import re
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, text
+
+from project_management_api.domain.models import (
+    User, Project, Task, Document, Notification, AuditLog, ProjectPhaseInterval, ProjectStatus, ProjectPhase, TaskStatus
+)
+from project_management_api.infrastructure.repositories.project_repository import ProjectRepository, PROJECT_KEYSET
+from project_management_api.infrastructure.repositories.analytics_counter_repository import AnalyticsCounterRepository, AnalyticsDimension
+from project_management_api.infrastructure.repositories.phase_interval_repository import PhaseIntervalRepository, week_start
+from project_management_api.infrastructure.repositories.task_repository import TaskRepository
+from project_management_api.infrastructure.repositories.document_repository import DocumentRepository
+from project_management_api.infrastructure.repositories.notification_repository import NotificationRepository
+from project_management_api.infrastructure.repositories.audit_log_repository import AuditLogRepository, AUDIT_LOG_KEYSET
+from project_management_api.infrastructure.repositories.user_repository import UserRepository
+from project_management_api.infrastructure.repositories.totals import TotalMode, count_cache
+
+pytestmark = pytest.mark.asyncio
+
+# Agregações e totais exatos que, por definição, percorrem a tabela inteira
+FULL_SCAN_ALLOWED = {
+    "projects.get_all_with_total", "audit_logs.get_all_with_total",
+}
+
+SEQUENTIAL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+
+@pytest_asyncio.fixture
+async def seeded(test_session):
+    """Popula o banco com volume suficiente para o planejador preferir os índices."""
+    users = [User(email=f"user{i}@example.com", hashed_password="x") for i in range(200)]
+    test_session.add_all(users)
+    await test_session.flush()
+
+    today = date.today()
+    projects = []
+    for i in range(300):
+        project = Project(
+            name=f"Projeto {i}",
+            client=f"Cliente {i % 15}",
+            phase=list(ProjectPhase)[i % 5],
+            status=ProjectStatus.COMPLETED if i % 10 else ProjectStatus.ACTIVE,
+            startDate=today - timedelta(days=400),
+            estimatedEndDate=today + timedelta(days=i - 5),
+            createdAt=datetime.utcnow() - timedelta(minutes=i),
+            project_manager_id=users[i % 20].id,
+            technical_lead_id=users[(i + 1) % 20].id,
+            is_overdue=i % 10 == 0 and i >= 5,
+        )
+        projects.append(project)
+    test_session.add_all(projects)
+    await test_session.flush()
+
+    audit_logs = []
+    for i, project in enumerate(projects):
+        test_session.add_all([
+            Task(title=f"Tarefa {i}-{j}", project_id=project.id, assigned_to_id=users[j].id, status=TaskStatus.TODO)
+            for j in range(5)
+        ])
+        test_session.add(Document(name=f"doc{i}.pdf", file_path=f"/tmp/doc{i}", project_id=project.id))
+        test_session.add(Notification(user_id=users[i % 20].id, message="m", is_read=bool(i % 3)))
+        audit_logs.append(AuditLog(user_id=users[i % 20].id, action="PROJECT_CREATED", details={"i": i}))
+        exited_at = datetime.utcnow() - timedelta(days=i)
+        test_session.add_all([
+            ProjectPhaseInterval(project_id=project.id, phase=ProjectPhase.INCEPTION, entered_at=exited_at - timedelta(days=i % 30),
+                                 exited_at=exited_at, duration_seconds=(i % 30) * 86400.0, exited_week=week_start(exited_at)),
+            ProjectPhaseInterval(project_id=project.id, phase=ProjectPhase.DEFINITION, entered_at=exited_at),
+        ])
+    test_session.add_all(audit_logs)
+    await test_session.commit()
+    await test_session.execute(text("ANALYZE"))
+    return {"users": users, "projects": projects, "audit_cursor": AUDIT_LOG_KEYSET.cursor_for(audit_logs[150])}
+
+
+def repository_calls(db, seeded):
+    project_id = seeded["projects"][0].id
+    user = seeded["users"][0]
+    projects = ProjectRepository(db)
+    return {
+        "projects.get_all": lambda: projects.get_all(skip=0, limit=20, total_mode=TotalMode.NONE),
+        "projects.get_all_by_status": lambda: projects.get_all(skip=20, limit=20, status=ProjectStatus.ACTIVE),
+        "projects.get_all_with_total": lambda: projects.get_all(skip=0, limit=20),
+        "projects.get_page_by_cursor": lambda: projects.get_page_by_cursor(
+            cursor=PROJECT_KEYSET.cursor_for(seeded["projects"][150]), limit=20, total_mode=TotalMode.NONE
+        ),
+        "projects.get_page_by_cursor_by_status": lambda: projects.get_page_by_cursor(
+            cursor=PROJECT_KEYSET.cursor_for(seeded["projects"][150]), limit=20, status=ProjectStatus.COMPLETED
+        ),
+        "projects.get_by_id": lambda: projects.get_by_id(project_id),
+        "projects.get_version": lambda: projects.get_version(project_id),
+        "projects.listing_version_by_status": lambda: projects.listing_version(status=ProjectStatus.ACTIVE),
+        "analytics_counters.counts": lambda: AnalyticsCounterRepository(db).counts(list(AnalyticsDimension)),
+        "projects.get_all_overdue": lambda: projects.get_all(skip=0, limit=20, overdue=True),
+        "projects.get_page_by_cursor_overdue": lambda: projects.get_page_by_cursor(
+            cursor=PROJECT_KEYSET.cursor_for(seeded["projects"][150]), limit=20, total_mode=TotalMode.NONE, overdue=True
+        ),
+        "phase_intervals.cycle_times": lambda: PhaseIntervalRepository(db).cycle_times(since=date.today() - timedelta(days=90)),
+        "phase_intervals.weekly_throughput": lambda: PhaseIntervalRepository(db).weekly_throughput(date.today() - timedelta(weeks=12)),
+        "tasks.search_by_project": lambda: TaskRepository(db).search_by_project(project_id, limit=2),
+        "tasks.search_by_status": lambda: TaskRepository(db).search_by_project(project_id, status=[TaskStatus.TODO], sort="-priority"),
+        "tasks.search_by_due_date": lambda: TaskRepository(db).search_by_project(project_id, due_from=date.today(), sort="dueDate"),
+        "tasks.search_version": lambda: TaskRepository(db).search_version(project_id, status=[TaskStatus.TODO]),
+        "tasks.get_version": lambda: TaskRepository(db).get_version(project_id, project_id),
+        "documents.search_by_project": lambda: DocumentRepository(db).search_by_project(project_id),
+        "documents.search_version": lambda: DocumentRepository(db).search_version(project_id),
+        "documents.get_by_project": lambda: DocumentRepository(db).get_by_project(project_id),
+        "notifications.get_unread_for_user": lambda: NotificationRepository(db).get_unread_for_user(user.id),
+        "audit_logs.get_all": lambda: AuditLogRepository(db).get_all(skip=0, limit=20, total_mode=TotalMode.NONE),
+        "audit_logs.get_all_with_total": lambda: AuditLogRepository(db).get_all(skip=0, limit=20),
+        "audit_logs.get_page_by_cursor": lambda: AuditLogRepository(db).get_page_by_cursor(
+            cursor=seeded["audit_cursor"], limit=20, total_mode=TotalMode.NONE
+        ),
+        "users.get_by_email": lambda: UserRepository(db).get_by_email(user.email),
+        "users.get_by_id": lambda: UserRepository(db).get_by_id(user.id),
+    }
+
+
+async def test_repository_queries_use_indexes(test_engine, test_session, seeded):
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    failures = []
+    for name, call in repository_calls(test_session, seeded).items():
+        # Cada chamada deve emitir suas próprias consultas, inclusive as de total
+        count_cache.clear()
+        captured.clear()
+        event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+        try:
+            await call()
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+        assert captured, f"{name} não emitiu nenhuma consulta"
+
+        statements = list(captured)
+        async with test_engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+                for row in plan.all():
+                    detail = row[-1]
+                    match = SEQUENTIAL_SCAN.match(detail)
+                    if match and name not in FULL_SCAN_ALLOWED:
+                        failures.append(f"{name}: {detail}\n    {statement}")
+
+    assert not failures, "Consultas com varredura sequencial:\n" + "\n".join(failures)
+
+
+async def test_collection_versions_are_cached(test_engine, test_session, seeded):
+    """A versão da coleção (ETag das listagens) só é recalculada após uma escrita na tabela."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append(statement)
+
+    projects = ProjectRepository(test_session)
+    count_cache.clear()
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        version = await projects.listing_version()
+        assert len(captured) == 1
+        assert await projects.listing_version() == version
+        assert await projects.listing_version(status=ProjectStatus.ACTIVE) != version
+        assert len(captured) == 2
+
+        test_session.add(Project(name="Novo", client="C", startDate=date(2025, 1, 1), estimatedEndDate=date(2025, 6, 1)))
+        await test_session.flush()
+        assert (await projects.listing_version())[1] == version[1] + 1
+        assert len(captured) == 3
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
@@ -0,0 +1,74 @@
+# backend/tests/test_security.py
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.domain.models import UserRole
+from project_management_api.infrastructure.api.principal_cache import principal_cache
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_principal_cache_avoids_repeated_user_lookups(authenticated_client: AsyncClient):
+    """Requisições repetidas com o mesmo token devem reutilizar o principal em cache."""
+    before = principal_cache.stats()
+
+    response = await authenticated_client.get("/api/users/me")
+    assert response.status_code == 200
+    response = await authenticated_client.get("/api/users/me")
+    assert response.status_code == 200
+
+    after = principal_cache.stats()
+    assert after["misses"] - before["misses"] == 1
+    assert after["hits"] - before["hits"] == 1
+
+
+async def test_principal_cache_invalidated_on_role_change(authenticated_client: AsyncClient, test_user, test_session):
+    """Alterar o papel do usuário deve descartar o principal em cache."""
+    response = await authenticated_client.get("/api/users/me")
+    assert response.json()["role"] == "admin"
+
+    test_user.role = UserRole.MEMBER
+    await test_session.commit()
+    misses = principal_cache.stats()["misses"]
+
+    response = await authenticated_client.get("/api/users/me")
+    assert response.json()["role"] == "member"
+    assert principal_cache.stats()["misses"] == misses + 1
+
+
+async def test_login_hashes_off_the_event_loop(client: AsyncClient, test_user):
+    """O login deve verificar a senha no executor dedicado de hashing."""
+    from project_management_api.infrastructure.api import security
+
+    completed = security.password_hash_stats()["completed"]
+    response = await client.post("/api/auth/token", data={"username": test_user.email, "password": "testpassword"})
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert security.password_hash_stats()["completed"] == completed + 1
+
+    response = await client.post("/api/auth/token", data={"username": test_user.email, "password": "wrong"})
+    assert response.status_code == 401
+
+
+async def test_role_claims_token_authorizes_without_db_and_honours_revocation(client: AsyncClient, test_user, test_session, monkeypatch):
+    """Com JWT_ROLE_CLAIMS, o papel vem do token e a troca de papel revoga tokens antigos."""
+    from project_management_api.infrastructure.api import security
+    from project_management_api.infrastructure.api.revocation import revocation_filter
+
+    monkeypatch.setattr(security, "JWT_ROLE_CLAIMS", True)
+    response = await client.post("/api/auth/token", data={"username": test_user.email, "password": "testpassword"})
+    token = response.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get("/api/users/me", headers=headers)
+    assert response.status_code == 200
+    assert response.json()["role"] == "admin"
+
+    # Altera o papel depois da emissão do token: o filtro deve forçar a checagem no banco
+    test_user.role = UserRole.MEMBER
+    await test_session.commit()
+    hits = revocation_filter.stats()["filter_hits"]
+
+    response = await client.get("/api/users/me", headers=headers)
+    assert response.status_code == 401
+    assert revocation_filter.stats()["filter_hits"] == hits + 1
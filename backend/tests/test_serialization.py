@@ -0,0 +1,41 @@
+# backend/tests/test_serialization.py
+"""O caminho rápido de serialização deve produzir exatamente o mesmo JSON que o caminho padrão do FastAPI."""
+import pytest
+from httpx import AsyncClient
+
+from project_management_api.infrastructure.api import serialization
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_fast_paths_match_default_serialization(authenticated_client: AsyncClient, create_test_project, test_session, test_user, monkeypatch):
+    from datetime import date
+    from project_management_api.domain.models import Document, DocumentStatus, Task, TaskPriority
+
+    project_id = await create_test_project()
+    await authenticated_client.put(f"/api/projects/{project_id}", json={"project_manager_id": test_user.id})
+    test_session.add_all([
+        Task(title="Com prazo", project_id=project_id, dueDate=date(2025, 3, 1), priority=TaskPriority.HIGH, assigned_to_id=test_user.id),
+        Task(title="Sem prazo", project_id=project_id),
+        # Campos opcionais preenchidos e vazios no caminho rápido de DocumentRead
+        Document(name="Proposta", type="Proposta Técnica", file_path=f"/tmp/{project_id}-proposta.pdf", file_type="application/pdf",
+                 version=2, status=DocumentStatus.APPROVED, project_id=project_id),
+        Document(name="Anexo", file_path=f"/tmp/{project_id}-anexo.bin", project_id=project_id),
+    ])
+    await test_session.commit()
+
+    urls = ["/api/projects/", f"/api/projects/{project_id}/tasks/", f"/api/projects/{project_id}/documents/", "/api/admin/audit-logs/"]
+    bodies = {}
+    for mode in ("default", "validated", "fast"):
+        monkeypatch.setattr(serialization, "RESPONSE_SERIALIZATION", mode)
+        for url in urls:
+            response = await authenticated_client.get(url)
+            assert response.status_code == 200, (mode, url)
+            assert response.headers["content-type"] == "application/json"
+            bodies[(mode, url)] = response.json()
+
+    for url in urls:
+        assert bodies[("fast", url)] == bodies[("default", url)], url
+        assert bodies[("validated", url)] == bodies[("default", url)], url
+    assert bodies[("fast", "/api/projects/")]["items"][0]["project_manager"]["id"] == test_user.id
+    assert {document["name"] for document in bodies[("fast", f"/api/projects/{project_id}/documents/")]} == {"Proposta", "Anexo"}
@@ -48,4 +48,52 @@ async def test_update_and_delete_task(authenticated_client: AsyncClient, create_
     # Verificação da Exclusão
     response = await authenticated_client.get(f"/api/projects/{project_id}/tasks/")
     assert response.status_code == 200
-    assert len(response.json()) == 0
\ No newline at end of file
+    assert len(response.json()) == 0
+
+async def test_task_listing_filters_sort_and_cursor(authenticated_client: AsyncClient, create_test_project, test_session, test_user):
+    """Filtros, ordenação por múltiplas chaves e paginação por cursor via cabeçalho X-Next-Cursor."""
+    from datetime import date
+    from project_management_api.domain.models import Task, TaskStatus, TaskPriority
+
+    project_id = await create_test_project()
+    priorities = list(TaskPriority)
+    test_session.add_all([
+        Task(
+            title=f"Tarefa {i}", project_id=project_id, priority=priorities[i % 4],
+            status=TaskStatus.DONE if i % 3 == 0 else TaskStatus.TODO,
+            dueDate=date(2025, 1, 1 + i) if i % 2 else None,
+            assigned_to_id=test_user.id if i < 5 else None,
+        )
+        for i in range(10)
+    ])
+    await test_session.commit()
+    url = f"/api/projects/{project_id}/tasks/"
+
+    response = await authenticated_client.get(url, params={"status": "todo", "assigned_to_id": test_user.id})
+    assert {t["title"] for t in response.json()} == {"Tarefa 1", "Tarefa 2", "Tarefa 4"}
+
+    response = await authenticated_client.get(url, params={"due_from": "2025-01-04", "due_to": "2025-01-08", "q": "tarefa"})
+    assert {t["title"] for t in response.json()} == {"Tarefa 3", "Tarefa 5", "Tarefa 7"}
+
+    # Prioridade em ordem semântica (decrescente), depois prazo (sem prazo por último)
+    expected = sorted(
+        range(10),
+        key=lambda i: (-priorities.index(priorities[i % 4]), date(2025, 1, 1 + i) if i % 2 else date.max),
+    )
+    titles, cursor = [], None
+    while True:
+        params = {"sort": "-priority,dueDate", "limit": 3, "fields": "title"}
+        if cursor:
+            params["cursor"] = cursor
+        response = await authenticated_client.get(url, params=params)
+        assert all(set(t) == {"id", "title"} for t in response.json())
+        titles.extend(t["title"] for t in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    assert titles == [f"Tarefa {i}" for i in expected]
+
+    assert (await authenticated_client.get(url, params={"sort": "senha"})).status_code == 400
+    # Com `fields`, a ordenação é validada antes do load_only (campo inexistente ou relacionamento)
+    for sort in ("bogus", "project"):
+        assert (await authenticated_client.get(url, params={"sort": sort, "fields": "title"})).status_code == 400
@@ -0,0 +1,61 @@
+# backend/tests/test_tracing.py
+import pytest
+from httpx import AsyncClient
+from starlette.routing import Route
+
+from project_management_api.infrastructure import tracing
+from project_management_api.infrastructure.tracing import TraceSampler
+
+pytestmark = pytest.mark.asyncio
+
+
+def _context(path, parent_sampled=None):
+    return {"asgi_scope": {"type": "http", "path": path}, "parent_sampled": parent_sampled}
+
+
+async def test_route_rates_and_slow_boost(tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing, "_RELOAD_INTERVAL_SECONDS", 0)
+    config_file = str(tmp_path / "sampling.json")
+    sampler = TraceSampler(base_rate=0.2, route_rates="/api/health=0,/api/projects=0.5", slow_ms=500,
+                           config_file=config_file)
+
+    assert sampler(_context("/api/health")) == 0.0
+    assert sampler(_context("/api/projects/abc/tasks")) == 0.5
+    assert sampler(_context("/api/users/")) == 0.2
+    # Decisão do trace de origem prevalece
+    assert sampler(_context("/api/health", parent_sampled=True)) == 1.0
+
+    # Requisição lenta: a rota passa a ser rastreada integralmente
+    route = Route("/api/projects/{project_id}", endpoint=lambda request: None)
+    sampler.record({"route": route, "path": "/api/projects/abc", "method": "GET"}, 200, 120)
+    assert sampler(_context("/api/projects/abc")) == 0.5
+    sampler.record({"route": route, "path": "/api/projects/abc", "method": "GET"}, 200, 800)
+    assert sampler(_context("/api/projects/xyz")) == 1.0
+    assert sampler(_context("/api/projects/xyz/tasks")) == 0.5
+    assert sampler.settings()["boosted_routes"] == ["/api/projects/{project_id}"]
+
+    # Ajuste em tempo de execução é visto pelos demais workers via arquivo compartilhado
+    other_worker = TraceSampler(base_rate=0.2, route_rates="", config_file=config_file)
+    sampler.configure(base_rate=0.01, route_rates="/api/users=1")
+    assert other_worker(_context("/api/users/")) == 1.0
+    assert other_worker(_context("/api/documents")) == 0.01
+
+
+async def test_admin_sampling_endpoint(authenticated_client: AsyncClient, tmp_path, monkeypatch):
+    monkeypatch.setattr(tracing.trace_sampler, "config_file", str(tmp_path / "sampling.json"))
+    monkeypatch.setattr(tracing.trace_sampler, "base_rate", tracing.trace_sampler.base_rate)
+    monkeypatch.setattr(tracing.trace_sampler, "route_rates_spec", tracing.trace_sampler.route_rates_spec)
+    monkeypatch.setattr(tracing.trace_sampler, "route_rates", tracing.trace_sampler.route_rates)
+
+    response = await authenticated_client.put("/api/admin/tracing/sampling", json={"base_rate": 0.25})
+    assert response.status_code == 200
+    assert response.json()["base_rate"] == 0.25
+    assert response.json()["route_rates"] == tracing.TRACES_SAMPLE_RATES
+
+    response = await authenticated_client.put("/api/admin/tracing/sampling", json={"route_rates": "/api/x=abc"})
+    assert response.status_code == 400
+    response = await authenticated_client.put("/api/admin/tracing/sampling", json={"base_rate": 2})
+    assert response.status_code == 422
+
+    response = await authenticated_client.get("/api/admin/tracing/sampling")
+    assert response.json()["base_rate"] == 0.25